@@ -10,22 +10,33 @@ setup(
     description="AI-powered resume optimization for ATS compatibility",
     author="Your Name",
     packages=find_packages(),
+    package_data={"src.nlp": ["data/*.yaml"]},
     install_requires=[
-        "langgraph>=0.2.0",
-        "anthropic>=0.18.0",
+        "langgraph>=0.2.24",
+        "anthropic>=0.41.0",
         "typer>=0.9.0",
         "rich>=13.0.0",
         "pylatexenc>=2.10",
         "python-dotenv>=1.0.0",
         "pydantic>=2.0.0",
         "pyyaml>=6.0",
+        "orjson>=3.9.0",
     ],
     extras_require={
         "dev": [
             "pytest>=7.4.0",
             "black>=23.0.0",
             "ruff>=0.1.0",
-        ]
+        ],
+        "embeddings": [
+            "sentence-transformers>=2.2.0",
+        ],
+        "http2": [
+            "h2>=4.1.0",
+        ],
+        "cdifflib": [
+            "cdifflib>=1.2.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -4,113 +4,161 @@ Gap Analyzer Agent
 Responsible for comparing resume against job requirements and identifying gaps.
 """
 
-import json
-from typing import List
-from ..graph.state import AgentState, Gap
-from ..llm.claude_client import get_claude_client
-from ..llm.prompts import get_agent_prompt, get_system_prompt
+import asyncio
+from functools import lru_cache
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+from ..graph.state import AgentState, Gap, SEVERITY_RANKS
+from ..llm.claude_client import get_claude_client, stage_model
+from ..llm.prompts import get_agent_prompt, get_system_prompt, section_keywords
+from ..llm.token_budget import fit_json_to_budget, trim_to_budget
+from ..ui.progress import stream_structured_with_status
+from ..nlp.similarity import keyword_overlap as compute_keyword_overlap, similarity_score as compute_similarity
 
 
 class GapAnalyzerAgent:
     """Agent for analyzing gaps between resume and job requirements"""
 
     def __init__(self):
-        self.client = get_claude_client()
+        self.client = get_claude_client(stage_model("gap_analyzer"))
 
-    def analyze_gaps(self, state: AgentState) -> AgentState:
+    async def a_analyze_gaps(self, state: AgentState) -> Dict[str, Any]:
         """
         Analyze gaps between resume and job requirements.
 
+        The local similarity score is computed in a worker thread while the
+        Claude call is in flight. Only the keys owned by this agent are
+        returned.
+
         Args:
             state: Current agent state with parsed resume and job data
 
         Returns:
-            Updated state with similarity_score and identified_gaps
+            Partial state update with scores, identified_gaps and warnings
         """
         try:
-            # Update workflow stage
-            state["current_agent"] = "gap_analyzer"
-            state["workflow_stage"] = "analyzing"
-
-            # Get parsed data
-            resume_sections = state.get("resume_sections", [])
-            resume_keywords = state.get("parsed_resume", {}).get("all_keywords", [])
-            job_requirements = state.get("job_requirements", [])
-            job_keywords = state.get("job_keywords", [])
-
-            # Prepare data for prompt
-            resume_sections_str = json.dumps([
-                {"section": s["section_name"], "keywords": s["keywords"]}
-                for s in resume_sections
-            ], indent=2)
-
-            job_requirements_str = json.dumps([
-                {
-                    "category": r["category"],
-                    "requirement": r["requirement"],
-                    "priority": r["priority"]
-                }
-                for r in job_requirements
-            ], indent=2)
-
-            # Create prompt
-            prompt = get_agent_prompt(
-                "gap_analyzer",
-                resume_keywords=", ".join(resume_keywords[:50]),  # First 50 keywords
-                job_keywords=", ".join(job_keywords[:50]),
-                resume_sections=resume_sections_str,
-                job_requirements=job_requirements_str
-            )
-
-            # Get system prompt
-            system_prompt = get_system_prompt("gap_analyzer")
-
-            # Call Claude to analyze gaps
-            response = self.client.generate_structured(
-                prompt=prompt,
-                system_prompt=system_prompt,
-                max_tokens=4096
+            prompt, system_prompt, warnings = self._build_prompts(state)
+
+            response, similarity_score = await asyncio.gather(
+                stream_structured_with_status(
+                    self.client,
+                    "Analyzing gaps",
+                    prompt=prompt,
+                    system_prompt=system_prompt,
+                    stage="gap_analyzer",
+                    max_tokens=4096
+                ),
+                asyncio.to_thread(compute_similarity, state["resume_tex"], state["job_description"]),
             )
 
-            # Extract analysis results
-            similarity_score = float(response.get("similarity_score", 0))
-            keyword_overlap = float(response.get("keyword_overlap", 0))
-            gaps_data = response.get("gaps", [])
-
-            # Convert to Gap objects
-            gaps: List[Gap] = []
-            for gap in gaps_data:
-                gaps.append(Gap(
-                    gap_type=gap.get("gap_type", "other"),
-                    description=gap.get("description", ""),
-                    severity=gap.get("severity", "low"),
-                    related_requirement=gap.get("related_requirement")
-                ))
-
-            # Update state
-            state["similarity_score"] = similarity_score
-            state["keyword_overlap"] = keyword_overlap
-            state["identified_gaps"] = gaps  # This will append due to operator.add
-
-            # Count gaps by severity
-            high = sum(1 for g in gaps if g["severity"] == "high")
-            medium = sum(1 for g in gaps if g["severity"] == "medium")
-            low = sum(1 for g in gaps if g["severity"] == "low")
-
-            print(f"[OK] Similarity Score: {similarity_score:.1f}/100")
-            print(f"[OK] Keyword Overlap: {keyword_overlap:.1f}%")
-            print(f"[OK] Identified {len(gaps)} gaps (High: {high}, Medium: {medium}, Low: {low})")
-
-            return state
+            return {"warnings": warnings, **self._process_response(state, response, similarity_score)}
 
         except Exception as e:
             error_msg = f"Gap Analyzer error: {str(e)}"
-            state["errors"].append(error_msg)
             print(f"[X] {error_msg}")
-            return state
+            return {"errors": [error_msg]}
+
+    def _build_prompts(self, state: AgentState) -> Tuple[str, str, List[str]]:
+        """Build the user and system prompts, returning any trimming warnings."""
+        fields, warnings = self._prompt_fields(state)
+
+        # Create prompt
+        prompt = get_agent_prompt("gap_analyzer", **fields)
+
+        # Get system prompt
+        system_prompt = get_system_prompt("gap_analyzer")
+
+        return prompt, system_prompt, warnings
+
+    def _prompt_fields(self, state: AgentState) -> Tuple[Dict[str, str], List[str]]:
+        """Build the gap analysis template fields, returning any trimming warnings."""
+        # Get parsed data
+        resume_sections = state.get("resume_sections", [])
+        resume_keywords = (state.get("parsed_resume") or {}).get("all_keywords", [])
+        job_requirements = state.get("job_requirements", [])
+        job_keywords = state.get("job_keywords", [])
+
+        # Prepare data for prompt, trimmed to the token budget
+        warnings: List[str] = []
+
+        resume_sections_str, dropped = fit_json_to_budget(
+            state.get("resume_sections_keywords_json"),
+            lambda: section_keywords(resume_sections)
+        )
+        if dropped:
+            warnings.append(f"Gap Analyzer: dropped {dropped} of {len(resume_sections)} resume sections to fit the prompt token budget")
+
+        # Required items first so preferred ones are trimmed before them
+        job_requirements_str, dropped = trim_to_budget([
+            {
+                "category": r["category"],
+                "requirement": r["requirement"],
+                "priority": r["priority"]
+            }
+            for r in sorted(job_requirements, key=lambda r: r["priority"] != "required")
+        ])
+        if dropped:
+            warnings.append(f"Gap Analyzer: dropped {dropped} of {len(job_requirements)} job requirements to fit the prompt token budget")
+
+        for warning in warnings:
+            print(f"[WARNING] {warning}")
+
+        fields = {
+            "resume_keywords": ", ".join(resume_keywords[:50]),  # First 50 keywords
+            "job_keywords": ", ".join(job_keywords[:50]),
+            "resume_sections": resume_sections_str,
+            "job_requirements": job_requirements_str,
+        }
+        return fields, warnings
+
+    def _process_response(self, state: AgentState, response: Dict[str, Any],
+                          similarity_score: float) -> Dict[str, Any]:
+        """Convert Claude's gap analysis response into state fields."""
+        resume_keywords = (state.get("parsed_resume") or {}).get("all_keywords", [])
+        keyword_overlap = compute_keyword_overlap(resume_keywords, state.get("job_keywords", []))
+
+        # Extract analysis results
+        gaps_data = response.get("gaps", [])
+
+        # Convert to Gap objects, normalizing severity once up front
+        gaps: List[Gap] = []
+        for gap in gaps_data:
+            severity = str(gap.get("severity", "low")).lower()
+            gaps.append(Gap(
+                gap_type=gap.get("gap_type", "other"),
+                description=gap.get("description", ""),
+                severity=severity,
+                severity_rank=SEVERITY_RANKS.get(severity, 3),
+                related_requirement=gap.get("related_requirement")
+            ))
+
+        # Count gaps by severity
+        counts = Counter(g["severity"] for g in gaps)
+        high, medium, low = counts["high"], counts["medium"], counts["low"]
+
+        print(f"[OK] Similarity Score: {similarity_score:.1f}/100")
+        print(f"[OK] Keyword Overlap: {keyword_overlap:.1f}%")
+        print(f"[OK] Identified {len(gaps)} gaps (High: {high}, Medium: {medium}, Low: {low})")
+
+        return {
+            "similarity_score": similarity_score,
+            "keyword_overlap": keyword_overlap,
+            "identified_gaps": gaps,
+        }
+
+
+@lru_cache(maxsize=1)
+def get_gap_analyzer_agent() -> GapAnalyzerAgent:
+    """
+    Get the shared GapAnalyzerAgent instance.
+
+    Returns:
+        Singleton GapAnalyzerAgent
+    """
+    return GapAnalyzerAgent()
 
 
-def analyze_gaps_node(state: AgentState) -> AgentState:
+async def analyze_gaps_node(state: AgentState) -> Dict[str, Any]:
     """
     LangGraph node function for gap analysis.
 
@@ -118,7 +166,7 @@ def analyze_gaps_node(state: AgentState) -> AgentState:
         state: Current agent state
 
     Returns:
-        Updated state
+        Partial state update
     """
-    agent = GapAnalyzerAgent()
-    return agent.analyze_gaps(state)
+    update = await get_gap_analyzer_agent().a_analyze_gaps(state)
+    return {"current_agent": "gap_analyzer", "workflow_stage": "analyzing", **update}
@@ -0,0 +1,106 @@
+"""
+Gap Recommender Agent
+
+Identifies gaps and generates recommendations in a single Claude call when
+no gap selection happens between the two stages.
+"""
+
+import asyncio
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+from ..graph.state import AgentState
+from ..llm.claude_client import get_claude_client, stage_model
+from ..llm.prompts import get_agent_prompt, get_system_prompt, section_excerpts, SECTION_EXCERPT_CHARS
+from ..llm.token_budget import fit_json_to_budget
+from ..ui.progress import stream_structured_with_status
+from ..nlp.similarity import similarity_score as compute_similarity
+from .gap_analyzer import get_gap_analyzer_agent
+from .recommendation_generator import get_recommendation_generator_agent
+
+
+class GapRecommenderAgent:
+    """Agent for fused gap analysis and recommendation generation"""
+
+    def __init__(self):
+        self.client = get_claude_client(stage_model("gap_and_recommendation"))
+
+    async def a_analyze_and_recommend(self, state: AgentState) -> Dict[str, Any]:
+        """
+        Identify gaps and generate recommendations in one streamed call.
+
+        Args:
+            state: Current agent state with parsed resume and job data
+
+        Returns:
+            Partial state update with scores, identified_gaps, recommendations
+            and warnings
+        """
+        try:
+            similarity_score = await asyncio.to_thread(
+                compute_similarity, state["resume_tex"], state["job_description"]
+            )
+
+            prompt, system_prompt, warnings = self._build_prompts(state, similarity_score)
+
+            response = await stream_structured_with_status(
+                self.client,
+                "Analyzing gaps and generating recommendations",
+                prompt=prompt,
+                system_prompt=system_prompt,
+                stage="gap_and_recommendation",
+                max_tokens=8192
+            )
+
+            return {"warnings": warnings, **self._process_response(state, response, similarity_score)}
+
+        except Exception as e:
+            error_msg = f"Gap Recommender error: {str(e)}"
+            print(f"[X] {error_msg}")
+            return {"errors": [error_msg]}
+
+    def _build_prompts(self, state: AgentState,
+                       similarity_score: float) -> Tuple[str, str, List[str]]:
+        """Build the user and system prompts, returning any trimming warnings."""
+        fields, warnings = get_gap_analyzer_agent()._prompt_fields(state)
+
+        resume_sections = state.get("resume_sections", [])
+        excerpts_str, dropped = fit_json_to_budget(
+            state.get("resume_sections_brief_json"),
+            lambda: section_excerpts(resume_sections, SECTION_EXCERPT_CHARS)
+        )
+        if dropped:
+            warning = f"Gap Recommender: dropped {dropped} of {len(resume_sections)} resume sections to fit the prompt token budget"
+            print(f"[WARNING] {warning}")
+            warnings.append(warning)
+
+        # Create prompt
+        prompt = get_agent_prompt(
+            "gap_and_recommendation",
+            resume_excerpts=excerpts_str,
+            similarity_score=similarity_score,
+            **fields
+        )
+
+        # Get system prompt
+        system_prompt = get_system_prompt("gap_and_recommendation")
+
+        return prompt, system_prompt, warnings
+
+    def _process_response(self, state: AgentState, response: Dict[str, Any],
+                          similarity_score: float) -> Dict[str, Any]:
+        """Convert Claude's fused response into gap and recommendation state fields."""
+        return {
+            **get_gap_analyzer_agent()._process_response(state, response, similarity_score),
+            **get_recommendation_generator_agent()._process_response(response),
+        }
+
+
+@lru_cache(maxsize=1)
+def get_gap_recommender_agent() -> GapRecommenderAgent:
+    """
+    Get the shared GapRecommenderAgent instance.
+
+    Returns:
+        Singleton GapRecommenderAgent
+    """
+    return GapRecommenderAgent()
@@ -4,15 +4,16 @@ Gap Selector Agent
 Responsible for interactive gap selection (pausing workflow for user input).
 """
 
-from typing import List
-from ..graph.state import AgentState, Gap
+from functools import lru_cache
+from typing import Any, Dict
+from ..graph.state import AgentState, SEVERITY_RANKS
 from ..ui.gap_selection_interface import interactive_gap_selection
 
 
 class GapSelectorAgent:
     """Agent for interactive gap selection"""
 
-    def select_gaps(self, state: AgentState) -> AgentState:
+    def select_gaps(self, state: AgentState) -> Dict[str, Any]:
         """
         Present gaps to user for selection.
 
@@ -20,55 +21,54 @@ class GapSelectorAgent:
             state: Current agent state with identified gaps
 
         Returns:
-            Updated state with user_selected_gaps
+            Partial state update with user_selected_gaps
         """
-        try:
-            # Update workflow stage
-            state["current_agent"] = "gap_selector"
-            state["workflow_stage"] = "selecting_gaps"
-
-            # Get identified gaps
-            gaps = state.get("identified_gaps", [])
+        # Get identified gaps
+        gaps = state.get("identified_gaps", [])
 
+        try:
             if not gaps:
                 print("[WARNING] No gaps identified, skipping selection")
-                state["user_selected_gaps"] = []
-                return state
+                return {"user_selected_gaps": []}
 
             # Check if auto-selection by severity
             auto_severity = state.get("auto_select_gap_severity")
 
             if auto_severity:
                 # Auto-select by severity
-                selected_indices = []
-                severity_order = {"high": 1, "medium": 2, "low": 3}
-                max_severity_value = severity_order.get(auto_severity.lower(), 3)
+                max_rank = SEVERITY_RANKS.get(auto_severity.lower(), 3)
+                selected_indices = [f"gap_{i}" for i, g in enumerate(gaps) if g["severity_rank"] <= max_rank]
 
-                for i, gap in enumerate(gaps):
-                    gap_severity_value = severity_order.get(gap["severity"].lower(), 3)
-                    if gap_severity_value <= max_severity_value:
-                        selected_indices.append(f"gap_{i}")
-
-                state["user_selected_gaps"] = selected_indices
                 print(f"[OK] Auto-selected {len(selected_indices)} gaps (severity <= {auto_severity})")
-            else:
-                # Interactive selection
-                selected_ids = interactive_gap_selection(gaps, auto_severity or "low")
-                state["user_selected_gaps"] = selected_ids
-                print(f"[OK] User selected {len(selected_ids)} gaps")
+                return {"user_selected_gaps": selected_indices}
 
-            return state
+            # Interactive selection
+            selected_ids = interactive_gap_selection(gaps, auto_severity or "low")
+            print(f"[OK] User selected {len(selected_ids)} gaps")
+            return {"user_selected_gaps": selected_ids}
 
         except Exception as e:
             error_msg = f"Gap Selector error: {str(e)}"
-            state["errors"].append(error_msg)
             print(f"[X] {error_msg}")
             # On error, select all gaps to continue workflow
-            state["user_selected_gaps"] = [f"gap_{i}" for i in range(len(gaps))]
-            return state
+            return {
+                "user_selected_gaps": [f"gap_{i}" for i in range(len(gaps))],
+                "errors": [error_msg],
+            }
+
+
+@lru_cache(maxsize=1)
+def get_gap_selector_agent() -> GapSelectorAgent:
+    """
+    Get the shared GapSelectorAgent instance.
+
+    Returns:
+        Singleton GapSelectorAgent
+    """
+    return GapSelectorAgent()
 
 
-def select_gaps_node(state: AgentState) -> AgentState:
+def select_gaps_node(state: AgentState) -> Dict[str, Any]:
     """
     LangGraph node function for gap selection.
 
@@ -76,7 +76,7 @@ def select_gaps_node(state: AgentState) -> AgentState:
         state: Current agent state
 
     Returns:
-        Updated state
+        Partial state update
     """
-    agent = GapSelectorAgent()
-    return agent.select_gaps(state)
+    update = get_gap_selector_agent().select_gaps(state)
+    return {"current_agent": "gap_selector", "workflow_stage": "selecting_gaps", **update}
@@ -4,95 +4,163 @@ Job Analyzer Agent
 Responsible for analyzing job descriptions and extracting requirements.
 """
 
-from typing import List
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from ..graph.state import AgentState, JobRequirement
-from ..llm.claude_client import get_claude_client
-from ..llm.prompts import get_agent_prompt, get_system_prompt
+from ..graph.node_cache import memoize_node
+from ..llm.claude_client import get_claude_client, stage_model
+from ..nlp.keyword_extractor import extract_keywords, merge_keywords
+from ..llm.prompts import get_agent_prompt, get_system_prompt, get_job_context
+
+
+def _job_context(state: AgentState) -> str:
+    """Cached job description block, built from the prompt-trimmed text when available."""
+    return get_job_context(state.get("prompt_job_description") or state["job_description"])
 
 
 class JobAnalyzerAgent:
     """Agent for analyzing job descriptions"""
 
     def __init__(self):
-        self.client = get_claude_client()
+        self.client = get_claude_client(stage_model("job_analyzer"))
 
-    def analyze_job(self, state: AgentState) -> AgentState:
+    async def a_analyze_job(self, state: AgentState) -> Dict[str, Any]:
         """
         Analyze the job description and extract requirements.
 
+        Only the keys owned by this agent are returned, so the result can be
+        merged with concurrently produced updates without collisions.
+
         Args:
             state: Current agent state with job_description
 
         Returns:
-            Updated state with job_requirements and job_keywords
+            Partial state update with job_requirements and job_keywords
         """
         try:
-            # Update workflow stage
-            state["current_agent"] = "job_analyzer"
-
-            # Get the job description
-            job_description = state["job_description"]
-
-            # Create prompt
-            prompt = get_agent_prompt(
-                "job_analyzer",
-                job_description=job_description
-            )
-
-            # Get system prompt
-            system_prompt = get_system_prompt("job_analyzer")
+            prompt, system_prompt = self._build_prompts(state)
 
-            # Call Claude to analyze the job
-            response = self.client.generate_structured(
+            response = await self.client.agenerate_structured(
                 prompt=prompt,
                 system_prompt=system_prompt,
-                max_tokens=4096
+                stage="job_analyzer",
+                max_tokens=4096,
+                cache_segments=[_job_context(state)]
             )
 
-            # Extract job data
-            job_title = response.get("job_title", "Unknown")
-            company_name = response.get("company_name", "Unknown")
-            requirements_data = response.get("requirements", [])
-            all_keywords = response.get("all_keywords", [])
-
-            # Convert to JobRequirement objects
-            job_requirements: List[JobRequirement] = []
-            for req in requirements_data:
-                job_requirements.append(JobRequirement(
-                    category=req.get("category", "other"),
-                    requirement=req.get("requirement", ""),
-                    priority=req.get("priority", "preferred"),
-                    keywords=req.get("keywords", [])
-                ))
-
-            # Update state
-            state["job_title"] = job_title
-            state["company_name"] = company_name
-            state["job_requirements"] = job_requirements
-            state["job_keywords"] = all_keywords
-
-            print(f"[OK] Analyzed job: {job_title} at {company_name}")
-            print(f"[OK] Extracted {len(job_requirements)} requirements")
-            print(f"[OK] Identified {len(all_keywords)} keywords")
-
-            return state
+            return self._process_response(state["job_description"], response)
 
         except Exception as e:
             error_msg = f"Job Analyzer error: {str(e)}"
-            state["errors"].append(error_msg)
             print(f"[X] {error_msg}")
-            return state
+            return {"errors": [error_msg]}
+
+    def batch_request(self, state: AgentState) -> Dict[str, Any]:
+        """
+        Build this agent's request for ClaudeClient.generate_structured_batch().
+
+        Args:
+            state: Current agent state with job_description
+
+        Returns:
+            Batch request dictionary
+        """
+        prompt, system_prompt = self._build_prompts(state)
+        return {
+            "model": self.client.model,
+            "prompt": prompt,
+            "system_prompt": system_prompt,
+            "max_tokens": 4096,
+            "cache_segments": [_job_context(state)],
+        }
+
+    def process_batch_response(self, state: AgentState,
+                               response: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Convert this agent's batch result into a partial state update.
+
+        Args:
+            state: Current agent state with job_description
+            response: Parsed batch response, or None if the request failed
+
+        Returns:
+            Partial state update (with "errors" if the request failed)
+        """
+        if response is None:
+            error_msg = "Job Analyzer error: batch request failed"
+            print(f"[X] {error_msg}")
+            return {"errors": [error_msg]}
+        return self._process_response(state["job_description"], response)
+
+    def _build_prompts(self, state: AgentState) -> Tuple[str, str]:
+        """Build the user and system prompts for the job analysis call."""
+        # Create prompt (the job description itself is sent as a cached system block)
+        prompt = get_agent_prompt("job_analyzer")
+
+        # Get system prompt
+        system_prompt = get_system_prompt("job_analyzer")
+
+        return prompt, system_prompt
+
+    def _process_response(self, job_description: str, response: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert Claude's job analysis response into state fields."""
+        # Extract job data
+        job_title = response.get("job_title", "Unknown")
+        company_name = response.get("company_name", "Unknown")
+        requirements_data = response.get("requirements", [])
+
+        # Convert to JobRequirement objects
+        job_requirements: List[JobRequirement] = []
+        for req in requirements_data:
+            job_requirements.append(JobRequirement(
+                category=req.get("category", "other"),
+                requirement=req.get("requirement", ""),
+                priority=req.get("priority", "preferred"),
+                keywords=req.get("keywords", [])
+            ))
+
+        # Keywords are extracted locally, then enriched with the per-requirement
+        # keywords Claude already returned
+        all_keywords = merge_keywords(
+            extract_keywords(job_description),
+            *(req["keywords"] for req in job_requirements)
+        )
+
+        print(f"[OK] Analyzed job: {job_title} at {company_name}")
+        print(f"[OK] Extracted {len(job_requirements)} requirements")
+        print(f"[OK] Identified {len(all_keywords)} keywords")
+
+        return {
+            "job_title": job_title,
+            "company_name": company_name,
+            "job_requirements": job_requirements,
+            "job_keywords": all_keywords,
+        }
+
+
+@lru_cache(maxsize=1)
+def get_job_analyzer_agent() -> JobAnalyzerAgent:
+    """
+    Get the shared JobAnalyzerAgent instance.
+
+    Returns:
+        Singleton JobAnalyzerAgent
+    """
+    return JobAnalyzerAgent()
 
 
-def analyze_job_node(state: AgentState) -> AgentState:
+@memoize_node("job_analyzer", "job_description")
+async def analyze_job_node(state: AgentState) -> Dict[str, Any]:
     """
     LangGraph node function for analyzing jobs.
 
+    Runs as one branch of the parsing fan-out, so it only returns the keys
+    it owns. Results are cached on disk by content hash of the input.
+
     Args:
         state: Current agent state
 
     Returns:
-        Updated state
+        Partial state update
     """
-    agent = JobAnalyzerAgent()
-    return agent.analyze_job(state)
+    return await get_job_analyzer_agent().a_analyze_job(state)
@@ -4,115 +4,235 @@ LaTeX Editor Agent
 Responsible for applying recommendations to the LaTeX resume.
 """
 
-import json
-from typing import List, Dict, Any
-from ..graph.state import AgentState
-from ..llm.claude_client import get_claude_client
-from ..llm.prompts import get_agent_prompt, get_system_prompt
+import asyncio
+import threading
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+from ..graph.state import AgentState, Recommendation
+from ..llm.claude_client import get_claude_client, stage_model
+from operator import itemgetter
+from ..llm.prompts import (
+    get_agent_prompt, get_system_prompt, get_numbered_resume_context, section_excerpts, SECTION_EXCERPT_CHARS
+)
+from ..llm.token_budget import estimate_max_tokens, estimate_tokens, fit_json_to_budget, trim_to_budget
+from ..nlp.verbatim_checker import check_verbatim_overlap
+from ..utils.latex_patch import apply_patches, validate_patches
+from ..ui.progress import stream_structured_with_status
 
 
 class LaTeXEditorAgent:
     """Agent for editing LaTeX resumes based on recommendations"""
 
     def __init__(self):
-        self.client = get_claude_client()
+        self.client = get_claude_client(stage_model("latex_editor"))
+        self._prefetched: Dict[str, Future] = {}  # Prompt -> in-flight speculative response
 
-    def apply_recommendations(self, state: AgentState) -> AgentState:
+    async def a_apply_recommendations(self, state: AgentState) -> Dict[str, Any]:
         """
-        Apply approved recommendations to the LaTeX resume.
+        Apply approved recommendations to the LaTeX resume, streaming Claude's response.
+
+        The edit patches are the largest response in the workflow, so they are
+        streamed with a live progress display instead of waiting silently for
+        the full body.
 
         Args:
             state: Current agent state with recommendations
 
         Returns:
-            Updated state with modified_resume_tex
+            Partial state update with modified_resume_tex and applied_changes
         """
+        resume_tex = state["resume_tex"]
         try:
-            # Update workflow stage
-            state["current_agent"] = "latex_editor"
-            state["workflow_stage"] = "editing"
-
-            # Get data
-            resume_tex = state["resume_tex"]
-            recommendations = state.get("recommendations", [])
-            resume_sections = state.get("resume_sections", [])
-
-            # Filter for accepted recommendations (if user has selected)
-            accepted_ids = state.get("user_accepted_recommendations")
-            if accepted_ids is not None:
-                recommendations = [
-                    r for r in recommendations
-                    if r["recommendation_id"] in accepted_ids
-                ]
+            recommendations = self._accepted_recommendations(state)
 
             # If no recommendations to apply, return original
             if not recommendations:
                 print("[WARNING] No recommendations to apply")
-                state["modified_resume_tex"] = resume_tex
-                state["applied_changes"] = []
-                return state
-
-            # Prepare data for prompt
-            recommendations_str = json.dumps([
-                {
-                    "id": r["recommendation_id"],
-                    "priority": r["priority"],
-                    "action": r["specific_action"],
-                    "latex_modification": r.get("latex_modification", "")
-                }
-                for r in recommendations
-            ], indent=2)
-            # add a checker for none because most parameters pass none as values
-            sections_str = json.dumps([
-                {
-                    "section": s["section_name"],
-                    "content": str(s.get("content", ""))[:300]  # Safe: convert to string first
-                }
-                for s in resume_sections
-            ], indent=2)
-
-            # Create prompt
-            prompt = get_agent_prompt(
-                "latex_editor",
-                resume_tex=resume_tex,
-                recommendations=recommendations_str,
-                resume_sections=sections_str
-            )
-
-            # Get system prompt
-            system_prompt = get_system_prompt("latex_editor")
-
-            # Call Claude to apply edits
-            response = self.client.generate_structured(
-                prompt=prompt,
-                system_prompt=system_prompt,
-                max_tokens=8192  # Larger for full resume
-            )
-            print(f"AI Full Response: {response}")
-
-            # Extract results
-            modified_resume_tex = response.get("modified_resume_tex", resume_tex)
-            applied_changes = response.get("applied_changes", [])
+                return {"modified_resume_tex": resume_tex, "applied_changes": [], "applied_patches": []}
 
-            # Update state
-            state["modified_resume_tex"] = modified_resume_tex
-            state["applied_changes"] = applied_changes
+            prompt, system_prompt, warnings = self._build_prompts(state, recommendations)
 
-            print(f"[OK] Applied {len(applied_changes)} changes to resume")
+            response = await self._take_prefetched(prompt)
+            if response is None:
+                response = await stream_structured_with_status(
+                    self.client,
+                    "Applying recommendations",
+                    **self._request(resume_tex, prompt, system_prompt)
+                )
 
-            return state
+            return self._process_response(state, response, warnings)
 
         except Exception as e:
             error_msg = f"LaTeX Editor error: {str(e)}"
-            state["errors"].append(error_msg)
             print(f"[X] {error_msg}")
             # Fallback to original resume
-            state["modified_resume_tex"] = state["resume_tex"]
-            state["applied_changes"] = []
-            return state
+            return {"modified_resume_tex": resume_tex, "applied_changes": [], "applied_patches": [],
+                    "errors": [error_msg]}
+
+    def prefetch(self, state: AgentState):
+        """
+        Start the edit request for a predicted selection in the background.
+
+        Meant to run while the user is choosing recommendations. If the final
+        selection matches the prediction, a_apply_recommendations uses this
+        response instead of calling Claude again; otherwise it is discarded,
+        though it has still warmed the prompt cache for the resume block.
+
+        Args:
+            state: Agent state with user_accepted_recommendations set to the
+                predicted selection
+        """
+        recommendations = self._accepted_recommendations(state)
+        if not recommendations:
+            return
+
+        prompt, system_prompt, _ = self._build_prompts(state, recommendations)
+        request = self._request(state["resume_tex"], prompt, system_prompt)
+
+        # A daemon thread rather than an executor, so an unused prefetch
+        # never delays interpreter exit
+        future: Future = Future()
+
+        def run():
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(self.client.generate_structured(**request))
+                except Exception as e:
+                    future.set_exception(e)
+
+        threading.Thread(target=run, daemon=True).start()
+        self._prefetched[prompt] = future
+
+    async def _take_prefetched(self, prompt: str) -> Optional[Dict[str, Any]]:
+        """Await the prefetched response for this prompt, discarding any others."""
+        future = self._prefetched.pop(prompt, None)
+        for stale in self._prefetched.values():
+            stale.cancel()
+        self._prefetched.clear()
+        if future is None:
+            return None
+
+        try:
+            response = await asyncio.wrap_future(future)
+        except Exception as e:
+            print(f"[WARNING] Prefetched edit failed, retrying: {e}")
+            return None
+        print("[OK] Using edits prefetched during selection")
+        return response
+
+    def _request(self, resume_tex: str, prompt: str, system_prompt: str) -> Dict[str, Any]:
+        """Keyword arguments for the structured edit call."""
+        return {
+            "prompt": prompt,
+            "system_prompt": system_prompt,
+            "stage": "latex_editor",
+            "max_tokens": estimate_max_tokens("latex_editor", estimate_tokens(prompt)),
+            "cache_segments": [get_numbered_resume_context(resume_tex)],
+        }
+
+    def _accepted_recommendations(self, state: AgentState) -> List[Recommendation]:
+        """Filter for accepted recommendations (if user has selected)."""
+        recommendations = state.get("recommendations", [])
+        accepted_ids = state.get("user_accepted_recommendations")
+        if accepted_ids is not None:
+            recommendations = [
+                r for r in recommendations
+                if r["recommendation_id"] in accepted_ids
+            ]
+        return recommendations
+
+    def _build_prompts(self, state: AgentState,
+                       recommendations: List[Recommendation]) -> Tuple[str, str, List[str]]:
+        """Build the user and system prompts, returning any trimming warnings."""
+        resume_sections = state.get("resume_sections", [])
+
+        # Prepare data for prompt, highest priority first so trimming to
+        # the token budget only drops the least important changes
+        warnings: List[str] = []
+
+        recommendations_str, dropped = trim_to_budget([
+            {
+                "id": r["recommendation_id"],
+                "priority": r["priority"],
+                "action": r["specific_action"],
+                "latex_modification": r.get("latex_modification", "")
+            }
+            for r in sorted(recommendations, key=itemgetter("priority"))
+        ])
+        if dropped:
+            warnings.append(f"LaTeX Editor: dropped {dropped} of {len(recommendations)} recommendations to fit the prompt token budget")
+
+        sections_str, dropped = fit_json_to_budget(
+            state.get("resume_sections_brief_json"),
+            lambda: section_excerpts(resume_sections, SECTION_EXCERPT_CHARS)
+        )
+        if dropped:
+            warnings.append(f"LaTeX Editor: dropped {dropped} of {len(resume_sections)} resume sections to fit the prompt token budget")
+
+        for warning in warnings:
+            print(f"[WARNING] {warning}")
+
+        # Create prompt (the resume itself is sent as a cached system block)
+        prompt = get_agent_prompt(
+            "latex_editor",
+            recommendations=recommendations_str,
+            resume_sections=sections_str
+        )
+
+        # Get system prompt
+        system_prompt = get_system_prompt("latex_editor")
+
+        return prompt, system_prompt, warnings
+
+    def _process_response(self, state: AgentState, response: Dict[str, Any],
+                          warnings: List[str]) -> Dict[str, Any]:
+        """Convert Claude's edit response into state fields."""
+        resume_tex = state["resume_tex"]
+        print(f"AI Full Response: {response}")
+
+        # Splice Claude's line patches into the original resume
+        patches, problems = validate_patches(response.get("patches", []), resume_tex.count("\n") + 1)
+        for problem in problems:
+            warning = f"LaTeX Editor: skipped patch, {problem}"
+            print(f"[WARNING] {warning}")
+            warnings = warnings + [warning]
+        modified_resume_tex = apply_patches(resume_tex, patches)
+        applied_changes = response.get("applied_changes", [])
+
+        # Flag job-description phrases copied verbatim by the edits
+        verbatim = check_verbatim_overlap(state["job_description"], modified_resume_tex, resume_tex)
+        if verbatim["needs_rephrase"]:
+            warning = (
+                f"LaTeX Editor: {verbatim['overlap']:.0%} of the edited resume copies the job "
+                f"description verbatim (e.g. \"{verbatim['phrases'][0]}\")"
+            )
+            print(f"[WARNING] {warning}")
+            warnings = warnings + [warning]
+
+        print(f"[OK] Applied {len(applied_changes)} changes to resume ({len(patches)} patches)")
+
+        return {
+            "modified_resume_tex": modified_resume_tex,
+            "applied_changes": applied_changes,
+            "applied_patches": patches,
+            "needs_rephrase": verbatim["needs_rephrase"],
+            "warnings": warnings,  # This will append due to operator.add
+        }
+
+
+@lru_cache(maxsize=1)
+def get_latex_editor_agent() -> LaTeXEditorAgent:
+    """
+    Get the shared LaTeXEditorAgent instance.
+
+    Returns:
+        Singleton LaTeXEditorAgent
+    """
+    return LaTeXEditorAgent()
 
 
-def apply_recommendations_node(state: AgentState) -> AgentState:
+async def apply_recommendations_node(state: AgentState) -> Dict[str, Any]:
     """
     LangGraph node function for applying recommendations.
 
@@ -120,7 +240,7 @@ def apply_recommendations_node(state: AgentState) -> AgentState:
         state: Current agent state
 
     Returns:
-        Updated state
+        Partial state update
     """
-    agent = LaTeXEditorAgent()
-    return agent.apply_recommendations(state)
+    update = await get_latex_editor_agent().a_apply_recommendations(state)
+    return {"current_agent": "latex_editor", "workflow_stage": "editing", **update}
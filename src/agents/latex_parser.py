@@ -4,97 +4,168 @@ LaTeX Parser Agent
 Responsible for parsing LaTeX resume files and extracting structured information.
 """
 
-from typing import Dict, Any, List
-import json
-import re
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from ..graph.state import AgentState, ResumeSection
-from ..llm.claude_client import get_claude_client
-from ..llm.prompts import get_agent_prompt, get_system_prompt
+from ..graph.node_cache import memoize_node
+from ..llm.claude_client import get_claude_client, stage_model
+from ..nlp.keyword_extractor import extract_keywords, merge_keywords
+from ..llm.prompts import (
+    get_agent_prompt, get_system_prompt, get_resume_context, to_prompt_json,
+    section_excerpts, section_keywords, SECTION_EXCERPT_CHARS
+)
+
+
+def _resume_context(state: AgentState) -> str:
+    """Cached resume block, built from the prompt-trimmed resume when available."""
+    return get_resume_context(state.get("prompt_resume_tex") or state["resume_tex"])
 
 
 class LaTeXParserAgent:
     """Agent for parsing LaTeX resumes"""
 
     def __init__(self):
-        self.client = get_claude_client()
+        self.client = get_claude_client(stage_model("latex_parser"))
 
-    def parse_resume(self, state: AgentState) -> AgentState:
+    async def a_parse_resume(self, state: AgentState) -> Dict[str, Any]:
         """
         Parse the LaTeX resume and extract structured information.
 
+        Only the keys owned by this agent are returned, so the result can be
+        merged with concurrently produced updates without collisions.
+
         Args:
             state: Current agent state with resume_tex
 
         Returns:
-            Updated state with parsed_resume and resume_sections
+            Partial state update with parsed_resume and resume_sections
         """
         try:
-            # Update workflow stage
-            state["current_agent"] = "latex_parser"
-            state["workflow_stage"] = "parsing"
+            prompt, system_prompt = self._build_prompts(state)
 
-            # Get the resume content
-            resume_tex = state["resume_tex"]
-
-            # Create prompt
-            prompt = get_agent_prompt(
-                "latex_parser",
-                resume_tex=resume_tex
-            )
-
-            # Get system prompt
-            system_prompt = get_system_prompt("latex_parser")
-
-            # Call Claude to parse the resume
-            response = self.client.generate_structured(
+            response = await self.client.agenerate_structured(
                 prompt=prompt,
                 system_prompt=system_prompt,
-                max_tokens=4096
+                stage="latex_parser",
+                max_tokens=4096,
+                cache_segments=[_resume_context(state)]
             )
 
-            # Extract parsed data
-            contact_info = response.get("contact_info", {})
-            sections_data = response.get("sections", [])
-            all_keywords = response.get("all_keywords", [])
-
-            # Convert to ResumeSection objects
-            resume_sections: List[ResumeSection] = []
-            for section in sections_data:
-                resume_sections.append(ResumeSection(
-                    section_name=section.get("section_name", "Unknown"),
-                    content=section.get("content", ""),
-                    keywords=section.get("keywords", [])
-                ))
-
-            # Update state
-            state["parsed_resume"] = {
+            return self._process_response(state["resume_tex"], response)
+
+        except Exception as e:
+            error_msg = f"LaTeX Parser error: {str(e)}"
+            print(f"[X] {error_msg}")
+            return {"errors": [error_msg]}
+
+    def batch_request(self, state: AgentState) -> Dict[str, Any]:
+        """
+        Build this agent's request for ClaudeClient.generate_structured_batch().
+
+        Args:
+            state: Current agent state with resume_tex
+
+        Returns:
+            Batch request dictionary
+        """
+        prompt, system_prompt = self._build_prompts(state)
+        return {
+            "model": self.client.model,
+            "prompt": prompt,
+            "system_prompt": system_prompt,
+            "max_tokens": 4096,
+            "cache_segments": [_resume_context(state)],
+        }
+
+    def process_batch_response(self, state: AgentState,
+                               response: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Convert this agent's batch result into a partial state update.
+
+        Args:
+            state: Current agent state with resume_tex
+            response: Parsed batch response, or None if the request failed
+
+        Returns:
+            Partial state update (with "errors" if the request failed)
+        """
+        if response is None:
+            error_msg = "LaTeX Parser error: batch request failed"
+            print(f"[X] {error_msg}")
+            return {"errors": [error_msg]}
+        return self._process_response(state["resume_tex"], response)
+
+    def _build_prompts(self, state: AgentState) -> Tuple[str, str]:
+        """Build the user and system prompts for the parser call."""
+        # Create prompt (the resume itself is sent as a cached system block)
+        prompt = get_agent_prompt("latex_parser")
+
+        # Get system prompt
+        system_prompt = get_system_prompt("latex_parser")
+
+        return prompt, system_prompt
+
+    def _process_response(self, resume_tex: str, response: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert Claude's parse response into state fields."""
+        # Extract parsed data
+        contact_info = response.get("contact_info", {})
+        sections_data = response.get("sections", [])
+
+        # Convert to ResumeSection objects
+        resume_sections: List[ResumeSection] = []
+        for section in sections_data:
+            resume_sections.append(ResumeSection(
+                section_name=section.get("section_name", "Unknown"),
+                content=section.get("content", ""),
+                keywords=section.get("keywords", [])
+            ))
+
+        # Keywords are extracted locally, then enriched with the per-section
+        # keywords Claude already returned
+        all_keywords = merge_keywords(
+            extract_keywords(resume_tex),
+            *(section["keywords"] for section in resume_sections)
+        )
+
+        print(f"[OK] Parsed {len(resume_sections)} sections from resume")
+        print(f"[OK] Extracted {len(all_keywords)} keywords")
+
+        return {
+            "parsed_resume": {
                 "contact_info": contact_info,
                 "all_keywords": all_keywords,
                 "section_count": len(resume_sections)
-            }
-            state["resume_sections"] = resume_sections
+            },
+            "resume_sections": resume_sections,
+            # Serialized once here and reused by every downstream prompt
+            "resume_sections_brief_json": to_prompt_json(section_excerpts(resume_sections, SECTION_EXCERPT_CHARS)),
+            "resume_sections_keywords_json": to_prompt_json(section_keywords(resume_sections)),
+        }
 
-            print(f"[OK] Parsed {len(resume_sections)} sections from resume")
-            print(f"[OK] Extracted {len(all_keywords)} keywords")
 
-            return state
+@lru_cache(maxsize=1)
+def get_latex_parser_agent() -> LaTeXParserAgent:
+    """
+    Get the shared LaTeXParserAgent instance.
 
-        except Exception as e:
-            error_msg = f"LaTeX Parser error: {str(e)}"
-            state["errors"].append(error_msg)
-            print(f"[X] {error_msg}")
-            return state
+    Returns:
+        Singleton LaTeXParserAgent
+    """
+    return LaTeXParserAgent()
 
 
-def parse_resume_node(state: AgentState) -> AgentState:
+@memoize_node("latex_parser", "resume_tex")
+async def parse_resume_node(state: AgentState) -> Dict[str, Any]:
     """
     LangGraph node function for parsing resumes.
 
+    Runs as one branch of the parsing fan-out, so it only returns the keys
+    it owns. Results are cached on disk by content hash of the input.
+
     Args:
         state: Current agent state
 
     Returns:
-        Updated state
+        Partial state update
     """
-    agent = LaTeXParserAgent()
-    return agent.parse_resume(state)
+    return await get_latex_parser_agent().a_parse_resume(state)
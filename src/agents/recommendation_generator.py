@@ -4,150 +4,166 @@ Recommendation Generator Agent
 Responsible for generating actionable recommendations for resume improvement.
 """
 
-import json
-from typing import List
+from functools import lru_cache
+from collections import Counter
+from operator import itemgetter
+from typing import Any, Dict, List, Tuple
 from ..graph.state import AgentState, Recommendation
-from ..llm.claude_client import get_claude_client
-from ..llm.prompts import get_agent_prompt, get_system_prompt
+from ..llm.claude_client import get_claude_client, stage_model
+from ..llm.prompts import get_agent_prompt, get_system_prompt, section_excerpts, SECTION_EXCERPT_CHARS
+from ..llm.token_budget import fit_json_to_budget, trim_to_budget
+from ..ui.progress import stream_structured_with_status
 
 
 class RecommendationGeneratorAgent:
     """Agent for generating resume improvement recommendations"""
 
     def __init__(self):
-        self.client = get_claude_client()
+        self.client = get_claude_client(stage_model("recommendation_generator"))
 
-    def generate_recommendations(self, state: AgentState) -> AgentState:
+    async def a_generate_recommendations(self, state: AgentState) -> Dict[str, Any]:
         """
         Generate prioritized recommendations for resume improvement.
 
+        Only the keys owned by this agent are returned, so the result can be
+        merged with concurrently produced updates without collisions.
+
         Args:
             state: Current agent state with gaps and analysis
 
         Returns:
-            Updated state with recommendations
+            Partial state update with recommendations and warnings
         """
         try:
-            # Update workflow stage
-            state["current_agent"] = "recommendation_generator"
-            state["workflow_stage"] = "generating"
-
-            # Get analysis data
-            all_gaps = state.get("identified_gaps", [])
-            selected_gap_ids = state.get("user_selected_gaps")
-
-            # Filter to only selected gaps if user made a selection
-            if selected_gap_ids is not None:
-                gaps = []
-                for gap_id in selected_gap_ids:
-                    try:
-                        # Extract index from "gap_N" format
-                        index = int(gap_id.split("_")[1])
-                        if 0 <= index < len(all_gaps):
-                            gaps.append(all_gaps[index])
-                    except (ValueError, IndexError):
-                        print(f"[WARNING] Invalid gap ID: {gap_id}")
-
-                print(f"[OK] Generating recommendations for {len(gaps)} selected gaps (out of {len(all_gaps)} total)")
-            else:
-                # No selection made, use all gaps
-                gaps = all_gaps
-                print(f"[OK] Generating recommendations for all {len(gaps)} gaps")
-
-            resume_sections = state.get("resume_sections", [])
-            job_requirements = state.get("job_requirements", [])
-            similarity_score = state.get("similarity_score", 0)
-
-            # Prepare data for prompt
-            gaps_str = json.dumps([
-                {
-                    "type": g["gap_type"],
-                    "description": g["description"],
-                    "severity": g["severity"]
-                }
-                for g in gaps
-            ], indent=2)
-
-            sections_str = json.dumps([
-                {"section": s["section_name"], "content": str(s.get("content", ""))[:200]}
-                for s in resume_sections
-            ], indent=2)
-
-            requirements_str = json.dumps([
-                {"requirement": r["requirement"], "priority": r["priority"]}
-                for r in job_requirements[:10]  # Top 10 requirements
-            ], indent=2)
-
-            # Create prompt
-            prompt = get_agent_prompt(
-                "recommendation_generator",
-                gaps=gaps_str,
-                resume_sections=sections_str,
-                job_requirements=requirements_str,
-                similarity_score=similarity_score
-            )
-
-            # Get system prompt
-            system_prompt = get_system_prompt("recommendation_generator")
+            prompt, system_prompt, warnings = self._build_prompts(state)
 
-            # Call Claude to generate recommendations
-            # Increased token limit to handle larger responses without truncation
-            response = self.client.generate_structured(
+            response = await stream_structured_with_status(
+                self.client,
+                "Generating recommendations",
                 prompt=prompt,
                 system_prompt=system_prompt,
+                stage="recommendation_generator",
                 max_tokens=6000
             )
 
-            # Extract recommendations
-            recommendations_data = response.get("recommendations", [])
-
-            # Convert to Recommendation objects
-            recommendations: List[Recommendation] = []
-            for i, rec in enumerate(recommendations_data):
-                recommendations.append(Recommendation(
-                    recommendation_id=rec.get("recommendation_id", f"rec_{i+1:03d}"),
-                    priority=int(rec.get("priority", 3)),
-                    category=rec.get("category", "other"),
-                    description=rec.get("description", ""),
-                    specific_action=rec.get("specific_action", ""),
-                    rationale=rec.get("rationale", ""),
-                    latex_modification=rec.get("latex_modification")
-                ))
-
-            # Sort by priority (1 is highest)
-            recommendations.sort(key=lambda r: r["priority"])
-
-            # Update state
-            state["recommendations"] = recommendations  # This will append due to operator.add
-
-            # Count by priority
-            p1 = sum(1 for r in recommendations if r["priority"] == 1)
-            p2 = sum(1 for r in recommendations if r["priority"] == 2)
-            p3 = sum(1 for r in recommendations if r["priority"] == 3)
-
-            print(f"[OK] Generated {len(recommendations)} recommendations")
-            print(f"  Priority 1 (Critical): {p1}")
-            print(f"  Priority 2 (Important): {p2}")
-            print(f"  Priority 3 (Suggested): {p3}")
-
-            return state
+            return {"warnings": warnings, **self._process_response(response)}
 
         except Exception as e:
             error_msg = f"Recommendation Generator error: {str(e)}"
-            state["errors"].append(error_msg)
             print(f"[X] {error_msg}")
-            return state
-
-
-def generate_recommendations_node(state: AgentState) -> AgentState:
+            return {"errors": [error_msg]}
+
+    def _build_prompts(self, state: AgentState) -> Tuple[str, str, List[str]]:
+        """Build the user and system prompts, returning any trimming warnings."""
+        # Get analysis data
+        all_gaps = state.get("identified_gaps", [])
+        selected_gap_ids = state.get("user_selected_gaps")
+
+        # Filter to only selected gaps if user made a selection
+        if selected_gap_ids is not None:
+            gaps = []
+            for gap_id in selected_gap_ids:
+                try:
+                    # Extract index from "gap_N" format
+                    index = int(gap_id.split("_")[1])
+                    if 0 <= index < len(all_gaps):
+                        gaps.append(all_gaps[index])
+                except (ValueError, IndexError):
+                    print(f"[WARNING] Invalid gap ID: {gap_id}")
+
+            print(f"[OK] Generating recommendations for {len(gaps)} selected gaps (out of {len(all_gaps)} total)")
+        else:
+            # No selection made, use all gaps
+            gaps = all_gaps
+            print(f"[OK] Generating recommendations for all {len(gaps)} gaps")
+
+        resume_sections = state.get("resume_sections", [])
+        job_requirements = state.get("job_requirements", [])
+        similarity_score = state.get("similarity_score", 0)
+
+        # Prepare data for prompt, most important items first so trimming
+        # to the token budget only drops the least important ones
+        warnings: List[str] = []
+
+        gaps_str, dropped = trim_to_budget([
+            {
+                "type": g["gap_type"],
+                "description": g["description"],
+                "severity": g["severity"]
+            }
+            for g in sorted(gaps, key=itemgetter("severity_rank"))
+        ])
+        if dropped:
+            warnings.append(f"Recommendation Generator: dropped {dropped} of {len(gaps)} gaps to fit the prompt token budget")
+
+        sections_str, dropped = fit_json_to_budget(
+            state.get("resume_sections_brief_json"),
+            lambda: section_excerpts(resume_sections, SECTION_EXCERPT_CHARS)
+        )
+        if dropped:
+            warnings.append(f"Recommendation Generator: dropped {dropped} of {len(resume_sections)} resume sections to fit the prompt token budget")
+
+        requirements_str, _ = trim_to_budget([
+            {"requirement": r["requirement"], "priority": r["priority"]}
+            for r in sorted(job_requirements, key=lambda r: r["priority"] != "required")[:10]  # Top 10 requirements
+        ])
+
+        for warning in warnings:
+            print(f"[WARNING] {warning}")
+
+        # Create prompt
+        prompt = get_agent_prompt(
+            "recommendation_generator",
+            gaps=gaps_str,
+            resume_sections=sections_str,
+            job_requirements=requirements_str,
+            similarity_score=similarity_score
+        )
+
+        # Get system prompt
+        system_prompt = get_system_prompt("recommendation_generator")
+
+        return prompt, system_prompt, warnings
+
+    def _process_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert Claude's recommendation response into state fields."""
+        # Extract recommendations
+        recommendations_data = response.get("recommendations", [])
+
+        # Convert to Recommendation objects
+        recommendations: List[Recommendation] = []
+        for i, rec in enumerate(recommendations_data):
+            recommendations.append(Recommendation(
+                recommendation_id=rec.get("recommendation_id", f"rec_{i+1:03d}"),
+                priority=int(rec.get("priority", 3)),
+                category=rec.get("category", "other"),
+                description=rec.get("description", ""),
+                specific_action=rec.get("specific_action", ""),
+                rationale=rec.get("rationale", ""),
+                latex_modification=rec.get("latex_modification")
+            ))
+
+        # Sort by priority (1 is highest)
+        recommendations.sort(key=itemgetter("priority"))
+
+        # Count by priority
+        counts = Counter(r["priority"] for r in recommendations)
+        p1, p2, p3 = counts[1], counts[2], counts[3]
+
+        print(f"[OK] Generated {len(recommendations)} recommendations")
+        print(f"  Priority 1 (Critical): {p1}")
+        print(f"  Priority 2 (Important): {p2}")
+        print(f"  Priority 3 (Suggested): {p3}")
+
+        return {"recommendations": recommendations}
+
+
+@lru_cache(maxsize=1)
+def get_recommendation_generator_agent() -> RecommendationGeneratorAgent:
     """
-    LangGraph node function for generating recommendations.
-
-    Args:
-        state: Current agent state
+    Get the shared RecommendationGeneratorAgent instance.
 
     Returns:
-        Updated state
+        Singleton RecommendationGeneratorAgent
     """
-    agent = RecommendationGeneratorAgent()
-    return agent.generate_recommendations(state)
+    return RecommendationGeneratorAgent()
@@ -4,9 +4,20 @@ Supervisor Agent
 Responsible for orchestrating the workflow and handling coordination.
 """
 
-from typing import Literal
+import asyncio
+import threading
+from functools import lru_cache
+from typing import Literal, Dict, Any
 from ..graph.state import AgentState
+from ..graph.node_cache import load_artifact, store_artifact
+from ..llm.claude_client import get_claude_client
 from ..llm.prompts import get_system_prompt
+from ..llm.token_budget import prep_tex, truncate_for_prompt, JOB_PROMPT_TOKENS, RESUME_PROMPT_TOKENS
+from ..nlp.ats_risk import compute_ats_risk
+from .gap_recommender import get_gap_recommender_agent
+from .job_analyzer import get_job_analyzer_agent
+from .latex_parser import get_latex_parser_agent
+from .recommendation_generator import get_recommendation_generator_agent
 
 
 class SupervisorAgent:
@@ -15,7 +26,7 @@ class SupervisorAgent:
     def __init__(self):
         self.system_prompt = get_system_prompt("supervisor")
 
-    def validate_inputs(self, state: AgentState) -> AgentState:
+    def validate_inputs(self, state: AgentState) -> Dict[str, Any]:
         """
         Validate input data before starting workflow.
 
@@ -23,10 +34,8 @@ class SupervisorAgent:
             state: Current agent state
 
         Returns:
-            Updated state with validation results
+            Partial state update with any validation errors
         """
-        state["current_agent"] = "supervisor"
-
         errors = []
 
         # Validate resume
@@ -42,14 +51,31 @@ class SupervisorAgent:
             errors.append("Job description appears too short")
 
         if errors:
-            state["errors"].extend(errors)
             print("[X] Input validation failed:")
             for error in errors:
                 print(f"  - {error}")
-        else:
-            print("[OK] Input validation passed")
-
-        return state
+            return {"current_agent": "supervisor", "errors": errors}  # Errors append due to operator.add
+
+        print("[OK] Input validation passed")
+
+        # Trim the inputs once here; agents embed these instead of the raw text
+        warnings = []
+        prompt_resume_tex, cut = prep_tex(state["resume_tex"], RESUME_PROMPT_TOKENS)
+        if cut:
+            warnings.append(f"Supervisor: cut {cut} characters from the end of the resume to fit the prompt token budget")
+        prompt_job_description, cut = truncate_for_prompt(state["job_description"], JOB_PROMPT_TOKENS)
+        if cut:
+            warnings.append(f"Supervisor: cut {cut} characters from the end of the job description to fit the prompt token budget")
+        for warning in warnings:
+            print(f"[WARNING] {warning}")
+
+        return {
+            "current_agent": "supervisor",
+            "errors": errors,
+            "prompt_resume_tex": prompt_resume_tex,
+            "prompt_job_description": prompt_job_description,
+            "warnings": warnings,
+        }
 
     def should_continue(self, state: AgentState) -> Literal["continue", "end"]:
         """
@@ -73,7 +99,7 @@ class SupervisorAgent:
 
         return "continue"
 
-    def finalize(self, state: AgentState) -> AgentState:
+    def finalize(self, state: AgentState) -> Dict[str, Any]:
         """
         Finalize the workflow and prepare output.
 
@@ -81,17 +107,14 @@ class SupervisorAgent:
             state: Current agent state
 
         Returns:
-            Updated state with workflow_stage set to complete
+            Partial state update with workflow_stage set to complete
         """
-        state["current_agent"] = "supervisor"
-        state["workflow_stage"] = "complete"
-
         # Print summary
         print("\n" + "="*60)
         print("RESUME OPTIMIZATION COMPLETE")
         print("="*60)
 
-        similarity = state.get("similarity_score", 0)
+        similarity = state.get("similarity_score") or 0
         gaps_count = len(state.get("identified_gaps", []))
         recs_count = len(state.get("recommendations", []))
 
@@ -99,6 +122,10 @@ class SupervisorAgent:
         print(f"Identified Gaps: {gaps_count}")
         print(f"Recommendations: {recs_count}")
 
+        ats_risk = state.get("ats_risk")
+        if ats_risk:
+            print(f"ATS Risk: {ats_risk['score']}/100 ({len(ats_risk['issues'])} issues)")
+
         if state.get("modified_resume_tex"):
             changes_count = len(state.get("applied_changes", []))
             print(f"Applied Changes: {changes_count}")
@@ -108,10 +135,21 @@ class SupervisorAgent:
 
         print("="*60 + "\n")
 
-        return state
+        return {"current_agent": "supervisor", "workflow_stage": "complete"}
+
 
+@lru_cache(maxsize=1)
+def get_supervisor_agent() -> SupervisorAgent:
+    """
+    Get the shared SupervisorAgent instance.
 
-def validate_inputs_node(state: AgentState) -> AgentState:
+    Returns:
+        Singleton SupervisorAgent
+    """
+    return SupervisorAgent()
+
+
+def validate_inputs_node(state: AgentState) -> Dict[str, Any]:
     """
     LangGraph node function for input validation.
 
@@ -119,13 +157,155 @@ def validate_inputs_node(state: AgentState) -> AgentState:
         state: Current agent state
 
     Returns:
-        Updated state
+        Partial state update
+    """
+    return get_supervisor_agent().validate_inputs(state)
+
+
+def join_inputs_node(state: AgentState) -> Dict[str, Any]:
+    """
+    LangGraph node where the resume parsing and job analysis branches rejoin.
+
+    Args:
+        state: Current agent state with both branches' results merged
+
+    Returns:
+        Partial state update
+    """
+    return {"current_agent": "supervisor", "workflow_stage": "parsing"}
+
+
+async def parse_inputs_batch_node(state: AgentState) -> Dict[str, Any]:
+    """
+    LangGraph node that parses the resume and job description in one message batch.
+
+    Used instead of the parallel parsing branches for non-interactive runs:
+    batched requests are billed at a discount but may take minutes to
+    complete. Inputs already in the parsed-artifact cache are not resubmitted.
+
+    Args:
+        state: Current agent state
+
+    Returns:
+        Merged partial state update from both agents
     """
-    supervisor = SupervisorAgent()
-    return supervisor.validate_inputs(state)
+    update: Dict[str, Any] = {"current_agent": "supervisor", "workflow_stage": "parsing"}
+    pending = []
+    for stage, agent, input_key in (
+        ("latex_parser", get_latex_parser_agent(), "resume_tex"),
+        ("job_analyzer", get_job_analyzer_agent(), "job_description"),
+    ):
+        cached = await asyncio.to_thread(load_artifact, stage, state[input_key])
+        if cached is not None:
+            update.update(cached)
+        else:
+            pending.append((stage, agent, input_key))
+
+    if not pending:
+        return update
+
+    print(f"[OK] Submitting {len(pending)} requests as a message batch (this may take several minutes)")
+    # Tells the polling thread to cancel the batch if this node is cancelled (e.g. Ctrl-C)
+    cancel_event = threading.Event()
+    try:
+        responses = await asyncio.to_thread(
+            get_claude_client().generate_structured_batch,
+            [agent.batch_request(state) for _, agent, _ in pending],
+            cancel_event=cancel_event,
+        )
+    except asyncio.CancelledError:
+        cancel_event.set()
+        raise
+    except Exception as e:
+        error_msg = f"Batch parsing error: {str(e)}"
+        print(f"[X] {error_msg}")
+        return {**update, "errors": [error_msg]}
+
+    errors = []
+    for (stage, agent, input_key), response in zip(pending, responses):
+        agent_update = agent.process_batch_response(state, response)
+        await asyncio.to_thread(store_artifact, stage, state[input_key], agent_update)
+        errors.extend(agent_update.pop("errors", []))
+        update.update(agent_update)
+
+    if errors:
+        update["errors"] = errors
+    return update
+
+
+async def a_compute_ats_risk(state: AgentState) -> Dict[str, Any]:
+    """
+    Score ATS parsing risk off the event loop.
+
+    Args:
+        state: Current agent state with parsed resume and job keywords
+
+    Returns:
+        Partial state update with ats_risk
+    """
+    ats_risk = await asyncio.to_thread(
+        compute_ats_risk,
+        state["resume_tex"],
+        (state.get("parsed_resume") or {}).get("all_keywords", []),
+        state.get("job_keywords") or [],
+    )
+    print(f"[OK] ATS Risk Score: {ats_risk['score']}/100")
+    return {"ats_risk": ats_risk}
+
+
+async def generate_recommendations_node(state: AgentState) -> Dict[str, Any]:
+    """
+    LangGraph node that generates recommendations and scores ATS risk concurrently.
+
+    Local ATS scoring does not depend on the recommendations, so it runs
+    while the recommendation call to Claude is in flight.
+
+    Args:
+        state: Current agent state
+
+    Returns:
+        Merged state update from both tasks
+    """
+    recommendation_update, ats_update = await asyncio.gather(
+        get_recommendation_generator_agent().a_generate_recommendations(state),
+        a_compute_ats_risk(state),
+    )
+
+    return {
+        "current_agent": "supervisor",
+        "workflow_stage": "generating",
+        **recommendation_update,
+        **ats_update,
+    }
+
+
+async def analyze_gaps_and_recommend_node(state: AgentState) -> Dict[str, Any]:
+    """
+    LangGraph node that runs fused gap analysis + recommendations and scores ATS risk concurrently.
+
+    Replaces analyze_gaps and generate_recommendations when no gap selection
+    happens between them, saving one Claude round-trip over the same context.
+
+    Args:
+        state: Current agent state
+
+    Returns:
+        Merged state update from both tasks
+    """
+    analysis_update, ats_update = await asyncio.gather(
+        get_gap_recommender_agent().a_analyze_and_recommend(state),
+        a_compute_ats_risk(state),
+    )
+
+    return {
+        "current_agent": "supervisor",
+        "workflow_stage": "generating",
+        **analysis_update,
+        **ats_update,
+    }
 
 
-def finalize_node(state: AgentState) -> AgentState:
+def finalize_node(state: AgentState) -> Dict[str, Any]:
     """
     LangGraph node function for workflow finalization.
 
@@ -133,7 +313,6 @@ def finalize_node(state: AgentState) -> AgentState:
         state: Current agent state
 
     Returns:
-        Updated state
+        Partial state update
     """
-    supervisor = SupervisorAgent()
-    return supervisor.finalize(state)
+    return get_supervisor_agent().finalize(state)
@@ -0,0 +1,151 @@
+"""
+Parsed Artifact Cache
+
+Memoizes the state contribution of the input-parsing nodes on disk. The key
+is a SHA-256 of the node's input text together with the model and the
+node's system prompt and prompt template, so a second run on an unchanged
+resume or job description skips the node (and its Claude call) entirely,
+while a model or prompt change still re-parses. Cached updates also carry
+locally extracted keywords, so the key includes ARTIFACT_SCHEMA_VERSION and
+a digest of the keyword extractor and its data files. Content is hashed rather than trusting file
+mtimes, which change on checkout or copy.
+"""
+
+import asyncio
+import hashlib
+import os
+from functools import lru_cache, wraps
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from .state import AgentState
+from ..llm.claude_client import get_claude_client, stage_model
+from ..llm.exact_cache import ExactCache, DEFAULT_TTL_DAYS
+from ..llm.prompts import get_agent_prompt_template, get_system_prompt
+from ..nlp import keyword_extractor
+
+DEFAULT_ARTIFACT_DIR = Path.home() / ".cache" / "resume-optimizer" / "parsed"
+
+# Bump when the shape of a cached update changes (e.g. new state fields)
+ARTIFACT_SCHEMA_VERSION = "2"
+
+NodeFunction = Callable[[AgentState], Awaitable[Dict[str, Any]]]
+
+
+def get_artifact_cache() -> Optional[ExactCache]:
+    """
+    Get the parsed-artifact cache unless disabled via PARSE_CACHE.
+
+    Returns:
+        ExactCache rooted at PARSE_CACHE_DIR, or None when disabled
+    """
+    if os.getenv("PARSE_CACHE", "1").lower() not in ("1", "true", "yes"):
+        return None
+    cache_dir = os.getenv("PARSE_CACHE_DIR")
+    return ExactCache(
+        Path(cache_dir).expanduser() if cache_dir else DEFAULT_ARTIFACT_DIR,
+        ttl_days=float(os.getenv("CLAUDE_CACHE_TTL_DAYS", str(DEFAULT_TTL_DAYS))),
+    )
+
+
+@lru_cache(maxsize=1)
+def keyword_data_digest() -> str:
+    """
+    Hash the keyword extractor source and its data files.
+
+    Returns:
+        Hex SHA-256 digest that changes whenever local keyword extraction
+        could produce different output
+    """
+    extractor = Path(keyword_extractor.__file__)
+    digest = hashlib.sha256(extractor.read_bytes())
+    for path in sorted((extractor.parent / "data").glob("*.yaml")):
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def artifact_key(stage: str, content: str) -> str:
+    """
+    Build the cache key for a node's input.
+
+    Args:
+        stage: Agent name the node runs (also selects its prompts)
+        content: The node's input text
+
+    Returns:
+        Hex SHA-256 digest identifying the artifact
+    """
+    parts = [
+        ARTIFACT_SCHEMA_VERSION,
+        keyword_data_digest(),
+        stage,
+        get_claude_client(stage_model(stage)).model,
+        get_system_prompt(stage),
+        get_agent_prompt_template(stage),
+        content,
+    ]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def load_artifact(stage: str, content: str) -> Optional[Dict[str, Any]]:
+    """
+    Look up a node's cached partial update.
+
+    Args:
+        stage: Agent name the node runs
+        content: The node's input text
+
+    Returns:
+        The cached update, or None on a miss or when the cache is disabled
+    """
+    cache = get_artifact_cache()
+    if cache is None:
+        return None
+    update = cache.get(artifact_key(stage, content))
+    if update is not None:
+        print(f"[OK] Reusing cached {stage} output for unchanged input")
+    return update
+
+
+def store_artifact(stage: str, content: str, update: Dict[str, Any]):
+    """
+    Cache a node's partial update unless it carries errors.
+
+    Updates that carry errors are never stored, so a failed parse is
+    retried on the next run.
+
+    Args:
+        stage: Agent name the node runs
+        content: The node's input text
+        update: Partial state update returned by the node
+    """
+    cache = get_artifact_cache()
+    if cache is not None and not update.get("errors"):
+        cache.put(artifact_key(stage, content), update)
+
+
+def memoize_node(stage: str, input_key: str) -> Callable[[NodeFunction], NodeFunction]:
+    """
+    Cache an async node's partial update keyed by one input field.
+
+    Args:
+        stage: Agent name the node runs
+        input_key: State key holding the node's only input (e.g. "resume_tex")
+
+    Returns:
+        Decorator for a LangGraph node function
+    """
+    def decorator(node: NodeFunction) -> NodeFunction:
+        @wraps(node)
+        async def wrapper(state: AgentState) -> Dict[str, Any]:
+            # Cache file I/O runs in a thread so the sibling branch keeps going
+            update = await asyncio.to_thread(load_artifact, stage, state[input_key])
+            if update is None:
+                update = await node(state)
+                await asyncio.to_thread(store_artifact, stage, state[input_key], update)
+            return update
+
+        return wrapper
+
+    return decorator
@@ -25,11 +25,16 @@ class JobRequirement(TypedDict):
     keywords: List[str]
 
 
+# Severity ranks for integer comparisons (1 is most severe)
+SEVERITY_RANKS = {"high": 1, "medium": 2, "low": 3}
+
+
 class Gap(TypedDict):
     """Identified gap between resume and job requirements"""
     gap_type: str  # "missing_keyword", "missing_skill", "missing_experience", "formatting"
     description: str
     severity: str  # "high", "medium", "low"
+    severity_rank: int  # 1 (high) to 3 (low), see SEVERITY_RANKS
     related_requirement: Optional[str]
 
 
@@ -56,10 +61,14 @@ class AgentState(TypedDict):
     job_description: str  # Job description text
     resume_file_path: Optional[str]  # Path to the resume file
     job_file_path: Optional[str]  # Path to the job description file
+    prompt_resume_tex: Optional[str]  # Resume trimmed for prompts (comments stripped, token budget)
+    prompt_job_description: Optional[str]  # Job description trimmed for prompts
 
     # Parsed data from LaTeX Parser Agent
     parsed_resume: Optional[Dict[str, Any]]  # Structured resume data
     resume_sections: Optional[List[ResumeSection]]  # Individual sections
+    resume_sections_brief_json: Optional[str]  # Section excerpts serialized once for downstream prompts
+    resume_sections_keywords_json: Optional[str]  # Section keywords serialized once for gap analysis
 
     # Analysis from Job Analyzer Agent
     job_requirements: Optional[List[JobRequirement]]  # Extracted requirements
@@ -78,14 +87,20 @@ class AgentState(TypedDict):
     # Output from Recommendation Generator Agent
     recommendations: Annotated[List[Recommendation], operator.add]  # Generated recommendations
 
+    # Local ATS scoring (computed alongside recommendation generation)
+    ats_risk: Optional[Dict[str, Any]]  # {"score": 0-100, higher is riskier, "issues": [...]}
+
     # Output from LaTeX Editor Agent
     modified_resume_tex: Optional[str]  # Optimized LaTeX content
     applied_changes: Optional[List[str]]  # List of changes that were applied
+    applied_patches: Optional[List[Dict[str, Any]]]  # Line-range patches spliced into the resume
+    needs_rephrase: Optional[bool]  # Edited resume copies too much of the job description verbatim
 
     # Workflow control
     current_agent: Optional[str]  # Name of the currently executing agent
     workflow_stage: str  # "parsing", "analyzing", "generating", "editing", "complete"
     errors: Annotated[List[str], operator.add]  # Any errors encountered (appendable)
+    warnings: Annotated[List[str], operator.add]  # Non-fatal issues, e.g. trimmed prompt inputs (appendable)
 
     # User selections (for interactive mode)
     user_accepted_recommendations: Optional[List[str]]  # IDs of accepted recommendations
@@ -94,6 +109,9 @@ class AgentState(TypedDict):
     # Workflow control flags
     interactive_gap_selection: Optional[bool]  # Enable interactive gap selection
     auto_select_gap_severity: Optional[str]  # Auto-select by severity ("high", "medium", "low")
+    skip_threshold: Optional[float]  # Skip recommendations/edits at or above this keyword coverage with no high gaps (None disables)
+    batch_parsing: Optional[bool]  # Parse resume and job via the Message Batches API
+    fused_analysis: Optional[bool]  # One Claude call for gaps + recommendations when gaps aren't selected in between
 
 
 def create_initial_state(resume_tex: str, job_description: str,
@@ -116,8 +134,12 @@ def create_initial_state(resume_tex: str, job_description: str,
         job_description=job_description,
         resume_file_path=resume_path,
         job_file_path=job_path,
+        prompt_resume_tex=None,
+        prompt_job_description=None,
         parsed_resume=None,
         resume_sections=None,
+        resume_sections_brief_json=None,
+        resume_sections_keywords_json=None,
         job_requirements=None,
         job_keywords=None,
         job_title=None,
@@ -126,14 +148,21 @@ def create_initial_state(resume_tex: str, job_description: str,
         keyword_overlap=None,
         identified_gaps=[],
         recommendations=[],
+        ats_risk=None,
         modified_resume_tex=None,
         applied_changes=None,
+        applied_patches=None,
+        needs_rephrase=None,
         current_agent=None,
         workflow_stage="parsing",
         errors=[],
+        warnings=[],
         user_accepted_recommendations=None,
         user_rejected_recommendations=None,
         user_selected_gaps=None,
         interactive_gap_selection=True,  # Default to interactive
         auto_select_gap_severity=None,
+        skip_threshold=None,
+        batch_parsing=False,
+        fused_analysis=True,
     )
@@ -4,16 +4,32 @@ LangGraph Workflow Builder
 Defines the multi-agent workflow graph for resume optimization.
 """
 
-from typing import Literal
+import asyncio
+import logging
+from functools import lru_cache
+from typing import Callable, List, Literal, Optional, Union
 from langgraph.graph import StateGraph, END
+from langgraph.types import Send
 from .state import AgentState
-from ..agents.supervisor import validate_inputs_node, finalize_node
+from ..nlp.similarity import keyword_overlap
+from ..agents.supervisor import (
+    validate_inputs_node, parse_inputs_batch_node, join_inputs_node,
+    analyze_gaps_and_recommend_node, generate_recommendations_node, finalize_node
+)
 from ..agents.latex_parser import parse_resume_node
 from ..agents.job_analyzer import analyze_job_node
 from ..agents.gap_analyzer import analyze_gaps_node
 from ..agents.gap_selector import select_gaps_node
-from ..agents.recommendation_generator import generate_recommendations_node
-from ..agents.latex_editor import apply_recommendations_node
+from ..agents.latex_editor import apply_recommendations_node, get_latex_editor_agent
+
+# Routing messages go through logging; the CLI entry point attaches a handler
+logger = logging.getLogger("resume_optimizer.workflow")
+logger.addHandler(logging.NullHandler())
+
+
+def _has_errors(state: AgentState) -> bool:
+    """Whether any node has recorded an error."""
+    return bool(state.get("errors"))
 
 
 def should_continue_workflow(state: AgentState) -> Literal["continue", "end"]:
@@ -27,9 +43,8 @@ def should_continue_workflow(state: AgentState) -> Literal["continue", "end"]:
         "continue" to proceed with workflow, "end" to stop
     """
     # Check for critical errors - stop on FIRST error
-    errors = state.get("errors", [])
-    if len(errors) > 0:
-        print(f"[X] Stopping workflow due to error: {errors[-1]}")
+    if _has_errors(state):
+        logger.error("[X] Stopping workflow due to error: %s", state["errors"][-1])
         return "end"
 
     # Check if we have required data from validation
@@ -39,6 +54,83 @@ def should_continue_workflow(state: AgentState) -> Literal["continue", "end"]:
     return "continue"
 
 
+def dispatch_parsing(state: AgentState) -> Union[List[Send], Literal["parse_inputs_batch", "finalize"]]:
+    """
+    Fan out resume parsing and job analysis after validation.
+
+    The two branches read disjoint inputs and write disjoint state keys, so
+    they run concurrently and rejoin before gap analysis. In batch mode both
+    requests are submitted together as one message batch instead.
+
+    Args:
+        state: Current agent state
+
+    Returns:
+        Send packets for both parsing branches, "parse_inputs_batch", or
+        "finalize" to stop
+    """
+    if should_continue_workflow(state) == "end":
+        return "finalize"
+    if state.get("batch_parsing"):
+        return "parse_inputs_batch"
+    return [Send("parse_resume", state), Send("analyze_job", state)]
+
+
+def keyword_coverage(state: AgentState) -> float:
+    """
+    Percentage of job keywords found among the parsed resume keywords.
+
+    Args:
+        state: Current agent state after parsing
+
+    Returns:
+        Coverage from 0 to 100
+    """
+    return keyword_overlap(
+        (state.get("parsed_resume") or {}).get("all_keywords", []),
+        state.get("job_keywords") or [],
+    )
+
+
+def is_good_fit(state: AgentState) -> bool:
+    """
+    Whether the resume already matches well enough to skip optimization.
+
+    Gated on keyword coverage rather than similarity_score: the local term-frequency
+    cosine between LaTeX and prose stays low even for matching resumes.
+
+    Args:
+        state: Current agent state after gap analysis
+
+    Returns:
+        True if keyword coverage reaches skip_threshold and no gap is high
+        severity; always False when skip_threshold is unset
+    """
+    threshold = state.get("skip_threshold")
+    if threshold is None or keyword_coverage(state) < threshold:
+        return False
+    return not any(g["severity"] == "high" for g in state.get("identified_gaps") or [])
+
+
+def choose_analysis(state: AgentState) -> Literal["analyze_gaps", "analyze_gaps_and_recommend"]:
+    """
+    Routing function to choose between two-step and fused gap analysis.
+
+    Gaps and recommendations come from one Claude call unless the user picks
+    gaps in between, which needs the gap list before recommendations exist.
+
+    Args:
+        state: Current agent state
+
+    Returns:
+        "analyze_gaps_and_recommend" for the fused call, "analyze_gaps" for
+        the two-step path
+    """
+    if state.get("fused_analysis", True) and not state.get("interactive_gap_selection", True):
+        return "analyze_gaps_and_recommend"
+    return "analyze_gaps"
+
+
 def should_apply_edits(state: AgentState) -> Literal["apply_edits", "skip_edits"]:
     """
     Routing function to determine if we should apply edits.
@@ -51,24 +143,28 @@ def should_apply_edits(state: AgentState) -> Literal["apply_edits", "skip_edits"
     """
     recommendations = state.get("recommendations", [])
 
+    if state.get("user_accepted_recommendations") is None and is_good_fit(state):
+        logger.info("[OK] Resume already meets the skip threshold, skipping edits")
+        return "skip_edits"
+
     # If user has made selections, respect them
     if state.get("user_accepted_recommendations") is not None:
         accepted = state.get("user_accepted_recommendations", [])
-        if len(accepted) > 0:
+        if accepted:
             return "apply_edits"
         else:
-            print("[WARNING] No recommendations accepted by user, skipping edits")
+            logger.warning("[WARNING] No recommendations accepted by user, skipping edits")
             return "skip_edits"
 
     # If no user selection, check if we have any recommendations
-    if len(recommendations) > 0:
+    if recommendations:
         return "apply_edits"
     else:
-        print("[WARNING] No recommendations generated, skipping edits")
+        logger.warning("[WARNING] No recommendations generated, skipping edits")
         return "skip_edits"
 
 
-def should_select_gaps(state: AgentState) -> Literal["select_gaps", "generate_recommendations"]:
+def should_select_gaps(state: AgentState) -> Literal["select_gaps", "generate_recommendations", "skip"]:
     """
     Routing function to determine if user should select gaps interactively.
 
@@ -76,12 +172,18 @@ def should_select_gaps(state: AgentState) -> Literal["select_gaps", "generate_re
         state: Current agent state
 
     Returns:
-        "select_gaps" for interactive mode, "generate_recommendations" for auto mode
+        "select_gaps" for interactive mode, "generate_recommendations" for auto
+        mode, "skip" if the resume is already a good fit
     """
     gaps = state.get("identified_gaps", [])
 
+    # Already a good fit: skip recommendations and edits entirely
+    if is_good_fit(state):
+        logger.info("[OK] Resume already meets the skip threshold, skipping recommendations and edits")
+        return "skip"
+
     # If no gaps, skip to recommendations (which will be empty)
-    if len(gaps) == 0:
+    if not gaps:
         return "generate_recommendations"
 
     # If user has already selected gaps (resuming workflow), skip selection
@@ -109,14 +211,32 @@ def check_for_errors(state: AgentState) -> Literal["continue", "abort"]:
     Returns:
         "continue" if no errors, "abort" if errors detected
     """
-    errors = state.get("errors", [])
-    if len(errors) > 0:
-        print(f"[X] Error detected: {errors[-1]}")
-        print(f"[X] Aborting workflow to prevent token waste")
+    if _has_errors(state):
+        logger.error("[X] Error detected: %s", state["errors"][-1])
+        logger.error("[X] Aborting workflow to prevent token waste")
         return "abort"
     return "continue"
 
 
+def _guarded(next_fn: Callable[[AgentState], str]) -> Callable[[AgentState], str]:
+    """
+    Wrap a routing function so it routes to "abort" once an error is recorded.
+
+    Args:
+        next_fn: Routing function to consult when there are no errors
+
+    Returns:
+        Routing function for add_conditional_edges
+    """
+    def route(state: AgentState) -> str:
+        if check_for_errors(state) == "abort":
+            return "abort"
+        return next_fn(state)
+
+    route.__name__ = f"guarded_{next_fn.__name__}"
+    return route
+
+
 def create_workflow() -> StateGraph:
     """
     Create and compile the LangGraph workflow.
@@ -131,7 +251,10 @@ def create_workflow() -> StateGraph:
     workflow.add_node("validate_inputs", validate_inputs_node)
     workflow.add_node("parse_resume", parse_resume_node)
     workflow.add_node("analyze_job", analyze_job_node)
+    workflow.add_node("parse_inputs_batch", parse_inputs_batch_node)
+    workflow.add_node("join_inputs", join_inputs_node)
     workflow.add_node("analyze_gaps", analyze_gaps_node)
+    workflow.add_node("analyze_gaps_and_recommend", analyze_gaps_and_recommend_node)
     workflow.add_node("select_gaps", select_gaps_node)
     workflow.add_node("generate_recommendations", generate_recommendations_node)
     workflow.add_node("apply_recommendations", apply_recommendations_node)
@@ -141,72 +264,52 @@ def create_workflow() -> StateGraph:
     workflow.set_entry_point("validate_inputs")
 
     # Add edges
-    # After validation, check if we should continue
+    # After validation, fan out resume parsing and job analysis in parallel
     workflow.add_conditional_edges(
         "validate_inputs",
-        should_continue_workflow,
-        {
-            "continue": "parse_resume",
-            "end": "finalize"
-        }
+        dispatch_parsing,
+        ["parse_resume", "analyze_job", "parse_inputs_batch", "finalize"]
     )
 
-    # Parse resume - check for errors before continuing
+    # Both branches (or the single batch node) join, then check for errors before continuing
+    workflow.add_edge(["parse_resume", "analyze_job"], "join_inputs")
+    workflow.add_edge("parse_inputs_batch", "join_inputs")
     workflow.add_conditional_edges(
-        "parse_resume",
-        check_for_errors,
+        "join_inputs",
+        _guarded(choose_analysis),
         {
-            "continue": "analyze_job",
-            "abort": "finalize"
-        }
-    )
-
-    # After job analysis - check for errors before continuing
-    workflow.add_conditional_edges(
-        "analyze_job",
-        check_for_errors,
-        {
-            "continue": "analyze_gaps",
-            "abort": "finalize"
+            "abort": "finalize",
+            "analyze_gaps": "analyze_gaps",
+            "analyze_gaps_and_recommend": "analyze_gaps_and_recommend"
         }
     )
 
     # After gap analysis - check for errors, then decide on gap selection
-    def check_errors_then_select_gaps(state: AgentState) -> Literal["abort", "select_gaps", "generate_recommendations"]:
-        """First check errors, then route to gap selection or recommendations."""
-        if check_for_errors(state) == "abort":
-            return "abort"
-        return should_select_gaps(state)
-
     workflow.add_conditional_edges(
         "analyze_gaps",
-        check_errors_then_select_gaps,
+        _guarded(should_select_gaps),
         {
             "abort": "finalize",
             "select_gaps": "select_gaps",
-            "generate_recommendations": "generate_recommendations"
+            "generate_recommendations": "generate_recommendations",
+            "skip": "finalize"
         }
     )
 
     # After gap selection, proceed to recommendations
     workflow.add_edge("select_gaps", "generate_recommendations")
 
-    # After recommendations - check for errors, then decide on applying edits
-    def check_errors_then_apply(state: AgentState) -> Literal["abort", "apply_edits", "skip_edits"]:
-        """First check errors, then route to apply or skip."""
-        if check_for_errors(state) == "abort":
-            return "abort"
-        return should_apply_edits(state)
-
-    workflow.add_conditional_edges(
-        "generate_recommendations",
-        check_errors_then_apply,
-        {
-            "abort": "finalize",
-            "apply_edits": "apply_recommendations",
-            "skip_edits": "finalize"
-        }
-    )
+    # Recommendations and ATS risk scoring run concurrently - check for errors, then decide on applying edits
+    for source in ("generate_recommendations", "analyze_gaps_and_recommend"):
+        workflow.add_conditional_edges(
+            source,
+            _guarded(should_apply_edits),
+            {
+                "abort": "finalize",
+                "apply_edits": "apply_recommendations",
+                "skip_edits": "finalize"
+            }
+        )
 
     # After applying recommendations, finalize
     workflow.add_edge("apply_recommendations", "finalize")
@@ -242,12 +345,40 @@ def create_apply_workflow() -> StateGraph:
     return workflow.compile()
 
 
+@lru_cache(maxsize=1)
+def get_workflow_app():
+    """
+    Get the compiled full workflow, building it on first use.
+
+    The graph is static, so it is compiled once per process and reused;
+    compiled graphs keep no per-run state and are safe to invoke repeatedly.
+
+    Returns:
+        Compiled StateGraph from create_workflow()
+    """
+    return create_workflow()
+
+
+@lru_cache(maxsize=1)
+def get_apply_workflow_app():
+    """
+    Get the compiled apply-only workflow, building it on first use.
+
+    Returns:
+        Compiled StateGraph from create_apply_workflow()
+    """
+    return create_apply_workflow()
+
+
 def run_workflow(resume_tex: str,
                  job_description: str,
                  resume_path: str,
                  job_path: str,
                  interactive_gap_selection: bool = True,
-                 auto_select_gap_severity: str = "") -> AgentState:
+                 auto_select_gap_severity: str = "",
+                 batch_parsing: bool = False,
+                 fused_analysis: bool = True,
+                 skip_threshold: Optional[float] = None) -> AgentState:
     """
     Run the complete resume optimization workflow.
 
@@ -258,6 +389,13 @@ def run_workflow(resume_tex: str,
         job_path: Path to job description file
         interactive_gap_selection: Enable interactive gap selection
         auto_select_gap_severity: Auto-select gaps by severity (high, medium, low)
+        batch_parsing: Parse the resume and job description via the Message
+            Batches API (cheaper, but may take minutes)
+        fused_analysis: Identify gaps and generate recommendations in one
+            Claude call when gap selection is not interactive
+        skip_threshold: Skip recommendations and edits when keyword coverage
+            (percentage of job keywords in the resume) reaches this value and
+            no gap is high severity
 
     Returns:
         Final agent state with results
@@ -272,6 +410,9 @@ def run_workflow(resume_tex: str,
         job_path=job_path
     )
     initial_state["interactive_gap_selection"] = interactive_gap_selection
+    initial_state["batch_parsing"] = batch_parsing
+    initial_state["fused_analysis"] = fused_analysis
+    initial_state["skip_threshold"] = skip_threshold
     if auto_select_gap_severity:
         initial_state["auto_select_gap_severity"] = auto_select_gap_severity
 
@@ -280,12 +421,27 @@ def run_workflow(resume_tex: str,
     print("STARTING RESUME OPTIMIZATION WORKFLOW")
     print("="*60 + "\n")
 
-    app = create_workflow()
-    final_state = app.invoke(initial_state)
+    app = get_workflow_app()
+    final_state = asyncio.run(app.ainvoke(initial_state))
 
     return final_state
 
 
+def prefetch_selection(previous_state: AgentState, predicted_ids: list):
+    """
+    Start applying a predicted recommendation selection in the background.
+
+    Call after run_workflow() and before asking the user to choose; if
+    run_workflow_with_user_selection() is later called with the same
+    selection, it uses the prefetched edit instead of calling Claude again.
+
+    Args:
+        previous_state: State from phase 1 (with recommendations generated)
+        predicted_ids: Recommendation IDs the user is expected to accept
+    """
+    get_latex_editor_agent().prefetch({**previous_state, "user_accepted_recommendations": predicted_ids})
+
+
 def run_workflow_with_user_selection(
     resume_tex: str,
     job_description: str,
@@ -313,34 +469,38 @@ def run_workflow_with_user_selection(
 
     Returns:
         Final agent state with results
-    """
-    from .state import create_initial_state
 
-    if previous_state:
-        # REUSE previous state! Don't recreate from scratch
-        state = dict(previous_state)  # Make a copy
-        state["user_accepted_recommendations"] = accepted_recommendation_ids
-        print("[OK] Reusing previous analysis state (saves ~3000 tokens)")
-    else:
-        # Fallback: create initial state (expensive, only if previous_state not provided)
-        print("[WARNING] No previous state provided, creating new state")
-        state = create_initial_state(
-            resume_tex=resume_tex,
-            job_description=job_description,
-            resume_path=resume_path,
-            job_path=job_path
+    Raises:
+        ValueError: If previous_state is not provided
+    """
+    if not previous_state:
+        # Re-running the full workflow here would repeat every Claude call
+        raise ValueError(
+            "previous_state is required; run run_workflow() first and pass its result"
         )
-        state["user_accepted_recommendations"] = accepted_recommendation_ids
 
-        if selected_gap_ids:
-            state["user_selected_gaps"] = selected_gap_ids
+    # REUSE previous state! Don't recreate from scratch. Nodes return partial
+    # updates, so a shallow copy with the selections overlaid is enough
+    state = {**previous_state, "user_accepted_recommendations": accepted_recommendation_ids}
+    if selected_gap_ids:
+        state["user_selected_gaps"] = selected_gap_ids
+    print("[OK] Reusing previous analysis state (saves ~3000 tokens)")
+
+    # Phase 1 already applied every recommendation; accepting all of them
+    # needs no further edit call
+    all_ids = {r["recommendation_id"] for r in previous_state.get("recommendations") or []}
+    if (previous_state.get("user_accepted_recommendations") is None
+            and previous_state.get("modified_resume_tex") and not previous_state.get("errors")
+            and not selected_gap_ids and set(accepted_recommendation_ids) == all_ids):
+        print("[OK] Selection matches the edits already applied")
+        return state
 
     print("\n" + "="*60)
     print("APPLYING SELECTED RECOMMENDATIONS")
     print("="*60 + "\n")
 
     # Use minimal workflow - ONLY apply and finalize (saves tokens!)
-    app = create_apply_workflow()
-    final_state = app.invoke(state)
+    app = get_apply_workflow_app()
+    final_state = asyncio.run(app.ainvoke(state))
 
     return final_state
@@ -5,15 +5,56 @@ Provides a clean interface for interacting with the Anthropic Claude API.
 Handles authentication, request formatting, and error handling.
 """
 
+import asyncio
+import atexit
+import importlib.util
+import json
 import os
-from typing import Optional, Dict, Any, List
-from anthropic import Anthropic
+import re
+import threading
+import time
+from typing import Optional, Dict, Any, List, AsyncIterator, Callable
+from anthropic import (
+    Anthropic,
+    AsyncAnthropic,
+    DEFAULT_CONNECTION_LIMITS,
+    DefaultAsyncHttpxClient,
+    DefaultHttpxClient,
+)
 from dotenv import load_dotenv
-import json
+import orjson
+from .exact_cache import get_exact_cache
+from .semantic_cache import get_semantic_cache
+from .token_budget import estimate_max_tokens
+from ..nlp.keyword_extractor import extract_key_phrases, merge_keywords, prefilter_keywords
+from ..nlp.similarity import embedding_similarity, similarity_score
 
 # Load environment variables
 load_dotenv()
 
+DEFAULT_MODEL = "claude-sonnet-4-5-20250929"
+
+# HTTP/2 multiplexes concurrent requests over one connection when h2 is installed
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Built from the SDK's own Limits type so it matches the httpx package the SDK uses
+_HTTP_LIMITS = type(DEFAULT_CONNECTION_LIMITS)(
+    max_connections=DEFAULT_CONNECTION_LIMITS.max_connections,
+    max_keepalive_connections=20,
+)
+
+# Retries of 429/5xx/connection errors, left to the SDK's jittered exponential
+# backoff (which honors retry-after) on both the sync and async clients
+_MAX_RETRIES = 4
+
+# Message batches still running after this long are cancelled (they may take up to 24h)
+BATCH_TIMEOUT_SECONDS = 30 * 60
+
+# Body of the first markdown code fence, tolerating a language tag and whitespace
+_FENCE_RE = re.compile(r"```[a-zA-Z0-9_-]*\s*\n?(.*?)```", re.DOTALL)
+_JSON_START_RE = re.compile(r"[{\[]")
+_JSON_DECODER = json.JSONDecoder()
+
 
 class ClaudeClient:
     """Wrapper for Anthropic Claude API"""
@@ -41,10 +82,22 @@ class ClaudeClient:
                 "or pass api_key parameter."
             )
 
-        self.model = model or os.getenv("CLAUDE_MODEL", "claude-sonnet-4-5-20250929")
+        self.model = model or os.getenv("CLAUDE_MODEL", DEFAULT_MODEL)
         self.max_tokens = max_tokens
         self.temperature = temperature
-        self.client = Anthropic(api_key=self.api_key)
+        # Pooled keep-alive connections are reused across every agent call
+        self.client = Anthropic(
+            api_key=self.api_key,
+            http_client=DefaultHttpxClient(http2=_HTTP2_AVAILABLE, limits=_HTTP_LIMITS),
+            max_retries=_MAX_RETRIES,
+        )
+        # Caps in-flight async requests so fan-outs stay under the account's rate limit
+        self.concurrency = int(os.getenv("CLAUDE_CONCURRENCY", "8"))
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_client: Optional[AsyncAnthropic] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.exact_cache = get_exact_cache()
+        self.semantic_cache = get_semantic_cache()
 
     def generate(
         self,
@@ -52,6 +105,8 @@ class ClaudeClient:
         system_prompt: str,
         max_tokens: int,
         temperature: float,
+        cache_segments: Optional[List[str]] = None,
+        use_cache: bool = True,
     ) -> str:
         """
         Generate a response from Claude.
@@ -61,35 +116,176 @@ class ClaudeClient:
             system_prompt: System prompt to guide behavior
             max_tokens: Maximum tokens in response
             temperature: Sampling temperature (0-1)
+            cache_segments: Large, stable context blocks (e.g. the resume) sent
+                ahead of the system prompt and marked for Anthropic prompt caching
+            use_cache: Set False for high-temperature calls whose output should
+                vary between runs, bypassing the exact-match cache
 
         Returns:
             The generated text response
 
+        Raises:
+            Exception: If API call fails
+        """
+        cache_key = self._exact_key(prompt, system_prompt, max_tokens, cache_segments, temperature, "text") \
+            if use_cache else None
+        if cache_key is not None:
+            cached = self.exact_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        text = self._create(self._message_params(
+            prompt, system_prompt, max_tokens, temperature, cache_segments
+        ))
+
+        if cache_key is not None:
+            self.exact_cache.put(cache_key, text)
+        return text
+
+    def _create(
+        self,
+        message_params: Dict[str, Any],
+        on_token: Optional[Callable[[str], None]] = None,
+    ) -> str:
+        """
+        Send a request to Claude and return the response text.
+
+        The response is streamed and the chunks joined at the end, so text
+        is read off the socket as it is generated rather than in one block.
+
+        Args:
+            message_params: Request parameters from _message_params()
+            on_token: Called with each text chunk as it arrives
+
+        Raises:
+            Exception: If API call fails
+        """
+        try:
+            chunks: List[str] = []
+            with self.client.messages.stream(**message_params) as stream:
+                for text in stream.text_stream:
+                    chunks.append(text)
+                    if on_token is not None:
+                        on_token(text)
+
+            return "".join(chunks)
+
+        except Exception as e:
+            raise Exception(f"Claude API error: {str(e)}")
+
+    async def _acreate(self, message_params: Dict[str, Any]) -> str:
+        """
+        Async variant of _create() under the concurrency limit.
+
         Raises:
             Exception: If API call fails
         """
         try:
-            message_params = {
-                "model": self.model,
-                "max_tokens": max_tokens,
-                "temperature": temperature,
-                "messages": [{"role": "user", "content": prompt}],
-                "system": system_prompt
-            }
+            async_client, semaphore = self._async_resources()
 
-            response = self.client.messages.create(**message_params)
+            async with semaphore:
+                response = await async_client.messages.create(**message_params)
 
-            # Extract text from response
             return response.content[0].text
 
         except Exception as e:
             raise Exception(f"Claude API error: {str(e)}")
 
+    async def _astream_text(self, message_params: Dict[str, Any]) -> AsyncIterator[str]:
+        """
+        Stream response text under the concurrency limit.
+
+        Raises:
+            Exception: If API call fails
+        """
+        try:
+            async_client, semaphore = self._async_resources()
+
+            async with semaphore:
+                async with async_client.messages.stream(**message_params) as stream:
+                    async for text in stream.text_stream:
+                        yield text
+
+        except Exception as e:
+            raise Exception(f"Claude API error: {str(e)}")
+
+    def _async_resources(self):
+        """
+        Get the async client and concurrency semaphore for the running event loop.
+
+        Both are bound to the loop they are first used on, so they are
+        recreated when a new loop is started (e.g. a second asyncio.run).
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            self._async_loop = loop
+            self._async_client = AsyncAnthropic(
+                api_key=self.api_key,
+                http_client=DefaultAsyncHttpxClient(http2=_HTTP2_AVAILABLE, limits=_HTTP_LIMITS),
+                max_retries=_MAX_RETRIES,
+            )
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._async_client, self._semaphore
+
+    def close(self):
+        """
+        Close the pooled HTTP connections.
+
+        The async client is bound to the event loop that created it, so it is
+        released rather than closed; a later async call creates a new one.
+        """
+        self.client.close()
+        self._async_loop = None
+        self._async_client = None
+        self._semaphore = None
+
+    def _message_params(
+        self,
+        prompt: str,
+        system_prompt: str,
+        max_tokens: int,
+        temperature: float,
+        cache_segments: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Build the request parameters shared by the sync and async paths."""
+        return {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "messages": [{"role": "user", "content": prompt}],
+            "system": self._system_blocks(system_prompt, cache_segments)
+        }
+
+    @staticmethod
+    def _system_blocks(
+        system_prompt: str,
+        cache_segments: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Build the system parameter as content blocks with cache breakpoints.
+
+        Anthropic's prompt cache matches on prefixes, so the shared context
+        segments come first: every agent that sends the same resume reuses
+        one cached prefix regardless of its own system prompt. The system
+        prompt follows with its own breakpoint, so repeated calls by the
+        same agent also reuse it.
+        """
+        cache_control = {"type": "ephemeral"}
+        blocks = [
+            {"type": "text", "text": segment, "cache_control": cache_control}
+            for segment in cache_segments or []
+        ]
+        blocks.append({"type": "text", "text": system_prompt, "cache_control": cache_control})
+        return blocks
+
     def generate_structured(
         self,
         prompt: str,
         system_prompt: str,
         max_tokens: int,
+        cache_segments: Optional[List[str]] = None,
+        stage: Optional[str] = None,
+        on_token: Optional[Callable[[str], None]] = None,
     ) -> Dict[str, Any]:
         """
         Generate a structured response (JSON) from Claude.
@@ -98,6 +294,10 @@ class ClaudeClient:
             prompt: The user prompt
             system_prompt: System prompt to guide behavior
             max_tokens: Maximum tokens in response
+            cache_segments: Cached context blocks sent ahead of the system prompt
+            stage: Workflow stage name; enables the semantic cache namespace
+            on_token: Called with each text chunk as it streams in (e.g. to
+                drive a progress display); not called on a cache hit
 
         Returns:
             Parsed JSON response as dictionary
@@ -105,58 +305,321 @@ class ClaudeClient:
         Raises:
             Exception: If API call fails or response is not valid JSON
         """
-        # Add JSON formatting instruction to prompt
-        json_prompt = f"{prompt}\n\nPlease respond with valid JSON only, no additional text."
+        cache_key = self._exact_key(prompt, system_prompt, max_tokens, cache_segments)
+        cached = self._cache_lookup(cache_key, stage, prompt, system_prompt, cache_segments)
+        if cached is not None:
+            return cached
+
+        # Structured responses are cached parsed, so skip the text cache tier
+        response_text = self._create(self._message_params(
+            self._json_prompt(prompt),
+            system_prompt,
+            max_tokens,
+            0.3,  # Lower temperature for structured output
+            cache_segments,
+        ), on_token)
+
+        result = self._parse_json(response_text)
+        self._cache_store(cache_key, stage, prompt, system_prompt, cache_segments, result)
+        return result
+
+    async def agenerate_structured(
+        self,
+        prompt: str,
+        system_prompt: str,
+        max_tokens: int,
+        cache_segments: Optional[List[str]] = None,
+        stage: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Async variant of generate_structured().
+
+        Args:
+            prompt: The user prompt
+            system_prompt: System prompt to guide behavior
+            max_tokens: Maximum tokens in response
+            cache_segments: Cached context blocks sent ahead of the system prompt
+            stage: Workflow stage name; enables the semantic cache namespace
+
+        Returns:
+            Parsed JSON response as dictionary
+
+        Raises:
+            Exception: If API call fails or response is not valid JSON
+        """
+        cache_key = self._exact_key(prompt, system_prompt, max_tokens, cache_segments)
+        cached = self._cache_lookup(cache_key, stage, prompt, system_prompt, cache_segments)
+        if cached is not None:
+            return cached
+
+        response_text = await self._acreate(self._message_params(
+            self._json_prompt(prompt), system_prompt, max_tokens, 0.3, cache_segments
+        ))
+
+        result = self._parse_json(response_text)
+        self._cache_store(cache_key, stage, prompt, system_prompt, cache_segments, result)
+        return result
 
-        response_text = self.generate(
-            prompt=json_prompt,
-            system_prompt=system_prompt,
-            max_tokens=max_tokens,
-            temperature=0.3,  # Lower temperature for structured output
+    async def astream_structured(
+        self,
+        prompt: str,
+        system_prompt: str,
+        max_tokens: int,
+        cache_segments: Optional[List[str]] = None,
+        stage: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streaming variant of agenerate_structured() that reports progress.
+
+        Text deltas are collected into a byte buffer as they arrive and the
+        JSON is parsed once the stream completes.
+
+        Args:
+            prompt: The user prompt
+            system_prompt: System prompt to guide behavior
+            max_tokens: Maximum tokens in response
+            cache_segments: Cached context blocks sent ahead of the system prompt
+            stage: Workflow stage name; enables the semantic cache namespace
+
+        Yields:
+            {"type": "progress", "bytes": n} after each delta, then
+            {"type": "result", "data": parsed_json} once complete
+
+        Raises:
+            Exception: If API call fails or response is not valid JSON
+        """
+        cache_key = self._exact_key(prompt, system_prompt, max_tokens, cache_segments)
+        cached = self._cache_lookup(cache_key, stage, prompt, system_prompt, cache_segments)
+        if cached is not None:
+            yield {"type": "result", "data": cached}
+            return
+
+        buffer = bytearray()
+        message_params = self._message_params(
+            self._json_prompt(prompt), system_prompt, max_tokens, 0.3, cache_segments
         )
+        async for text in self._astream_text(message_params):
+            buffer += text.encode()
+            yield {"type": "progress", "bytes": len(buffer)}
+
+        result = self._parse_json(buffer.decode())
+        self._cache_store(cache_key, stage, prompt, system_prompt, cache_segments, result)
+        yield {"type": "result", "data": result}
+
+    def generate_structured_batch(
+        self,
+        requests: List[Dict[str, Any]],
+        poll_interval: float = 10.0,
+        timeout: Optional[float] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Generate structured responses for many prompts via the Message Batches API.
+
+        Batches are billed at a discount and processed asynchronously by
+        Anthropic, so this suits non-interactive runs over many inputs.
+
+        Args:
+            requests: Dicts with "prompt", "system_prompt", "max_tokens" and
+                optionally "cache_segments" and "model" (defaults to this
+                client's model)
+            poll_interval: Seconds between batch status checks
+            timeout: Seconds to wait for the batch before cancelling it
+                (defaults to CLAUDE_BATCH_TIMEOUT or BATCH_TIMEOUT_SECONDS)
+            cancel_event: When set (e.g. by a caller running this in a
+                thread), the batch is cancelled and polling stops
 
-        # Try to extract JSON from response
+        Returns:
+            Parsed JSON responses in input order (None for failed requests)
+
+        Raises:
+            Exception: If the batch cannot be submitted or polled, times out
+                or is cancelled
+        """
+        if timeout is None:
+            timeout = float(os.getenv("CLAUDE_BATCH_TIMEOUT", str(BATCH_TIMEOUT_SECONDS)))
+        stop = cancel_event or threading.Event()
+        batch = None
+        try:
+            batch = self.client.messages.batches.create(requests=[
+                {
+                    "custom_id": f"request-{i}",
+                    "params": {
+                        **self._message_params(
+                            self._json_prompt(req["prompt"]),
+                            req["system_prompt"],
+                            req["max_tokens"],
+                            0.3,
+                            req.get("cache_segments"),
+                        ),
+                        "model": req.get("model", self.model),
+                    },
+                }
+                for i, req in enumerate(requests)
+            ])
+
+            deadline = time.monotonic() + timeout
+            while batch.processing_status != "ended":
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or stop.wait(min(poll_interval, remaining)):
+                    self._cancel_batch(batch.id)
+                    reason = "was cancelled" if stop.is_set() else f"timed out after {timeout:g}s"
+                    raise Exception(f"Batch {batch.id} {reason}")
+                batch = self.client.messages.batches.retrieve(batch.id)
+
+            results: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+            for entry in self.client.messages.batches.results(batch.id):
+                index = int(entry.custom_id.rsplit("-", 1)[1])
+                if entry.result.type != "succeeded":
+                    print(f"[WARNING] Batch request {entry.custom_id} {entry.result.type}")
+                    continue
+                try:
+                    results[index] = self._parse_json(entry.result.message.content[0].text)
+                except Exception as e:
+                    print(f"[WARNING] Batch request {entry.custom_id} failed: {e}")
+
+            return results
+
+        except KeyboardInterrupt:
+            if batch is not None and batch.processing_status != "ended":
+                self._cancel_batch(batch.id)
+            raise
+        except Exception as e:
+            raise Exception(f"Claude batch API error: {str(e)}")
+
+    def _cancel_batch(self, batch_id: str):
+        """Request cancellation of a message batch, warning if that fails."""
         try:
-            # Remove markdown code blocks if present
-            cleaned = response_text.strip()
-            if cleaned.startswith("```json"):
-                cleaned = cleaned[7:]
-            if cleaned.startswith("```"):
-                cleaned = cleaned[3:]
-            if cleaned.endswith("```"):
-                cleaned = cleaned[:-3]
+            self.client.messages.batches.cancel(batch_id)
+            print(f"[WARNING] Cancelled message batch {batch_id}")
+        except Exception as e:
+            print(f"[WARNING] Could not cancel message batch {batch_id}: {e}")
+
+    def _exact_key(
+        self,
+        prompt: str,
+        system_prompt: str,
+        max_tokens: int,
+        cache_segments: Optional[List[str]],
+        temperature: float = 0.3,
+        kind: str = "json",
+    ) -> Optional[str]:
+        """Compute the exact-match cache key, or None when the cache is disabled."""
+        if self.exact_cache is None:
+            return None
+        return self.exact_cache.make_key(
+            system_prompt, prompt, self.model, max_tokens, cache_segments, temperature, kind
+        )
+
+    def _cache_lookup(
+        self,
+        cache_key: Optional[str],
+        stage: Optional[str],
+        prompt: str,
+        system_prompt: str,
+        cache_segments: Optional[List[str]],
+    ) -> Optional[Dict[str, Any]]:
+        """Check the exact-match cache first, then the semantic cache."""
+        if cache_key is not None:
+            cached = self.exact_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        if self.semantic_cache is not None and stage is not None:
+            return self.semantic_cache.get(stage, prompt, system_prompt, cache_segments)
+        return None
+
+    def _cache_store(
+        self,
+        cache_key: Optional[str],
+        stage: Optional[str],
+        prompt: str,
+        system_prompt: str,
+        cache_segments: Optional[List[str]],
+        result: Dict[str, Any],
+    ):
+        """Record a structured response in every enabled cache tier."""
+        if cache_key is not None:
+            self.exact_cache.put(cache_key, result)
+        if self.semantic_cache is not None and stage is not None:
+            self.semantic_cache.put(stage, prompt, system_prompt, result, cache_segments)
+
+    @staticmethod
+    def _json_prompt(prompt: str) -> str:
+        """Add JSON formatting instruction to prompt."""
+        return f"{prompt}\n\nPlease respond with valid JSON only, no additional text."
+
+    @staticmethod
+    def _parse_json(response_text: str) -> Dict[str, Any]:
+        """
+        Extract and parse JSON from a raw model response.
 
-            return json.loads(cleaned.strip())
+        Raises:
+            Exception: If the response is not valid JSON
+        """
+        # Prefer the contents of a markdown code fence if present
+        fence = _FENCE_RE.search(response_text)
+        cleaned = (fence.group(1) if fence else response_text).strip()
 
-        except json.JSONDecodeError as e:
-            raise Exception(f"Failed to parse JSON response: {str(e)}\nResponse: {response_text}")
+        try:
+            return orjson.loads(cleaned)
+        except orjson.JSONDecodeError as e:
+            error = e
+
+        # Fall back to decoding from the first object/array in the raw
+        # response, ignoring surrounding prose, fences or trailing text
+        for match in _JSON_START_RE.finditer(response_text):
+            try:
+                result, _ = _JSON_DECODER.raw_decode(response_text, match.start())
+                return result
+            except json.JSONDecodeError:
+                continue
+
+        raise Exception(f"Failed to parse JSON response: {str(error)}\nResponse: {response_text}")
 
     def extract_keywords(
         self,
         text: str,
         context: str,
         max_keywords: int,
+        use_llm: bool = False,
     ) -> List[str]:
         """
-        Extract important keywords from text using Claude.
+        Extract important keywords from text.
+
+        Dictionary keywords are matched locally first. By default the
+        sentences the dictionary found nothing in are mined for key phrases
+        locally as well; with use_llm=True Claude is asked for additions from
+        those sentences instead, and is skipped entirely when the dictionary
+        alone fills max_keywords.
 
         Args:
             text: The text to analyze
             context: Context description (e.g., "resume" or "job description")
             max_keywords: Maximum number of keywords to extract
+            use_llm: Ask Claude for keywords beyond the dictionary matches
 
         Returns:
             List of extracted keywords
         """
-        prompt = f"""Extract the {max_keywords} most important keywords and key phrases from the following {context}.
+        local_keywords, remaining = prefilter_keywords(text)
+        wanted = max_keywords - len(local_keywords)
+        if wanted <= 0 or not remaining:
+            return local_keywords[:max_keywords]
+        if not use_llm:
+            return merge_keywords(local_keywords, extract_key_phrases(remaining, wanted))[:max_keywords]
+
+        prompt = f"""Extract up to {wanted} important keywords and key phrases from the following {context} excerpt.
 Focus on:
 - Technical skills and tools
 - Industry-specific terms
 - Action verbs and competencies
 - Qualifications and certifications
 
+Only return keywords NOT in this already-extracted set: {", ".join(local_keywords)}
+
 Text:
-{text}
+{remaining}
 
 Return only a JSON array of keywords, like: ["keyword1", "keyword2", ...]"""
 
@@ -164,36 +627,66 @@ Return only a JSON array of keywords, like: ["keyword1", "keyword2", ...]"""
             result = self.generate_structured(
                 prompt=prompt,
                 system_prompt="You are a keyword extraction expert.",
-                max_tokens=2000
+                stage="extract_keywords",
+                max_tokens=estimate_max_tokens("extract_keywords", items=wanted)
             )
             if isinstance(result, list):
-                return result
+                llm_keywords = result
             elif isinstance(result, dict) and "keywords" in result:
-                return result["keywords"]
+                llm_keywords = result["keywords"]
             else:
-                return []
+                llm_keywords = []
         except Exception as e:
             print(f"Warning: Keyword extraction failed: {e}")
-            return []
+            llm_keywords = []
+
+        return merge_keywords(local_keywords, llm_keywords)[:max_keywords]
 
     def calculate_similarity(
         self,
         text1: str,
         text2: str,
         context: str,
+        use_llm: bool = False,
+        use_embeddings: bool = False,
     ) -> float:
         """
-        Calculate semantic similarity between two texts using Claude.
+        Calculate similarity between two texts.
+
+        By default this is a local, deterministic term-frequency cosine score;
+        pass use_llm=True to have Claude judge semantic similarity instead.
 
         Args:
             text1: First text (e.g., resume)
             text2: Second text (e.g., job description)
-            context: Context for the comparison
+            context: Context for the comparison (used by the LLM path)
+            use_llm: Ask Claude for the score instead of computing it locally
+            use_embeddings: Score locally with sentence embeddings when
+                sentence-transformers is installed (term-frequency cosine otherwise)
 
         Returns:
             Similarity score from 0 to 100
         """
-        prompt = f"""Calculate the semantic similarity between these two texts for {context}.
+        if not use_llm:
+            score = embedding_similarity(text1, text2) if use_embeddings else None
+            return score if score is not None else similarity_score(text1, text2)
+
+        try:
+            result = self.generate_structured(
+                prompt=self._similarity_prompt(text1, text2, context),
+                system_prompt="You are a semantic similarity analysis expert.",
+                stage="calculate_similarity",
+                max_tokens=estimate_max_tokens("calculate_similarity")
+            )
+            return float(result.get("score", 0))
+        except Exception as e:
+            print(f"Warning: Similarity calculation failed: {e}")
+            return 0.0
+
+    @staticmethod
+    def _similarity_prompt(text1: str, text2: str, context: str) -> str:
+        """Build the prompt for the LLM similarity score."""
+        return f"""Calculate the semantic similarity between these two texts for {context}.
 
 Text 1:
 {text1}
@@ -208,30 +701,50 @@ Return a JSON object with:
 
 Example: {{"score": 75, "reasoning": "Strong match on technical skills, missing some required experience"}}"""
 
-        try:
-            result = self.generate_structured(
-                prompt=prompt,
-                system_prompt="You are a semantic similarity analysis expert.",
-                max_tokens=1000
-            )
-            return float(result.get("score", 0))
-        except Exception as e:
-            print(f"Warning: Similarity calculation failed: {e}")
-            return 0.0
 
+# Shared instances, one per model
+_default_clients: Dict[str, ClaudeClient] = {}
+_default_client_lock = threading.Lock()
+
+
+def stage_model(stage: str) -> Optional[str]:
+    """
+    Get the model configured for a workflow stage.
+
+    Set CLAUDE_MODEL_<STAGE> (e.g. CLAUDE_MODEL_JOB_ANALYZER) to route a
+    stage to a different model, such as a cheaper one for extraction tasks.
 
-# Singleton instance for easy import
-_default_client: Optional[ClaudeClient] = None
+    Args:
+        stage: Agent name (e.g. "job_analyzer")
+
+    Returns:
+        Model name, or None to use the default model
+    """
+    return os.getenv(f"CLAUDE_MODEL_{stage.upper()}") or None
 
 
-def get_claude_client() -> ClaudeClient:
+def get_claude_client(model: Optional[str] = None) -> ClaudeClient:
     """
-    Get or create the default Claude client instance.
+    Get or create the shared Claude client for a model.
+
+    Each instance (and its HTTP connection pool) is shared by all agents
+    using that model. Sync nodes run on LangGraph worker threads, so
+    creation is locked to guarantee a single instance per model even when
+    first requested concurrently.
+
+    Args:
+        model: Model name (defaults to CLAUDE_MODEL or claude-sonnet-4-5)
 
     Returns:
-        Singleton ClaudeClient instance
+        Shared ClaudeClient instance for the model
     """
-    global _default_client
-    if _default_client is None:
-        _default_client = ClaudeClient()
-    return _default_client
+    model = model or os.getenv("CLAUDE_MODEL", DEFAULT_MODEL)
+    client = _default_clients.get(model)
+    if client is None:
+        with _default_client_lock:
+            client = _default_clients.get(model)
+            if client is None:
+                client = ClaudeClient(model=model)
+                atexit.register(client.close)
+                _default_clients[model] = client
+    return client
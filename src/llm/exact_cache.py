@@ -0,0 +1,113 @@
+"""
+Exact-Match Response Cache
+
+Disk-backed cache for Claude responses, both raw text and parsed JSON. The
+key is a SHA-256 of the full request context (response kind, system prompt,
+cached context blocks, prompt, model, max_tokens and temperature), so an
+identical call returns the stored response without an API round-trip.
+Entries expire after a TTL (7 days by default). Useful for replaying runs
+during development and in CI.
+"""
+
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Any, List, Optional
+
+import orjson
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "resume-optimizer" / "llm"
+DEFAULT_TTL_DAYS = 7.0
+
+
+class ExactCache:
+    """File-per-key JSON cache keyed by request hash"""
+
+    def __init__(self, cache_dir: Optional[Path] = None, ttl_days: float = DEFAULT_TTL_DAYS):
+        """
+        Initialize the exact-match cache.
+
+        Args:
+            cache_dir: Directory for cache files (defaults to ~/.cache/resume-optimizer/llm)
+            ttl_days: Age in days after which an entry is treated as a miss
+        """
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
+        self.ttl_seconds = ttl_days * 86400
+
+    @staticmethod
+    def make_key(system_prompt: str, prompt: str, model: str, max_tokens: int,
+                 context: Optional[List[str]] = None, temperature: Optional[float] = None,
+                 kind: str = "json") -> str:
+        """
+        Build the cache key for a request.
+
+        Args:
+            system_prompt: The system prompt
+            prompt: The user prompt
+            model: Model name
+            max_tokens: Maximum tokens in response
+            context: Additional context blocks sent with the request
+            temperature: Sampling temperature
+            kind: Response kind ("text" or "json") so both never share an entry
+
+        Returns:
+            Hex SHA-256 digest identifying the request
+        """
+        parts = [kind, system_prompt, *(context or []), prompt, model, str(max_tokens), repr(temperature)]
+        return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Request key from make_key()
+
+        Returns:
+            The cached response, or None on a miss
+        """
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl_seconds:
+                path.unlink(missing_ok=True)
+                return None
+            return orjson.loads(path.read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return None
+
+    def put(self, key: str, value: Any):
+        """
+        Store a response.
+
+        Writes go to a temporary file first and are renamed into place so a
+        concurrent reader never sees a partial entry.
+
+        Args:
+            key: Request key from make_key()
+            value: JSON-serializable response
+        """
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(orjson.dumps(value))
+        os.replace(tmp_path, path)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+
+def get_exact_cache() -> Optional[ExactCache]:
+    """
+    Get an exact-match cache if enabled via CLAUDE_CACHE.
+
+    Returns:
+        ExactCache rooted at CLAUDE_CACHE_DIR, or None when disabled
+    """
+    if os.getenv("CLAUDE_CACHE", "0").lower() not in ("1", "true", "yes"):
+        return None
+    cache_dir = os.getenv("CLAUDE_CACHE_DIR")
+    return ExactCache(
+        Path(cache_dir).expanduser() if cache_dir else None,
+        ttl_days=float(os.getenv("CLAUDE_CACHE_TTL_DAYS", str(DEFAULT_TTL_DAYS))),
+    )
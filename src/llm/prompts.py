@@ -5,6 +5,18 @@ This module contains system prompts and prompt templates for each agent
 in the resume optimization workflow.
 """
 
+import os
+from functools import lru_cache
+from typing import Any, Dict, List
+
+import orjson
+
+from ..utils.latex_patch import number_lines
+
+# Pretty-print JSON embedded in prompts only when debugging; Claude does not
+# need the indentation and compact output is faster to build and shorter.
+_PROMPT_JSON_OPTION = orjson.OPT_INDENT_2 if os.getenv("OPT_DEBUG_JSON") else 0
+
 # ============================================================================
 # LATEX PARSER AGENT
 # ============================================================================
@@ -29,10 +41,7 @@ Return structured data that maintains references to the original LaTeX code posi
 so that modifications can be applied later.
 """
 
-LATEX_PARSER_PROMPT_TEMPLATE = """Parse the following LaTeX resume and extract structured information.
-
-Resume:
-{resume_tex}
+LATEX_PARSER_PROMPT_TEMPLATE = """Parse the LaTeX resume provided in the system context and extract structured information.
 
 Extract all sections and their contents. For each section, identify:
 - Section name and type
@@ -50,8 +59,7 @@ Return JSON in this format:
       "keywords": ["...", "..."],
       "latex_lines": {{"start": 10, "end": 25}}
     }}
-  ],
-  "all_keywords": ["...", "..."]
+  ]
 }}
 """
 
@@ -78,10 +86,7 @@ Focus on:
 - Industry-specific terminology
 """
 
-JOB_ANALYZER_PROMPT_TEMPLATE = """Analyze the following job description and extract all requirements and keywords.
-
-Job Description:
-{job_description}
+JOB_ANALYZER_PROMPT_TEMPLATE = """Analyze the job description provided in the system context and extract all requirements and keywords.
 
 Extract:
 1. Job title and company (if mentioned)
@@ -104,7 +109,6 @@ Return JSON in this format:
       "keywords": ["...", "..."]
     }}
   ],
-  "all_keywords": ["...", "..."],
   "seniority_level": "entry|mid|senior|lead|executive"
 }}
 """
@@ -148,12 +152,10 @@ Parsed Resume Sections:
 Job Requirements:
 {job_requirements}
 
-Calculate:
-1. Overall similarity score (0-100)
-2. Keyword overlap percentage
-3. Missing keywords (present in job, absent in resume)
-4. Missing skills and qualifications
-5. Experience gaps
+Identify:
+1. Missing keywords (present in job, absent in resume)
+2. Missing skills and qualifications
+3. Experience gaps
 
 For each gap, assess severity:
 - HIGH: Required qualifications or critical keywords missing
@@ -162,8 +164,6 @@ For each gap, assess severity:
 
 Return JSON in this format:
 {{
-  "similarity_score": 75.5,
-  "keyword_overlap": 60.0,
   "gaps": [
     {{
       "gap_type": "missing_keyword|missing_skill|missing_experience|formatting",
@@ -247,6 +247,85 @@ Return JSON in this format:
 }}
 """
 
+# ============================================================================
+# FUSED GAP ANALYSIS + RECOMMENDATIONS
+# ============================================================================
+
+# Used when no gap selection happens between the two stages, so both arrays
+# come back from one call over the shared context.
+GAP_AND_RECOMMENDATION_SYSTEM_PROMPT = """You are an expert ATS (Applicant Tracking System) analyzer and resume consultant.
+
+Your responsibilities:
+1. Compare resume content against job requirements
+2. Identify missing keywords, skills and experience, prioritized by severity (high/medium/low)
+3. Generate specific, actionable recommendations that close those gaps
+4. Prioritize recommendations by impact and give a clear rationale for each
+5. Suggest specific LaTeX modifications when possible
+
+Each recommendation should:
+- Be specific and actionable
+- Suggest where in the resume to make changes
+- Add missing keywords naturally (no keyword stuffing)
+- Respect the candidate's actual experience (no fabrication)
+"""
+
+GAP_AND_RECOMMENDATION_PROMPT_TEMPLATE = """Compare this resume against the job requirements, identify gaps, then generate prioritized recommendations to close them.
+
+Resume Keywords and Content:
+{resume_keywords}
+
+Job Requirements and Keywords:
+{job_keywords}
+
+Parsed Resume Sections (keywords):
+{resume_sections}
+
+Resume Sections (content):
+{resume_excerpts}
+
+Job Requirements:
+{job_requirements}
+
+Current Similarity Score: {similarity_score}
+
+First identify:
+1. Missing keywords (present in job, absent in resume)
+2. Missing skills and qualifications
+3. Experience gaps
+
+For each gap, assess severity:
+- HIGH: Required qualifications or critical keywords missing
+- MEDIUM: Preferred qualifications or important skills missing
+- LOW: Minor keyword mismatches or formatting issues
+
+Then create recommendations that address high-severity gaps first. For each
+recommendation, provide a priority (1=highest, 5=lowest), category, specific
+action, rationale and suggested LaTeX modification (if applicable).
+
+Return JSON in this format:
+{{
+  "gaps": [
+    {{
+      "gap_type": "missing_keyword|missing_skill|missing_experience|formatting",
+      "description": "...",
+      "severity": "high|medium|low",
+      "related_requirement": "..."
+    }}
+  ],
+  "recommendations": [
+    {{
+      "recommendation_id": "rec_001",
+      "priority": 1,
+      "category": "keyword|experience|skills|formatting|other",
+      "description": "...",
+      "specific_action": "...",
+      "rationale": "...",
+      "latex_modification": "..."
+    }}
+  ]
+}}
+"""
+
 # ============================================================================
 # LATEX EDITOR AGENT
 # ============================================================================
@@ -268,12 +347,10 @@ Rules:
 - Keep LaTeX compilation-ready
 - Preserve special characters and formatting
 - Document all changes clearly
+- Edit by line-range patches; never repeat unchanged lines
 """
 
-LATEX_EDITOR_PROMPT_TEMPLATE = """Apply the following approved recommendations to the LaTeX resume.
-
-Original Resume:
-{resume_tex}
+LATEX_EDITOR_PROMPT_TEMPLATE = """Apply the following approved recommendations to the original LaTeX resume provided in the system context.
 
 Approved Recommendations:
 {recommendations}
@@ -282,26 +359,59 @@ Parsed Resume Structure:
 {resume_sections}
 
 Apply each recommendation carefully:
-1. Locate the appropriate section in the LaTeX code
+1. Locate the lines to change using the line numbers in the resume source
 2. Make the specified modification
 3. Preserve formatting and structure
 4. Ensure LaTeX syntax is valid
 
+Return only the changed lines as patches, not the full resume. Each patch
+replaces lines start_line..end_line (1-based, inclusive) with new_lines; set
+end_line to start_line - 1 to insert before start_line without replacing, and
+use an empty new_lines to delete. Patches must not overlap. new_lines holds raw
+LaTeX without the line-number prefixes.
+
 Return JSON in this format:
 {{
-  "modified_resume_tex": "...",  # Full modified LaTeX code
+  "patches": [
+    {{
+      "recommendation_id": "...",
+      "start_line": 12,
+      "end_line": 13,
+      "new_lines": ["...", "..."]
+    }}
+  ],
   "applied_changes": [
     {{
       "recommendation_id": "...",
       "change_description": "...",
-      "section_modified": "...",
-      "original_text": "...",
-      "new_text": "..."
+      "section_modified": "..."
     }}
   ]
 }}
 """
 
+# ============================================================================
+# SHARED CONTEXT
+# ============================================================================
+
+# The resume is sent as a separate, prompt-cached system block so that repeated
+# calls over the same resume reuse the cached prefix instead of re-sending it
+# inside each user prompt.
+RESUME_CONTEXT_TEMPLATE = """Original Resume (LaTeX source):
+{resume_tex}
+"""
+
+# The editor addresses lines by number, so it gets its own numbered copy.
+NUMBERED_RESUME_CONTEXT_TEMPLATE = """Original Resume (LaTeX source; each line is prefixed with its line number and "| ", which is not part of the source; blank and comment-only lines are omitted but keep their numbers):
+{numbered_resume_tex}
+"""
+
+# The job description is sent the same way, so re-analyzing it (e.g. `analyze`
+# followed by `optimize`) reads it from the prompt cache.
+JOB_CONTEXT_TEMPLATE = """Job Description:
+{job_description}
+"""
+
 # ============================================================================
 # SUPERVISOR AGENT
 # ============================================================================
@@ -326,6 +436,26 @@ Monitor progress and handle failures gracefully.
 """
 
 
+_AGENT_PROMPT_TEMPLATES = {
+    "latex_parser": LATEX_PARSER_PROMPT_TEMPLATE,
+    "job_analyzer": JOB_ANALYZER_PROMPT_TEMPLATE,
+    "gap_analyzer": GAP_ANALYZER_PROMPT_TEMPLATE,
+    "recommendation_generator": RECOMMENDATION_GENERATOR_PROMPT_TEMPLATE,
+    "gap_and_recommendation": GAP_AND_RECOMMENDATION_PROMPT_TEMPLATE,
+    "latex_editor": LATEX_EDITOR_PROMPT_TEMPLATE,
+}
+
+_SYSTEM_PROMPTS = {
+    "latex_parser": LATEX_PARSER_SYSTEM_PROMPT,
+    "job_analyzer": JOB_ANALYZER_SYSTEM_PROMPT,
+    "gap_analyzer": GAP_ANALYZER_SYSTEM_PROMPT,
+    "recommendation_generator": RECOMMENDATION_GENERATOR_SYSTEM_PROMPT,
+    "gap_and_recommendation": GAP_AND_RECOMMENDATION_SYSTEM_PROMPT,
+    "latex_editor": LATEX_EDITOR_SYSTEM_PROMPT,
+    "supervisor": SUPERVISOR_SYSTEM_PROMPT,
+}
+
+
 def get_agent_prompt(agent_name: str, **kwargs) -> str:
     """
     Get the formatted prompt for a specific agent.
@@ -337,21 +467,26 @@ def get_agent_prompt(agent_name: str, **kwargs) -> str:
     Returns:
         Formatted prompt string
     """
-    templates = {
-        "latex_parser": LATEX_PARSER_PROMPT_TEMPLATE,
-        "job_analyzer": JOB_ANALYZER_PROMPT_TEMPLATE,
-        "gap_analyzer": GAP_ANALYZER_PROMPT_TEMPLATE,
-        "recommendation_generator": RECOMMENDATION_GENERATOR_PROMPT_TEMPLATE,
-        "latex_editor": LATEX_EDITOR_PROMPT_TEMPLATE,
-    }
-
-    template = templates.get(agent_name)
+    return get_agent_prompt_template(agent_name).format(**kwargs)
+
+
+def get_agent_prompt_template(agent_name: str) -> str:
+    """
+    Get the unformatted prompt template for a specific agent.
+
+    Args:
+        agent_name: Name of the agent
+
+    Returns:
+        Prompt template string
+    """
+    template = _AGENT_PROMPT_TEMPLATES.get(agent_name)
     if not template:
         raise ValueError(f"Unknown agent: {agent_name}")
-
-    return template.format(**kwargs)
+    return template
 
 
+@lru_cache(maxsize=None)
 def get_system_prompt(agent_name: str) -> str:
     """
     Get the system prompt for a specific agent.
@@ -362,17 +497,101 @@ def get_system_prompt(agent_name: str) -> str:
     Returns:
         System prompt string
     """
-    prompts = {
-        "latex_parser": LATEX_PARSER_SYSTEM_PROMPT,
-        "job_analyzer": JOB_ANALYZER_SYSTEM_PROMPT,
-        "gap_analyzer": GAP_ANALYZER_SYSTEM_PROMPT,
-        "recommendation_generator": RECOMMENDATION_GENERATOR_SYSTEM_PROMPT,
-        "latex_editor": LATEX_EDITOR_SYSTEM_PROMPT,
-        "supervisor": SUPERVISOR_SYSTEM_PROMPT,
-    }
-
-    prompt = prompts.get(agent_name)
+    prompt = _SYSTEM_PROMPTS.get(agent_name)
     if not prompt:
         raise ValueError(f"Unknown agent: {agent_name}")
 
     return prompt
+
+
+def get_resume_context(resume_tex: str) -> str:
+    """
+    Get the cacheable resume context block.
+
+    Args:
+        resume_tex: The LaTeX resume content
+
+    Returns:
+        Formatted resume context string
+    """
+    return RESUME_CONTEXT_TEMPLATE.format(resume_tex=resume_tex)
+
+
+def get_numbered_resume_context(resume_tex: str) -> str:
+    """
+    Get the cacheable resume context block with line numbers for patching.
+
+    Args:
+        resume_tex: The LaTeX resume content
+
+    Returns:
+        Formatted resume context string with numbered lines
+    """
+    return NUMBERED_RESUME_CONTEXT_TEMPLATE.format(numbered_resume_tex=number_lines(resume_tex, content_only=True))
+
+
+def get_job_context(job_description: str) -> str:
+    """
+    Get the cacheable job description context block.
+
+    Args:
+        job_description: The job description text
+
+    Returns:
+        Formatted job description context string
+    """
+    return JOB_CONTEXT_TEMPLATE.format(job_description=job_description)
+
+
+def to_prompt_json(payload: Any) -> str:
+    """
+    Serialize data for embedding in a prompt.
+
+    Args:
+        payload: JSON-serializable data
+
+    Returns:
+        Compact JSON string (indented when OPT_DEBUG_JSON is set)
+    """
+    return orjson.dumps(payload, option=_PROMPT_JSON_OPTION).decode()
+
+
+# Characters of section content kept in the shared section excerpts payload
+SECTION_EXCERPT_CHARS = 300
+
+
+def section_keywords(resume_sections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Build the per-section keyword payload embedded in the gap analysis prompt.
+
+    Args:
+        resume_sections: Parsed resume sections
+
+    Returns:
+        List of {"section", "keywords"} dicts ready for to_prompt_json
+    """
+    return [
+        {"section": s["section_name"], "keywords": s["keywords"]}
+        for s in resume_sections or []
+    ]
+
+
+def section_excerpts(resume_sections: List[Dict[str, Any]], max_chars: int) -> List[Dict[str, str]]:
+    """
+    Build the truncated section payload embedded in downstream prompts.
+
+    Args:
+        resume_sections: Parsed resume sections
+        max_chars: Maximum characters of content kept per section
+
+    Returns:
+        List of {"section", "content"} dicts ready for to_prompt_json
+    """
+    excerpts = []
+    for s in resume_sections or []:
+        # Most parsed content is already a string; only coerce when it isn't
+        content = s.get("content") or ""
+        if not isinstance(content, str):
+            content = str(content)
+        excerpts.append({"section": s["section_name"], "content": content[:max_chars]})
+    return excerpts
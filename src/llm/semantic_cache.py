@@ -0,0 +1,174 @@
+"""
+Semantic Response Cache
+
+In-process cache for structured agent responses. Prompts are embedded and a
+stored response is returned when a previous prompt for the same stage is
+similar enough (cosine similarity >= the stage threshold), turning repeated or
+lightly edited inputs into a local lookup instead of a Claude round-trip.
+
+Embeddings come from sentence-transformers (all-MiniLM-L6-v2) when it is
+installed; otherwise a hashed bag-of-words vector is used.
+"""
+
+import os
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..nlp.similarity import dot, hashed_ngram_vector, normalize
+
+# Default similarity threshold, plus stricter per-stage overrides. The editor
+# returns a full rewritten resume, so it only reuses near-identical prompts;
+# keyword lists change with small wording edits, so they are nearly as strict.
+DEFAULT_THRESHOLD = 0.9
+STAGE_THRESHOLDS = {
+    "latex_editor": 0.98,
+    "extract_keywords": 0.97,
+    "calculate_similarity": 0.95,
+}
+
+
+class _HashedEmbedder:
+    """Fallback embedder: L2-normalized hashed unigram + bigram counts."""
+
+    def encode(self, text: str) -> Dict[int, float]:
+        return normalize(hashed_ngram_vector(text))
+
+    @staticmethod
+    def similarity(a: Dict[int, float], b: Dict[int, float]) -> float:
+        return dot(a, b)
+
+
+class _SentenceTransformerEmbedder:
+    """Dense embedder backed by sentence-transformers."""
+
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+        from sentence_transformers import SentenceTransformer
+
+        self.model = SentenceTransformer(model_name)
+
+    def encode(self, text: str) -> Any:
+        return self.model.encode(text, normalize_embeddings=True)
+
+    @staticmethod
+    def similarity(a: Any, b: Any) -> float:
+        return float(a @ b)
+
+
+def _create_embedder():
+    """Use sentence-transformers if available, otherwise hashed vectors."""
+    try:
+        return _SentenceTransformerEmbedder()
+    except ImportError:
+        return _HashedEmbedder()
+
+
+class SemanticCache:
+    """LRU semantic cache with one namespace per workflow stage"""
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        default_threshold: float = DEFAULT_THRESHOLD,
+        stage_thresholds: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            max_entries: Maximum entries kept per stage before LRU eviction
+            default_threshold: Minimum cosine similarity for a cache hit
+            stage_thresholds: Per-stage threshold overrides
+        """
+        self.max_entries = max_entries
+        self.default_threshold = default_threshold
+        self.stage_thresholds = dict(STAGE_THRESHOLDS, **(stage_thresholds or {}))
+        self._embedder = None
+        self._stages: Dict[str, "OrderedDict[int, Tuple[Any, Any]]"] = {}
+        self._next_id = 0
+
+    @property
+    def embedder(self):
+        """Lazily create the embedder on first use."""
+        if self._embedder is None:
+            self._embedder = _create_embedder()
+        return self._embedder
+
+    def get(self, stage: str, prompt: str, system_prompt: str,
+            context: Optional[List[str]] = None) -> Optional[Any]:
+        """
+        Look up a cached response for a semantically similar prompt.
+
+        Args:
+            stage: Workflow stage namespace (e.g. "job_analyzer")
+            prompt: The user prompt
+            system_prompt: The system prompt
+            context: Additional context blocks sent with the request
+
+        Returns:
+            The cached response, or None on a miss
+        """
+        entries = self._stages.get(stage)
+        if not entries:
+            return None
+
+        vector = self.embedder.encode(self._cache_text(prompt, system_prompt, context))
+        threshold = self.stage_thresholds.get(stage, self.default_threshold)
+
+        best_id, best_score = None, threshold
+        for entry_id, (entry_vector, _) in entries.items():
+            score = self.embedder.similarity(vector, entry_vector)
+            if score >= best_score:
+                best_id, best_score = entry_id, score
+
+        if best_id is None:
+            return None
+
+        entries.move_to_end(best_id)
+        return entries[best_id][1]
+
+    def put(self, stage: str, prompt: str, system_prompt: str, response: Any,
+            context: Optional[List[str]] = None):
+        """
+        Store a response for a prompt.
+
+        Args:
+            stage: Workflow stage namespace
+            prompt: The user prompt
+            system_prompt: The system prompt
+            response: Parsed response to cache
+            context: Additional context blocks sent with the request
+        """
+        entries = self._stages.setdefault(stage, OrderedDict())
+        vector = self.embedder.encode(self._cache_text(prompt, system_prompt, context))
+
+        entries[self._next_id] = (vector, response)
+        self._next_id += 1
+
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    @staticmethod
+    def _cache_text(prompt: str, system_prompt: str, context: Optional[List[str]]) -> str:
+        return "\n".join([system_prompt, *(context or []), prompt])
+
+
+# Singleton instance shared by all clients
+_default_cache: Optional[SemanticCache] = None
+
+
+def get_semantic_cache() -> Optional[SemanticCache]:
+    """
+    Get the shared semantic cache if enabled via CLAUDE_SEMANTIC_CACHE.
+
+    Returns:
+        Singleton SemanticCache instance, or None when disabled
+    """
+    global _default_cache
+    if os.getenv("CLAUDE_SEMANTIC_CACHE", "0").lower() not in ("1", "true", "yes"):
+        return None
+    if _default_cache is None:
+        _default_cache = SemanticCache(
+            max_entries=int(os.getenv("CLAUDE_SEMANTIC_CACHE_SIZE", "256")),
+            default_threshold=float(os.getenv("CLAUDE_SEMANTIC_CACHE_THRESHOLD", str(DEFAULT_THRESHOLD))),
+        )
+    return _default_cache
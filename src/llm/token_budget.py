@@ -0,0 +1,152 @@
+"""
+Prompt Token Budget
+
+Caps the JSON payloads embedded in agent prompts so prefill stays bounded
+for long resumes and job descriptions. Token counts are estimated locally
+(about 4 characters per token for English/LaTeX) rather than via an API call.
+"""
+
+import re
+from typing import Any, Callable, List, Optional, Tuple
+
+from .prompts import to_prompt_json
+
+CHARS_PER_TOKEN = 4
+DEFAULT_BUDGET_TOKENS = 6000
+
+# Budgets for the raw resume / job description text embedded in prompts
+RESUME_PROMPT_TOKENS = 8000
+JOB_PROMPT_TOKENS = 4000
+
+_COMMENT_LINE_RE = re.compile(r"^[ \t]*%.*(?:\n|$)", re.MULTILINE)
+_BLANK_RUN_RE = re.compile(r"\n[ \t]*(?:\n[ \t]*)+\n")
+
+# Output ceilings sized to the expected response rather than a flat maximum
+MAX_OUTPUT_TOKENS = 8192
+TOKENS_PER_KEYWORD = 40
+KEYWORD_OUTPUT_TOKENS = 800
+SIMILARITY_OUTPUT_TOKENS = 300  # score plus a one-sentence reason
+EDIT_OUTPUT_MARGIN = 500
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in text.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Approximate token count
+    """
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def truncate_for_prompt(text: str, max_tokens: int) -> Tuple[str, int]:
+    """
+    Collapse blank-line runs and cut text to a token budget at a line break.
+
+    Args:
+        text: Text to embed in a prompt
+        max_tokens: Maximum estimated tokens to keep
+
+    Returns:
+        Tuple of (text that fits the budget, number of characters cut)
+    """
+    text = _BLANK_RUN_RE.sub("\n\n", text).strip()
+    budget_chars = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= budget_chars:
+        return text, 0
+    cut = text.rfind("\n", 0, budget_chars)
+    if cut <= 0:
+        cut = budget_chars
+    return text[:cut], len(text) - cut
+
+
+def prep_tex(tex: str, max_tokens: int) -> Tuple[str, int]:
+    """
+    Strip comment-only lines from LaTeX, then truncate it for a prompt.
+
+    Args:
+        tex: LaTeX source
+        max_tokens: Maximum estimated tokens to keep
+
+    Returns:
+        Tuple of (LaTeX that fits the budget, number of characters cut)
+    """
+    return truncate_for_prompt(_COMMENT_LINE_RE.sub("", tex), max_tokens)
+
+
+def estimate_max_tokens(task: str, input_tokens: int = 0, items: int = 0) -> int:
+    """
+    Size the max_tokens ceiling for a call from what it is asked to produce.
+
+    Args:
+        task: "extract_keywords", "calculate_similarity" or "latex_editor"
+        input_tokens: Estimated tokens of the input the output is derived from
+            (latex_editor)
+        items: Number of items requested (extract_keywords)
+
+    Returns:
+        max_tokens for the request
+
+    Raises:
+        ValueError: If the task is unknown
+    """
+    if task == "extract_keywords":
+        return max(1, min(KEYWORD_OUTPUT_TOKENS, TOKENS_PER_KEYWORD * items))
+    if task == "calculate_similarity":
+        return SIMILARITY_OUTPUT_TOKENS
+    if task == "latex_editor":
+        # Patches only repeat the lines being changed, so output scales with
+        # the edit request rather than with the whole resume
+        return min(MAX_OUTPUT_TOKENS, input_tokens + EDIT_OUTPUT_MARGIN)
+    raise ValueError(f"Unknown task: {task}")
+
+
+def trim_to_budget(items: List[Any], budget_tokens: int = DEFAULT_BUDGET_TOKENS) -> Tuple[str, int]:
+    """
+    Serialize the longest prefix of items that fits the token budget.
+
+    Callers should order items by importance first so the most important
+    ones are kept.
+
+    Args:
+        items: JSON-serializable items, most important first
+        budget_tokens: Maximum estimated tokens for the serialized list
+
+    Returns:
+        Tuple of (JSON string, number of items dropped)
+    """
+    budget_chars = budget_tokens * CHARS_PER_TOKEN
+    used = 2  # enclosing brackets
+    kept = 0
+    for item in items:
+        used += len(to_prompt_json(item)) + 1
+        if used > budget_chars:
+            break
+        kept += 1
+
+    return to_prompt_json(items[:kept]), len(items) - kept
+
+
+def fit_json_to_budget(
+    payload_json: Optional[str],
+    build_items: Callable[[], List[Any]],
+    budget_tokens: int = DEFAULT_BUDGET_TOKENS,
+) -> Tuple[str, int]:
+    """
+    Reuse a pre-serialized payload when it fits, otherwise trim the items.
+
+    Args:
+        payload_json: Previously serialized list (e.g. cached in state), or None
+        build_items: Returns the items, most important first; only called
+            when the payload is missing or over budget
+        budget_tokens: Maximum estimated tokens for the serialized list
+
+    Returns:
+        Tuple of (JSON string, number of items dropped)
+    """
+    if payload_json is not None and estimate_tokens(payload_json) <= budget_tokens:
+        return payload_json, 0
+    return trim_to_budget(build_items(), budget_tokens)
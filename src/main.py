@@ -4,14 +4,17 @@ Resume Optimizer CLI
 Main entry point for the resume optimization tool.
 """
 
+import os
 import typer
 from pathlib import Path
 from typing import Optional
 from rich.console import Console
 
-from .graph.workflow import run_workflow, run_workflow_with_user_selection
+from .graph.workflow import is_good_fit, keyword_coverage, prefetch_selection, run_workflow, run_workflow_with_user_selection
 from .ui.diff_viewer import display_diff
 from .ui.selection_interface import interactive_selection
+from .utils.file_handler import read_text_with_fallback
+from .utils.logger import setup_queue_logger
 
 app = typer.Typer(help="AI-powered resume optimizer for ATS compatibility")
 console = Console()
@@ -66,11 +69,33 @@ def optimize(
         "--auto-gap-severity",
         help="Auto-select gaps by severity (high, medium, low)",
     ),
+    skip_threshold: float = typer.Option(
+        80.0,
+        "--skip-threshold",
+        help="Skip recommendations and edits when keyword coverage (percent of job keywords found in the resume, 0-100) is at least this and no gap is high severity",
+        min=0,
+        max=100,
+    ),
+    prefetch_edits: bool = typer.Option(
+        False,
+        "--prefetch-edits",
+        help="Speculatively apply the likely selection (priority ≤ --auto-priority, default 2) while you choose",
+    ),
     show_diff: bool = typer.Option(
         True,
         "--show-diff/--no-diff",
         help="Show diff between original and optimized resume",
     ),
+    batch: bool = typer.Option(
+        False,
+        "--batch",
+        help="Parse resume and job description via the Message Batches API (50% cheaper, may take minutes)",
+    ),
+    fused: bool = typer.Option(
+        True,
+        "--fused/--two-step",
+        help="Identify gaps and generate recommendations in one call when gaps are not selected interactively",
+    ),
 ):
     """
     Optimize a LaTeX resume for a specific job description.
@@ -81,16 +106,10 @@ def optimize(
     try:
         # Read input files with encoding fallback
         console.print(f"\n[cyan]Reading resume from:[/cyan] {resume}")
-        try:
-            resume_tex = resume.read_text(encoding='utf-8')
-        except UnicodeDecodeError:
-            resume_tex = resume.read_text(encoding='cp1252')
+        resume_tex = read_text_with_fallback(resume)
 
         console.print(f"[cyan]Reading job description from:[/cyan] {job}")
-        try:
-            job_description = job.read_text(encoding='utf-8')
-        except UnicodeDecodeError:
-            job_description = job.read_text(encoding='cp1252')
+        job_description = read_text_with_fallback(job)
 
         # Run workflow
         console.print("\n[cyan]Running optimization workflow...[/cyan]\n")
@@ -102,7 +121,10 @@ def optimize(
             resume_path=str(resume),
             job_path=str(job),
             interactive_gap_selection=gap_selection and interactive,
-            auto_select_gap_severity=auto_gap_severity or ""
+            auto_select_gap_severity=auto_gap_severity or "",
+            batch_parsing=batch,
+            fused_analysis=fused,
+            skip_threshold=skip_threshold
         )
 
         # Check for errors
@@ -119,6 +141,16 @@ def optimize(
 
         # Phase 2: Interactive selection (if enabled)
         if interactive and recommendations:
+            if prefetch_edits:
+                # Phase 1 already applied everything, so predict a subset
+                predicted_ids = [
+                    r['recommendation_id']
+                    for r in recommendations
+                    if r['priority'] <= (auto_priority or 2)
+                ]
+                if predicted_ids and len(predicted_ids) < len(recommendations):
+                    prefetch_selection(state, predicted_ids)
+
             selected_ids = interactive_selection(recommendations, auto_priority)
 
             if selected_ids:
@@ -154,7 +186,8 @@ def optimize(
                 applied_changes=applied_changes or [],
                 similarity_score=similarity_score or 0.0,
                 gaps_count=len(gaps) if gaps else 0,
-                recommendations_count=len(recommendations) if recommendations else 0
+                recommendations_count=len(recommendations) if recommendations else 0,
+                patches=state.get("applied_patches")
             )
 
         # Save output
@@ -164,6 +197,14 @@ def optimize(
 
             output.write_text(modified_resume, encoding='utf-8')
             console.print(f"\n[green]✓ Optimized resume saved to:[/green] {output}")
+
+            if state.get("needs_rephrase"):
+                console.print("[yellow][WARNING] The optimized resume repeats job description phrases verbatim; consider rephrasing them.[/yellow]")
+        elif is_good_fit(state):
+            console.print(
+                f"\n[green]✓ Resume already covers {keyword_coverage(state):.1f}% of job keywords (≥ {skip_threshold:g}%) with no "
+                f"high-severity gaps; skipped recommendations and edits.[/green]"
+            )
         else:
             console.print("\n[yellow][WARNING] No modifications were made to the resume.[/yellow]")
 
@@ -201,6 +242,11 @@ def analyze(
         dir_okay=False,
         readable=True,
     ),
+    batch: bool = typer.Option(
+        False,
+        "--batch",
+        help="Parse resume and job description via the Message Batches API (50% cheaper, may take minutes)",
+    ),
 ):
     """
     Analyze resume against job description without making modifications.
@@ -211,16 +257,10 @@ def analyze(
     try:
         # Read input files with encoding fallback
         console.print(f"\n[cyan]Reading resume from:[/cyan] {resume}")
-        try:
-            resume_tex = resume.read_text(encoding='utf-8')
-        except UnicodeDecodeError:
-            resume_tex = resume.read_text(encoding='cp1252')
+        resume_tex = read_text_with_fallback(resume)
 
         console.print(f"[cyan]Reading job description from:[/cyan] {job}")
-        try:
-            job_description = job.read_text(encoding='utf-8')
-        except UnicodeDecodeError:
-            job_description = job.read_text(encoding='cp1252')
+        job_description = read_text_with_fallback(job)
 
         # Run workflow without applying edits
         console.print("\n[cyan]Running analysis...[/cyan]\n")
@@ -229,7 +269,8 @@ def analyze(
             resume_tex=resume_tex,
             job_description=job_description,
             resume_path=str(resume),
-            job_path=str(job)
+            job_path=str(job),
+            batch_parsing=batch
         )
 
         # Display results (analysis only, no modifications)
@@ -264,6 +305,7 @@ def version():
 
 def main():
     """Main entry point."""
+    setup_queue_logger("resume_optimizer", os.getenv("LOG_LEVEL", "INFO"))
     app()
 
 
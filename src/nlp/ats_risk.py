@@ -0,0 +1,77 @@
+"""
+ATS Risk Scoring
+
+Local heuristics for how likely an applicant tracking system is to mis-read a
+LaTeX resume: layout constructs that break text extraction, missing standard
+section headings, and job keywords the resume never mentions.
+"""
+
+import re
+from typing import Any, Dict, List
+
+_LATEX_COMMENT_RE = re.compile(r"(?<!\\)%.*$", re.MULTILINE)
+
+# (pattern, risk points, issue description) for layout constructs that
+# commonly scramble or drop text when an ATS extracts it from the PDF
+_LAYOUT_CHECKS = [
+    (re.compile(r"\\begin\{(?:multicols|paracol)\}|\\twocolumn\b"), 20,
+     "Multi-column layout may be read out of order"),
+    (re.compile(r"\\begin\{(?:tabular|tabularx|longtable)\}"), 10,
+     "Tables may be flattened or skipped"),
+    (re.compile(r"\\includegraphics\b"), 10,
+     "Images carry no extractable text"),
+    (re.compile(r"\\(?:fa[A-Z]\w*|faicon|icon)\b"), 5,
+     "Icon glyphs may appear as garbage characters"),
+    (re.compile(r"\\usepackage(?:\[[^\]]*\])?\{fancyhdr\}"), 5,
+     "Header/footer content is often ignored"),
+    (re.compile(r"\\begin\{(?:minipage|textblock\*?)\}"), 5,
+     "Positioned text blocks may be read out of order"),
+]
+
+# Standard headings ATS parsers look for, with accepted variants
+_STANDARD_SECTIONS = {
+    "Experience": re.compile(r"experience|employment|work history", re.IGNORECASE),
+    "Education": re.compile(r"education|academic", re.IGNORECASE),
+    "Skills": re.compile(r"skills|technologies|technical", re.IGNORECASE),
+}
+_SECTION_HEADING_RE = re.compile(r"\\(?:section|cvsection|resumesection)\*?\{([^}]*)\}")
+
+_MISSING_SECTION_POINTS = 10
+_MAX_KEYWORD_POINTS = 30
+
+
+def compute_ats_risk(resume_tex: str, resume_keywords: List[str], job_keywords: List[str]) -> Dict[str, Any]:
+    """
+    Score the ATS parsing risk of a LaTeX resume.
+
+    Args:
+        resume_tex: Raw LaTeX source of the resume
+        resume_keywords: Keywords found in the resume
+        job_keywords: Keywords from the job description
+
+    Returns:
+        Dictionary with "score" (0-100, higher is riskier) and a list of "issues"
+    """
+    text = _LATEX_COMMENT_RE.sub("", resume_tex)
+    score = 0
+    issues: List[str] = []
+
+    for pattern, points, issue in _LAYOUT_CHECKS:
+        if pattern.search(text):
+            score += points
+            issues.append(issue)
+
+    headings = " ".join(_SECTION_HEADING_RE.findall(text))
+    for section, pattern in _STANDARD_SECTIONS.items():
+        if not pattern.search(headings):
+            score += _MISSING_SECTION_POINTS
+            issues.append(f"No standard \"{section}\" section heading")
+
+    if job_keywords:
+        resume_set = {k.lower() for k in resume_keywords}
+        missing = [k for k in job_keywords if k.lower() not in resume_set]
+        if missing:
+            score += round(_MAX_KEYWORD_POINTS * len(missing) / len(job_keywords))
+            issues.append(f"Missing {len(missing)} of {len(job_keywords)} job keywords")
+
+    return {"score": min(score, 100), "issues": issues}
@@ -0,0 +1,238 @@
+"""
+Local Keyword Extractor
+
+Dictionary-based ATS keyword extraction that runs locally in milliseconds,
+replacing a Claude round-trip for the flat keyword lists of the resume and
+job description. Terms come from data/tech_keywords.yaml; synonyms such as
+"k8s" are normalized to their canonical keyword.
+
+Terms outside the dictionary are found with a statistical key-phrase
+extractor: YAKE when it is installed, otherwise RAKE-style phrase scoring.
+"""
+
+import re
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Pattern, Tuple
+
+import yaml
+
+DICTIONARY_PATH = Path(__file__).parent / "data" / "tech_keywords.yaml"
+
+# LaTeX comments (an unescaped % to end of line) carry no resume content
+_LATEX_COMMENT_RE = re.compile(r"(?<!\\)%.*$", re.MULTILINE)
+# Everything up to \begin{document}: class, packages and macro definitions
+_LATEX_PREAMBLE_RE = re.compile(r"\A.*?\\begin\{document\}", re.DOTALL)
+# Command names and optional arguments; braced arguments are kept as text
+_LATEX_COMMAND_RE = re.compile(r"\\[a-zA-Z@]+\*?(?:\[[^\]]*\])?")
+_LATEX_SPECIAL_RE = re.compile(r"[{}&~\\$]")
+_INLINE_SPACE_RE = re.compile(r"[ \t]+")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+|\n+")
+# Shorter fragments are headings or leftover environment names, not content
+MIN_SENTENCE_WORDS = 3
+
+# Words that delimit candidate key phrases for RAKE-style scoring
+_PHRASE_WORD_RE = re.compile(r"[A-Za-z][A-Za-z0-9+#.\-]*[A-Za-z0-9+#]|[A-Za-z]|[,;:.!?()\n]")
+_STOPWORDS = frozenset("""
+a about above across after again against all also am an and any are as at be because been
+before being below between both but by can could did do does doing down during each etc few
+for from further had has have having he her here hers him his how i if in into is it its
+just me more most my no nor not of off on once only or other our out over own per same she
+should so some such than that the their them then there these they this those through to
+too under until up us very via was we were what when where which while who whom why will
+with within would you your years year strong excellent ability including using work working
+experience team teams new well good plus preferred required requirements responsibilities
+seeking looking join ideal candidate role must
+""".split())
+MAX_PHRASE_WORDS = 3
+
+
+@lru_cache(maxsize=1)
+def load_dictionary() -> Tuple[Dict[str, str], Pattern]:
+    """
+    Load the keyword dictionary and compile the matcher.
+
+    Returns:
+        Tuple of (lowercased term -> canonical keyword, compiled pattern)
+    """
+    with open(DICTIONARY_PATH, encoding="utf-8") as f:
+        data = yaml.safe_load(f)
+
+    canonical: Dict[str, str] = {}
+    for terms in data.get("keywords", {}).values():
+        for term in terms:
+            canonical[term.lower()] = term
+    for alias, term in data.get("synonyms", {}).items():
+        canonical[str(alias).lower()] = term
+
+    # Longest terms first so "Spring Boot" wins over shorter overlaps
+    alternatives = "|".join(
+        re.escape(term) for term in sorted(canonical, key=len, reverse=True)
+    )
+    pattern = re.compile(rf"(?<![\w+#.])(?:{alternatives})(?![\w+#]|\.\w)", re.IGNORECASE)
+    return canonical, pattern
+
+
+def normalize_keyword(term: str) -> str:
+    """
+    Map a keyword or synonym to its canonical form.
+
+    Args:
+        term: Keyword to normalize
+
+    Returns:
+        Canonical keyword if known, otherwise the stripped input
+    """
+    canonical, _ = load_dictionary()
+    term = term.strip()
+    return canonical.get(term.lower(), term)
+
+
+def extract_keywords(text: str, max_keywords: Optional[int] = None) -> List[str]:
+    """
+    Extract dictionary keywords from text, ranked by frequency.
+
+    Args:
+        text: Resume (LaTeX or plain) or job description text
+        max_keywords: Maximum number of keywords to return (None for all)
+
+    Returns:
+        Canonical keywords ordered by term frequency, then first occurrence
+    """
+    canonical, pattern = load_dictionary()
+    text = _LATEX_COMMENT_RE.sub("", text)
+
+    counts: Counter = Counter()
+    first_seen: Dict[str, int] = {}
+    for match in pattern.finditer(text):
+        keyword = canonical[match.group(0).lower()]
+        counts[keyword] += 1
+        first_seen.setdefault(keyword, match.start())
+
+    ranked = sorted(counts, key=lambda k: (-counts[k], first_seen[k]))
+    return ranked[:max_keywords] if max_keywords is not None else ranked
+
+
+def merge_keywords(*keyword_lists: List[str]) -> List[str]:
+    """
+    Merge keyword lists, normalizing synonyms and dropping duplicates.
+
+    Args:
+        *keyword_lists: Keyword lists in priority order
+
+    Returns:
+        Combined list preserving first-seen order
+    """
+    merged: Dict[str, str] = {}
+    for keywords in keyword_lists:
+        for keyword in keywords:
+            normalized = normalize_keyword(str(keyword))
+            if normalized:
+                merged.setdefault(normalized.lower(), normalized)
+    return list(merged.values())
+
+
+def strip_latex_markup(text: str) -> str:
+    """
+    Reduce LaTeX source to its readable text.
+
+    Drops comments, the preamble and command names while keeping the text
+    inside braces (section titles, bullet content).
+
+    Args:
+        text: LaTeX or plain text
+
+    Returns:
+        Text with LaTeX boilerplate removed
+    """
+    text = _LATEX_COMMENT_RE.sub("", text)
+    text = _LATEX_PREAMBLE_RE.sub("", text)
+    text = _LATEX_COMMAND_RE.sub(" ", text)
+    text = _LATEX_SPECIAL_RE.sub(" ", text)
+    return _INLINE_SPACE_RE.sub(" ", text)
+
+
+def prefilter_keywords(text: str) -> Tuple[List[str], str]:
+    """
+    Split text into dictionary keywords and the sentences they don't cover.
+
+    Used before LLM keyword extraction so Claude only sees the parts of a
+    document the local dictionary found nothing in.
+
+    Args:
+        text: Resume (LaTeX or plain) or job description text
+
+    Returns:
+        Tuple of (dictionary keywords, remaining unmatched sentences)
+    """
+    _, pattern = load_dictionary()
+    plain = strip_latex_markup(text)
+
+    unmatched = [
+        sentence.strip()
+        for sentence in _SENTENCE_SPLIT_RE.split(plain)
+        if len(sentence.split()) >= MIN_SENTENCE_WORDS and not pattern.search(sentence)
+    ]
+    return extract_keywords(plain), "\n".join(unmatched)
+
+
+def _rake_phrases(text: str, max_phrases: int) -> List[str]:
+    """RAKE: score stopword-delimited phrases by summed word degree/frequency."""
+    phrases: List[List[str]] = []
+    current: List[str] = []
+    for token in _PHRASE_WORD_RE.findall(text):
+        if (len(token) == 1 and not token.isalpha()) or token.lower() in _STOPWORDS:
+            if current:
+                phrases.append(current)
+            current = []
+        else:
+            current.append(token)
+    if current:
+        phrases.append(current)
+    phrases = [p for p in phrases if len(p) <= MAX_PHRASE_WORDS]
+
+    frequency: Counter = Counter()
+    degree: Counter = Counter()
+    for phrase in phrases:
+        for word in phrase:
+            frequency[word.lower()] += 1
+            degree[word.lower()] += len(phrase)
+
+    scores: Dict[str, float] = {}
+    surface: Dict[str, str] = {}
+    for phrase in phrases:
+        key = " ".join(phrase).lower()
+        surface.setdefault(key, " ".join(phrase))
+        scores[key] = sum(degree[w.lower()] / frequency[w.lower()] for w in phrase)
+
+    ranked = sorted(scores, key=scores.get, reverse=True)
+    return [surface[key] for key in ranked[:max_phrases]]
+
+
+def _yake_phrases(text: str, max_phrases: int) -> Optional[List[str]]:
+    """YAKE key phrases, or None when yake is not installed."""
+    try:
+        import yake
+    except ImportError:
+        return None
+    extractor = yake.KeywordExtractor(lan="en", n=MAX_PHRASE_WORDS, top=max_phrases)
+    return [phrase for phrase, _ in extractor.extract_keywords(text)]
+
+
+def extract_key_phrases(text: str, max_phrases: int) -> List[str]:
+    """
+    Extract statistically salient phrases from text without a dictionary.
+
+    Args:
+        text: Resume (LaTeX or plain) or job description text
+        max_phrases: Maximum number of phrases to return
+
+    Returns:
+        Key phrases, most salient first
+    """
+    if max_phrases <= 0:
+        return []
+    plain = strip_latex_markup(text)
+    phrases = _yake_phrases(plain, max_phrases)
+    return phrases if phrases is not None else _rake_phrases(plain, max_phrases)
@@ -0,0 +1,153 @@
+"""
+Local Similarity Scoring
+
+Deterministic resume/job-description similarity computed locally as the
+cosine of L2-normalized term-frequency vectors over hashed unigrams and
+bigrams, instead of asking Claude for a score. IDF weighting is deliberately
+left out: with a two-document corpus it would down-weight exactly the terms
+the resume and job description share. When sentence-transformers is
+installed, a semantic score from sentence embeddings is also available.
+"""
+
+import importlib.util
+import math
+import re
+import zlib
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
+
+N_FEATURES = 2 ** 18
+
+EMBEDDING_MODEL = "all-mpnet-base-v2"
+_EMBEDDINGS_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+_LATEX_COMMAND_RE = re.compile(r"\\[a-zA-Z@]+\*?")
+_LATEX_COMMENT_RE = re.compile(r"(?<!\\)%.*$", re.MULTILINE)
+
+_STOP_WORDS = frozenset("""
+a about above after again all also am an and any are as at be because been
+before being below between both but by can could did do does doing down during
+each few for from further had has have having he her here hers him his how i if
+in into is it its itself just me more most my no nor not of off on once only or
+other our ours out over own same she should so some such than that the their
+them then there these they this those through to too under until up very was we
+were what when where which while who whom why will with would you your yours
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Lowercase word tokens with LaTeX markup and stop words removed.
+
+    Args:
+        text: Plain or LaTeX text
+
+    Returns:
+        List of tokens
+    """
+    text = _LATEX_COMMENT_RE.sub(" ", text)
+    text = _LATEX_COMMAND_RE.sub(" ", text)
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in _STOP_WORDS]
+
+
+def hashed_ngram_vector(text: str, n_features: int = N_FEATURES) -> Dict[int, float]:
+    """
+    Hash unigrams and bigrams of text into a sparse count vector.
+
+    Args:
+        text: Plain or LaTeX text
+        n_features: Number of hash buckets
+
+    Returns:
+        Sparse vector as {bucket: count}
+    """
+    tokens = tokenize(text)
+    grams: Iterable[str] = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    return dict(Counter(zlib.crc32(g.encode("utf-8")) % n_features for g in grams))
+
+
+def normalize(vector: Dict[int, float]) -> Dict[int, float]:
+    """Scale a sparse vector to unit L2 norm."""
+    norm = math.sqrt(sum(v * v for v in vector.values()))
+    if not norm:
+        return {}
+    return {k: v / norm for k, v in vector.items()}
+
+
+def dot(a: Dict[int, float], b: Dict[int, float]) -> float:
+    """Dot product of two sparse vectors."""
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(v * b.get(k, 0.0) for k, v in a.items())
+
+
+def similarity_score(text1: str, text2: str) -> float:
+    """
+    Hashed term-frequency cosine similarity between two texts, scaled to 0-100.
+
+    Args:
+        text1: First text (e.g. resume LaTeX)
+        text2: Second text (e.g. job description)
+
+    Returns:
+        Similarity score from 0 to 100
+    """
+    return dot(normalize(hashed_ngram_vector(text1)), normalize(hashed_ngram_vector(text2))) * 100
+
+
+@lru_cache(maxsize=1)
+def _embedding_model() -> Any:
+    """Load the sentence-transformers model on first use."""
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(EMBEDDING_MODEL)
+
+
+@lru_cache(maxsize=64)
+def _embed(text: str) -> Any:
+    """Unit-length embedding of text with LaTeX markup removed, memoized per text."""
+    text = _LATEX_COMMENT_RE.sub(" ", text)
+    text = _LATEX_COMMAND_RE.sub(" ", text)
+    return _embedding_model().encode(text, normalize_embeddings=True)
+
+
+def embedding_similarity(text1: str, text2: str) -> Optional[float]:
+    """
+    Sentence-embedding cosine similarity between two texts, scaled to 0-100.
+
+    Embeddings are cached per text, so re-scoring an unchanged resume
+    against a new job description only embeds the new text. The model reads
+    a limited number of tokens per text, so very long documents are judged
+    on their opening.
+
+    Args:
+        text1: First text (e.g. resume LaTeX)
+        text2: Second text (e.g. job description)
+
+    Returns:
+        Similarity score from 0 to 100, or None if sentence-transformers is
+        not installed
+    """
+    if not _EMBEDDINGS_AVAILABLE:
+        return None
+    return max(0.0, float(_embed(text1) @ _embed(text2))) * 100
+
+
+def keyword_overlap(resume_keywords: List[str], job_keywords: List[str]) -> float:
+    """
+    Percentage of job keywords that also appear among the resume keywords.
+
+    Args:
+        resume_keywords: Keywords extracted from the resume
+        job_keywords: Keywords extracted from the job description
+
+    Returns:
+        Overlap percentage from 0 to 100
+    """
+    job_set = {k.lower() for k in job_keywords}
+    if not job_set:
+        return 0.0
+    resume_set = {k.lower() for k in resume_keywords}
+    return len(job_set & resume_set) / len(job_set) * 100
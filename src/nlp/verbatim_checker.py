@@ -0,0 +1,112 @@
+"""
+Verbatim Phrase Checker
+
+Detects job-description phrases copied word for word into a resume, which
+ATS screeners and recruiters tend to flag. Both texts are split into word
+shingles; each token gets a 64-bit FNV-1a hash and shingles are hashed with a
+Rabin-Karp rolling hash, so the scan is a single linear pass over each text.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Set
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+_LATEX_COMMAND_RE = re.compile(r"\\[a-zA-Z@]+\*?")
+_LATEX_COMMENT_RE = re.compile(r"(?<!\\)%.*$", re.MULTILINE)
+
+_MASK64 = (1 << 64) - 1
+_FNV_OFFSET = 0xCBF29CE484222325
+_FNV_PRIME = 0x100000001B3
+_ROLL_BASE = 0x9E3779B97F4A7C15
+
+DEFAULT_SHINGLE_SIZE = 6
+# Fraction of the resume's shingles copied from the job description above
+# which the resume should be rephrased
+DEFAULT_THRESHOLD = 0.05
+
+
+def _tokenize(text: str) -> List[str]:
+    """Lowercase word tokens with LaTeX comments and commands removed."""
+    text = _LATEX_COMMENT_RE.sub("", text)
+    text = _LATEX_COMMAND_RE.sub(" ", text)
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _fnv1a(token: str) -> int:
+    """64-bit FNV-1a hash of a token."""
+    h = _FNV_OFFSET
+    for byte in token.encode():
+        h = ((h ^ byte) * _FNV_PRIME) & _MASK64
+    return h
+
+
+def _shingle_hashes(tokens: List[str], size: int) -> List[int]:
+    """Rolling hashes of every window of `size` consecutive tokens."""
+    if len(tokens) < size:
+        return []
+
+    token_hashes = [_fnv1a(t) for t in tokens]
+    top = pow(_ROLL_BASE, size - 1, 1 << 64)
+
+    h = 0
+    for th in token_hashes[:size]:
+        h = (h * _ROLL_BASE + th) & _MASK64
+    hashes = [h]
+
+    for i in range(size, len(token_hashes)):
+        h = ((h - token_hashes[i - size] * top) * _ROLL_BASE + token_hashes[i]) & _MASK64
+        hashes.append(h)
+
+    return hashes
+
+
+def check_verbatim_overlap(
+    job_description: str,
+    resume_tex: str,
+    original_resume_tex: Optional[str] = None,
+    shingle_size: int = DEFAULT_SHINGLE_SIZE,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> Dict[str, Any]:
+    """
+    Find job-description phrases that appear verbatim in a resume.
+
+    Args:
+        job_description: Job description text
+        resume_tex: Resume LaTeX to check (e.g. the edited resume)
+        original_resume_tex: Resume before editing; phrases it already
+            contained are not counted as copied
+        shingle_size: Number of consecutive words per compared phrase
+        threshold: Overlap ratio above which the resume needs rephrasing
+
+    Returns:
+        Dictionary with "overlap" (fraction of resume shingles copied),
+        "phrases" (copied passages) and "needs_rephrase"
+    """
+    job_hashes: Set[int] = set(_shingle_hashes(_tokenize(job_description), shingle_size))
+    if original_resume_tex:
+        job_hashes -= set(_shingle_hashes(_tokenize(original_resume_tex), shingle_size))
+
+    tokens = _tokenize(resume_tex)
+    resume_hashes = _shingle_hashes(tokens, shingle_size)
+    if not resume_hashes or not job_hashes:
+        return {"overlap": 0.0, "phrases": [], "needs_rephrase": False}
+
+    # Merge overlapping matched windows into contiguous copied passages
+    matched = 0
+    phrases: List[str] = []
+    run_start = run_end = None
+    for i, h in enumerate(resume_hashes):
+        if h not in job_hashes:
+            continue
+        matched += 1
+        if run_end is not None and i <= run_end:
+            run_end = i + shingle_size
+        else:
+            if run_start is not None:
+                phrases.append(" ".join(tokens[run_start:run_end]))
+            run_start, run_end = i, i + shingle_size
+    if run_start is not None:
+        phrases.append(" ".join(tokens[run_start:run_end]))
+
+    overlap = matched / len(resume_hashes)
+    return {"overlap": overlap, "phrases": phrases, "needs_rephrase": overlap > threshold}
@@ -0,0 +1,30 @@
+"""
+Detail Panels
+
+Shared builder for the gap and recommendation detail panel bodies.
+"""
+
+from typing import List, Tuple
+from rich.text import Text
+
+
+def detail_text(fields: List[Tuple[str, str, str]], sections: List[Tuple[str, str]]) -> Text:
+    """
+    Build a styled detail body without going through a Markdown parse.
+
+    Args:
+        fields: (label, value, style) tuples, shown one per line as "Label: value"
+        sections: (label, body) tuples, shown as a bold heading above the body
+
+    Returns:
+        Styled Text for the panel body
+    """
+    text = Text()
+    for label, value, style in fields:
+        text.append(f"{label}: ", style="bold")
+        text.append(f"{value}\n", style=style)
+    for label, body in sections:
+        text.append(f"\n{label}:\n", style="bold")
+        text.append(f"{body}\n")
+    text.rstrip()
+    return text
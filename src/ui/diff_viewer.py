@@ -4,8 +4,13 @@ Diff Viewer
 Displays side-by-side comparison of original and modified LaTeX resumes.
 """
 
-import difflib
-from typing import List, Tuple
+import hashlib
+import io
+import os
+import sys
+from functools import lru_cache
+from itertools import chain, islice
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
@@ -13,57 +18,294 @@ from rich.syntax import Syntax
 from rich.layout import Layout
 from rich.text import Text
 
+try:
+    # C implementation of SequenceMatcher with the same API
+    from cdifflib import CSequenceMatcher as SequenceMatcher
+except ImportError:
+    from difflib import SequenceMatcher
+
+
+# Diff output is rendered and printed in chunks of about this many characters
+DIFF_FLUSH_CHARS = 64 * 1024
+
+_DIFF_STYLES = {"@": "blue", "-": "red", "+": "green"}
+
+_BAR = "=" * 80
+
+
+def _format_range(start: int, stop: int) -> str:
+    """Format a 0-based [start, stop) line range the way unified diff headers do."""
+    length = stop - start
+    if length == 1:
+        return str(start + 1)
+    # An empty range is reported at the line before it
+    return f"{start + 1 if length else start},{length}"
+
+
+def unified_line_diff(a: List[str], b: List[str], fromfile: str = "", tofile: str = "",
+                      n: int = 3) -> Iterator[str]:
+    """
+    Yield a unified diff of two line lists, like difflib.unified_diff with lineterm="".
+
+    Each distinct line is mapped to a small integer once and the matcher
+    runs on those ids, so its inner loop compares ints instead of strings.
+    Autojunk is off, so frequent lines (blank lines, \\item) still anchor
+    matches in long resumes.
+
+    Args:
+        a: Original lines
+        b: Modified lines
+        fromfile: Name for the "---" header
+        tofile: Name for the "+++" header
+        n: Number of context lines around changes
+
+    Yields:
+        Diff lines (headers, hunk headers, then " "/"-"/"+" prefixed lines)
+    """
+    ids: Dict[str, int] = {}
+    a_ids = [ids.setdefault(line, len(ids)) for line in a]
+    b_ids = [ids.setdefault(line, len(ids)) for line in b]
+    matcher = SequenceMatcher(None, a_ids, b_ids, autojunk=False)
+
+    started = False
+    for group in matcher.get_grouped_opcodes(n):
+        if not started:
+            started = True
+            yield f"--- {fromfile}"
+            yield f"+++ {tofile}"
+        first, last = group[0], group[-1]
+        yield f"@@ -{_format_range(first[1], last[2])} +{_format_range(first[3], last[4])} @@"
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                yield from (" " + line for line in a[i1:i2])
+                continue
+            if tag in ("replace", "delete"):
+                yield from ("-" + line for line in a[i1:i2])
+            if tag in ("replace", "insert"):
+                yield from ("+" + line for line in b[j1:j2])
+
+
+def _patch_hunks(lines: List[str], patches: List[dict], context_lines: int) -> Iterator[str]:
+    """
+    Yield unified diff hunks for validated line patches.
+
+    Patches whose context windows touch share one hunk, as in
+    SequenceMatcher.get_grouped_opcodes, so no changed line is shown as
+    context of a neighbouring patch.
+
+    Args:
+        lines: Original LaTeX lines
+        patches: Validated patches sorted by start_line
+        context_lines: Number of context lines to show around changes
+
+    Yields:
+        Diff lines without file headers
+    """
+    groups: List[List[dict]] = []
+    for patch in patches:
+        if groups and patch["start_line"] - 1 - groups[-1][-1]["end_line"] <= 2 * context_lines:
+            groups[-1].append(patch)
+        else:
+            groups.append([patch])
+
+    offset = 0  # Lines added minus lines removed by earlier hunks
+    for group in groups:
+        # 0-based [a_start, a_stop) span of original lines covered by the hunk
+        a_start = max(0, group[0]["start_line"] - 1 - context_lines)
+        a_stop = min(len(lines), group[-1]["end_line"] + context_lines)
+        delta = sum(len(p["new_lines"]) - (p["end_line"] - p["start_line"] + 1) for p in group)
+        yield (f"@@ -{_format_range(a_start, a_stop)} "
+               f"+{_format_range(a_start + offset, a_stop + offset + delta)} @@")
+
+        position = a_start  # Next original line (0-based) to emit
+        for patch in group:
+            start, end = patch["start_line"] - 1, patch["end_line"]
+            yield from (f" {line}" for line in lines[position:start])
+            yield from (f"-{line}" for line in lines[start:end])
+            yield from (f"+{line}" for line in patch["new_lines"])
+            position = max(position, end)
+        yield from (f" {line}" for line in lines[position:a_stop])
+        offset += delta
+
+
+class _MemoSyntax(Syntax):
+    """Syntax that tokenizes its code with Pygments once and reuses the result."""
+
+    def highlight(self, code: str, line_range: Optional[Tuple[Optional[int], Optional[int]]] = None) -> Text:
+        key = (code, line_range)
+        cached = self.__dict__.setdefault("_highlighted", {})
+        if key not in cached:
+            cached[key] = super().highlight(code, line_range)
+        # Rendering may restyle the text, so hand out a copy
+        return cached[key].copy()
+
+
+def _content_hash(text: str) -> str:
+    """Short digest identifying a LaTeX blob for the Syntax cache."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+@lru_cache(maxsize=8)
+def _syntax_for(text_hash: str, text: str, theme: str) -> Syntax:
+    """
+    Get the line-numbered LaTeX Syntax for a text, built once per content and theme.
+
+    Args:
+        text_hash: Digest of text, the effective cache key
+        text: LaTeX content, used to build the Syntax on a cache miss
+        theme: Pygments theme name
+
+    Returns:
+        Syntax renderable
+    """
+    return _MemoSyntax(text, "latex", theme=theme, line_numbers=True)
+
 
 class DiffViewer:
     """Displays diff between original and modified LaTeX"""
 
     def __init__(self):
         self.console = Console()
+        # Piped output gets plain text, skipping Pygments and Rich styling
+        self._is_tty = self.console.is_terminal
 
     def show_diff(self, original: str, modified: str, context_lines: int = 3):
         """
         Show side-by-side diff of LaTeX files.
 
+        The diff is consumed lazily from unified_line_diff's generator and printed in
+        batches, so it is never materialized as a whole.
+
         Args:
             original: Original LaTeX content
             modified: Modified LaTeX content
             context_lines: Number of context lines to show around changes
         """
-        # Split into lines
-        original_lines = original.splitlines(keepends=True)
-        modified_lines = modified.splitlines(keepends=True)
+        # Identical text needs no diff; the memcmp-backed compare is far cheaper
+        if original == modified:
+            self.console.print("\n[yellow]No changes detected between original and modified resume.[/yellow]\n")
+            return
 
         # Generate unified diff
-        diff = list(difflib.unified_diff(
-            original_lines,
-            modified_lines,
+        diff = unified_line_diff(
+            original.splitlines(keepends=True),
+            modified.splitlines(keepends=True),
             fromfile='Original Resume',
             tofile='Optimized Resume',
-            lineterm='',
             n=context_lines
-        ))
+        )
 
-        if not diff or len(diff) <= 2:  # No changes
+        # The two file headers plus at least one hunk header mean changes
+        header = list(islice(diff, 2))
+        first_hunk = next(diff, None)
+        if first_hunk is None:  # No changes
             self.console.print("\n[yellow]No changes detected between original and modified resume.[/yellow]\n")
             return
 
-        # Display diff
-        self.console.print("\n[bold cyan]LaTeX Resume Diff[/bold cyan]")
-        self.console.print("=" * 80)
-
-        for line in diff:
-            if line.startswith('---') or line.startswith('+++'):
-                self.console.print(f"[bold]{line}[/bold]")
-            elif line.startswith('@@'):
-                self.console.print(f"[blue]{line}[/blue]")
-            elif line.startswith('-'):
-                self.console.print(f"[red]{line}[/red]")
-            elif line.startswith('+'):
-                self.console.print(f"[green]{line}[/green]")
+        self._print_diff(header, chain([first_hunk], diff))
+
+    def show_patch_diff(self, original: str, patches: List[dict], context_lines: int = 3):
+        """
+        Show a unified diff built directly from the editor's line patches.
+
+        The changed line ranges are already known, so no diff needs to be
+        computed over the whole file.
+
+        Args:
+            original: Original LaTeX content
+            patches: Validated patches sorted by start_line
+            context_lines: Number of context lines to show around changes
+        """
+        if not patches:
+            self.console.print("\n[yellow]No changes detected between original and modified resume.[/yellow]\n")
+            return
+
+        self._print_diff(
+            ["--- Original Resume", "+++ Optimized Resume"],
+            _patch_hunks(original.split("\n"), patches, context_lines)
+        )
+
+    def show_diff_to(self, original: str, modified: str, fp: TextIO, context_lines: int = 3,
+                     patches: Optional[List[dict]] = None):
+        """
+        Render the whole diff in memory and write it to fp in one block.
+
+        Used when output is redirected, where per-chunk writes only add
+        syscalls; the diff text is held in memory in exchange.
+
+        Args:
+            original: Original LaTeX content
+            modified: Modified LaTeX content
+            fp: Destination text stream, e.g. sys.stdout
+            context_lines: Number of context lines to show around changes
+            patches: Line patches to render the diff from, as in show_patch_diff
+        """
+        buffer = io.StringIO()
+        console_file, self.console.file = self.console.file, buffer
+        try:
+            if patches is not None:
+                self.show_patch_diff(original, patches, context_lines)
             else:
-                self.console.print(line)
+                self.show_diff(original, modified, context_lines)
+        finally:
+            self.console.file = console_file
+
+        try:
+            fd = fp.fileno()
+        except (AttributeError, io.UnsupportedOperation):
+            fp.write(buffer.getvalue())
+            return
 
-        self.console.print("=" * 80 + "\n")
+        # Flush earlier buffered output so it stays ahead of the raw write
+        fp.flush()
+        data = memoryview(buffer.getvalue().encode(getattr(fp, "encoding", None) or "utf-8", errors="replace"))
+        while data:
+            data = data[os.write(fd, data):]
+
+    def _print_diff(self, header: List[str], body: Iterable[str]):
+        """
+        Print the diff in rendered chunks of about DIFF_FLUSH_CHARS characters.
+
+        Lines are appended to a string buffer with their style spans recorded
+        alongside, so each chunk becomes one styled Text and one console
+        print, and memory stays bounded by the chunk size. When the output
+        is not a terminal, chunks are written to the console's file unstyled.
+        """
+        buffer = io.StringIO()
+        spans: List[Tuple[int, int, str]] = []
+
+        def write(line: str, style: str = ""):
+            start = buffer.tell()
+            buffer.write(line.rstrip("\n") + "\n")
+            if style and self._is_tty:
+                spans.append((start, buffer.tell(), style))
+
+        def flush():
+            if not self._is_tty:
+                self.console.file.write(buffer.getvalue())
+                buffer.seek(0)
+                buffer.truncate()
+                return
+            text = Text(buffer.getvalue())
+            for start, end, style in spans:
+                text.stylize(style, start, end)
+            self.console.print(text, end="")
+            buffer.seek(0)
+            buffer.truncate()
+            spans.clear()
+
+        write("")
+        write("LaTeX Resume Diff", "bold cyan")
+        write(_BAR)
+        for line in header:
+            write(line, "bold")
+        for line in body:
+            write(line, _DIFF_STYLES.get(line[:1], ""))
+            if buffer.tell() >= DIFF_FLUSH_CHARS:
+                flush()
+        write(_BAR)
+        write("")
+        flush()
 
     def show_side_by_side(self, original: str, modified: str, max_width: int = 80):
         """
@@ -74,22 +316,27 @@ class DiffViewer:
             modified: Modified LaTeX content
             max_width: Maximum width for each panel
         """
+        if not self._is_tty:
+            self.console.file.write(
+                f"\n--- Original Resume ---\n{original}\n\n--- Optimized Resume ---\n{modified}\n\n"
+            )
+            return
+
         layout = Layout()
         layout.split_row(
             Layout(name="original"),
             Layout(name="modified")
         )
 
-        # Create syntax-highlighted panels
-        original_syntax = Syntax(original, "latex", theme="monokai", line_numbers=True)
-        modified_syntax = Syntax(modified, "latex", theme="monokai", line_numbers=True)
+        # Create syntax-highlighted panels (cached, so an unchanged original
+        # is not re-tokenized on repeated views)
+        original_syntax = _syntax_for(_content_hash(original), original, "monokai")
+        modified_syntax = _syntax_for(_content_hash(modified), modified, "monokai")
 
         layout["original"].update(Panel(original_syntax, title="Original Resume", border_style="red"))
         layout["modified"].update(Panel(modified_syntax, title="Optimized Resume", border_style="green"))
 
-        self.console.print("\n")
-        self.console.print(layout)
-        self.console.print("\n")
+        self.console.print("\n", layout, "\n", sep="")
 
     def show_changes_summary(self, applied_changes: List[dict]):
         """
@@ -102,8 +349,6 @@ class DiffViewer:
             self.console.print("\n[yellow]No changes were applied.[/yellow]\n")
             return
 
-        self.console.print(f"\n[bold green]Applied {len(applied_changes)} Changes:[/bold green]\n")
-
         table = Table(show_header=True, header_style="bold cyan")
         table.add_column("#", style="dim", width=4)
         table.add_column("Section", style="magenta")
@@ -114,8 +359,9 @@ class DiffViewer:
             description = change.get("change_description", "No description")
             table.add_row(str(i), section, description)
 
-        self.console.print(table)
-        self.console.print()
+        self.console.print(
+            f"\n[bold green]Applied {len(applied_changes)} Changes:[/bold green]\n", table, "", sep="\n"
+        )
 
     def show_stats(self, similarity_score: float, gaps_count: int,
                    recommendations_count: int, changes_count: int):
@@ -149,9 +395,7 @@ class DiffViewer:
         stats_text.append(f"{changes_count}\n", style="green")
 
         panel = Panel(stats_text, title="Optimization Statistics", border_style="blue")
-        self.console.print("\n")
-        self.console.print(panel)
-        self.console.print("\n")
+        self.console.print("\n", panel, "\n", sep="")
 
 
 def display_diff(original: str,
@@ -159,7 +403,8 @@ def display_diff(original: str,
                  applied_changes: List[dict],
                  similarity_score: float,
                  gaps_count: int,
-                 recommendations_count: int):
+                 recommendations_count: int,
+                 patches: Optional[List[dict]] = None):
     """
     Main function to display all diff information.
 
@@ -170,6 +415,8 @@ def display_diff(original: str,
         similarity_score: Similarity score
         gaps_count: Number of gaps
         recommendations_count: Number of recommendations
+        patches: Line patches the edit was built from; when given, the diff is
+            rendered from them instead of recomputed
     """
     viewer = DiffViewer()
 
@@ -185,4 +432,9 @@ def display_diff(original: str,
     viewer.show_changes_summary(applied_changes)
 
     # Show diff
-    viewer.show_diff(original, modified)
+    if not viewer._is_tty:
+        viewer.show_diff_to(original, modified, sys.stdout, patches=patches)
+    elif patches is not None:
+        viewer.show_patch_diff(original, patches)
+    else:
+        viewer.show_diff(original, modified)
@@ -4,13 +4,24 @@ Gap Selection Interface
 Interactive interface for users to review and select gaps to address.
 """
 
+from collections import Counter
 from typing import List
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
-from rich.markdown import Markdown
+from rich.text import Text
 from ..graph.state import Gap
+from .details import detail_text
+
+# Lists at least this long are printed as plain fixed-width rows
+PLAIN_TABLE_MIN_ROWS = 20
+
+# Longer lists are reviewed with one bulk prompt instead of a confirm per gap
+REVIEW_INDIVIDUALLY_MAX_ITEMS = 5
+
+_SEV_STYLE = {"high": "bold red", "medium": "bold yellow", "low": "cyan"}
+_SEV_ICON = {"high": "🔴", "medium": "🟡", "low": "🔵"}
 
 
 class GapSelectionInterface:
@@ -32,27 +43,59 @@ class GapSelectionInterface:
 
         self.console.print(f"\n[bold cyan]Identified {len(gaps)} Gaps:[/bold cyan]\n")
 
+        # Rich tables measure every cell; long lists use fixed-width rows
+        if len(gaps) >= PLAIN_TABLE_MIN_ROWS:
+            self.console.print(self._gap_rows(gaps), no_wrap=True, overflow="ellipsis")
+            self.console.print()
+            return
+
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("ID", style="dim", width=8)
         table.add_column("Severity", style="cyan", width=10)
         table.add_column("Type", style="yellow", width=20)
         table.add_column("Description", style="white")
 
+        add_row = table.add_row
         for i, gap in enumerate(gaps):
             gap_id = f"gap_{i}"
             severity_icon = self._get_severity_icon(gap['severity'])
             severity_style = self._get_severity_style(gap['severity'])
+            description = gap['description']
 
-            table.add_row(
+            add_row(
                 gap_id,
                 f"[{severity_style}]{severity_icon} {gap['severity'].upper()}[/{severity_style}]",
                 gap['gap_type'],
-                gap['description'][:50] + "..." if len(gap['description']) > 50 else gap['description']
+                description if len(description) <= 50 else description[:47] + "…"
             )
 
         self.console.print(table)
         self.console.print()
 
+    def _gap_rows(self, gaps: List[Gap]) -> Text:
+        """
+        Render gaps as fixed-width styled text rows instead of a Table.
+
+        Args:
+            gaps: List of Gap objects
+
+        Returns:
+            Text with a header row and one row per gap
+        """
+        out = Text()
+        append = out.append
+        append(f"{'ID':<8} {'Severity':<10} {'Type':<20} Description\n", style="bold magenta")
+        for i, gap in enumerate(gaps):
+            severity = gap['severity']
+            description = gap['description']
+            append(f"gap_{i}".ljust(8) + " ", style="dim")
+            # The icon renders two cells wide
+            append(f"{self._get_severity_icon(severity)} {severity.upper()}".ljust(9) + " ",
+                   style=self._get_severity_style(severity))
+            append(gap['gap_type'][:20].ljust(20) + " ", style="yellow")
+            append((description if len(description) <= 50 else description[:47] + "…") + "\n")
+        return out
+
     def display_gap_details(self, gap: Gap, index: int):
         """
         Display detailed information about a single gap.
@@ -61,23 +104,24 @@ class GapSelectionInterface:
             gap: Gap object
             index: Gap index
         """
-        severity_icon = self._get_severity_icon(gap['severity'])
-
-        details = f"""
-**ID:** gap_{index}
-**Severity:** {severity_icon} {gap['severity'].upper()}
-**Type:** {gap['gap_type']}
-
-**Description:**
-{gap['description']}
-"""
+        severity_style = self._get_severity_style(gap['severity'])
+        sections = [("Description", gap['description'])]
         if gap.get('related_requirement'):
-            details += f"\n**Related Requirement:**\n{gap['related_requirement']}"
+            sections.append(("Related Requirement", gap['related_requirement']))
+
+        details = detail_text(
+            [
+                ("ID", f"gap_{index}", ""),
+                ("Severity", f"{self._get_severity_icon(gap['severity'])} {gap['severity'].upper()}", severity_style),
+                ("Type", gap['gap_type'], ""),
+            ],
+            sections
+        )
 
         panel = Panel(
-            Markdown(details),
+            details,
             title=f"Gap Details",
-            border_style=self._get_severity_style(gap['severity'])
+            border_style=severity_style
         )
 
         self.console.print("\n")
@@ -105,9 +149,8 @@ class GapSelectionInterface:
         self.display_gaps(gaps)
 
         # Count by severity
-        high_count = sum(1 for g in gaps if g['severity'].lower() == 'high')
-        medium_count = sum(1 for g in gaps if g['severity'].lower() == 'medium')
-        low_count = sum(1 for g in gaps if g['severity'].lower() == 'low')
+        counts = Counter(g['severity_rank'] for g in gaps)
+        high_count, medium_count, low_count = counts[1], counts[2], counts[3]
 
         self.console.print(f"[bold]Gap Summary:[/bold] {high_count} HIGH, {medium_count} MEDIUM, {low_count} LOW\n")
 
@@ -127,7 +170,10 @@ class GapSelectionInterface:
 
         elif choice == "2":
             # Review individually
-            selected_ids = self._review_individually(gaps)
+            if len(gaps) <= REVIEW_INDIVIDUALLY_MAX_ITEMS:
+                selected_ids = self._review_individually(gaps)
+            else:
+                selected_ids = self._review_bulk(gaps)
 
         elif choice == "3":
             # Auto-select by severity
@@ -138,17 +184,14 @@ class GapSelectionInterface:
 
             severity_choice = Prompt.ask("Choose severity threshold", choices=["1", "2", "3"], default="2")
 
-            if severity_choice == "1":
-                selected_severities = ['high']
-            elif severity_choice == "2":
-                selected_severities = ['high', 'medium']
-            else:
-                selected_severities = ['high', 'medium', 'low']
+            # Choices map directly onto severity ranks (1 = HIGH only, 3 = all)
+            max_rank = int(severity_choice)
+            selected_severities = ['high', 'medium', 'low'][:max_rank]
 
             selected_ids = [
                 f"gap_{i}"
                 for i, gap in enumerate(gaps)
-                if gap['severity'].lower() in selected_severities
+                if gap['severity_rank'] <= max_rank
             ]
             self.console.print(f"\n[green]✓ Selected {len(selected_ids)} gaps ({', '.join(s.upper() for s in selected_severities)} severity)[/green]\n")
 
@@ -184,29 +227,43 @@ class GapSelectionInterface:
         self.console.print(f"\n[bold green]Selected {len(selected_ids)}/{len(gaps)} gaps[/bold green]\n")
         return selected_ids
 
+    def _review_bulk(self, gaps: List[Gap]) -> List[str]:
+        """
+        Review gaps with a single prompt for the gaps to skip.
+
+        The gap table has already been displayed by select_gaps. Gaps can be
+        given by their displayed ID (gap_3) or bare index (3).
+
+        Args:
+            gaps: List of Gap objects
+
+        Returns:
+            List of selected gap IDs
+        """
+        answer = Prompt.ask("IDs or indices to skip (comma-separated, blank=all)", default="")
+
+        skip = set()
+        for token in answer.replace(" ", "").split(","):
+            if not token:
+                continue
+            digits = token[4:] if token.lower().startswith("gap_") else token
+            index = int(digits) if digits.isdigit() else -1
+            if 0 <= index < len(gaps):
+                skip.add(index)
+            else:
+                self.console.print(f"[yellow]Ignoring unknown gap ID: {token}[/yellow]")
+
+        selected_ids = [f"gap_{i}" for i in range(len(gaps)) if i not in skip]
+        self.console.print(f"\n[bold green]Selected {len(selected_ids)}/{len(gaps)} gaps[/bold green]\n")
+        return selected_ids
+
     def _get_severity_style(self, severity: str) -> str:
         """Get color style for severity level."""
-        severity_lower = severity.lower()
-        if severity_lower == "high":
-            return "bold red"
-        elif severity_lower == "medium":
-            return "bold yellow"
-        elif severity_lower == "low":
-            return "cyan"
-        else:
-            return "dim"
+        return _SEV_STYLE.get(severity.lower(), "dim")
 
     def _get_severity_icon(self, severity: str) -> str:
         """Get icon for severity level."""
-        severity_lower = severity.lower()
-        if severity_lower == "high":
-            return "🔴"
-        elif severity_lower == "medium":
-            return "🟡"
-        elif severity_lower == "low":
-            return "🔵"
-        else:
-            return "⚪"
+        return _SEV_ICON.get(severity.lower(), "⚪")
 
 
 def interactive_gap_selection(gaps: List[Gap],
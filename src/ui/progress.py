@@ -0,0 +1,39 @@
+"""
+Streaming Progress
+
+Live console feedback while a structured Claude response streams in.
+"""
+
+from typing import Any, Dict, Optional
+from rich.console import Console
+
+console = Console()
+
+
+async def stream_structured_with_status(client, message: str, **request: Any) -> Dict[str, Any]:
+    """
+    Stream a structured response while showing a live status line.
+
+    The status shows how much of the response has arrived, so long
+    generations give feedback from the first token instead of appearing
+    to hang.
+
+    Args:
+        client: ClaudeClient to stream from
+        message: Status text, e.g. "Analyzing gaps"
+        **request: Keyword arguments for ClaudeClient.astream_structured
+
+    Returns:
+        Parsed JSON response
+
+    Raises:
+        Exception: If API call fails or response is not valid JSON
+    """
+    response: Optional[Dict[str, Any]] = None
+    with console.status(f"{message}...") as status:
+        async for event in client.astream_structured(**request):
+            if event["type"] == "progress":
+                status.update(f"{message}... {event['bytes']:,} bytes received")
+            else:
+                response = event["data"]
+    return response
@@ -5,12 +5,23 @@ Interactive interface for users to review and select recommendations.
 """
 
 from typing import List, Dict
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
-from rich.markdown import Markdown
+from rich.syntax import Syntax
+from rich.text import Text
 from ..graph.state import Recommendation
+from .details import detail_text
+
+# Lists at least this long are printed as plain fixed-width rows
+PLAIN_TABLE_MIN_ROWS = 20
+
+# Longer lists are reviewed with one bulk prompt instead of a confirm per recommendation
+REVIEW_INDIVIDUALLY_MAX_ITEMS = 5
+
+_PRIORITY_STYLE = {1: "bold red", 2: "bold yellow", 3: "cyan"}
+_PRIORITY_LABEL = {1: "Critical", 2: "Important", 3: "Suggested", 4: "Optional", 5: "Minor"}
 
 
 class SelectionInterface:
@@ -32,26 +43,55 @@ class SelectionInterface:
 
         self.console.print(f"\n[bold cyan]Generated {len(recommendations)} Recommendations:[/bold cyan]\n")
 
+        # Rich tables measure every cell; long lists use fixed-width rows
+        if len(recommendations) >= PLAIN_TABLE_MIN_ROWS:
+            self.console.print(self._recommendation_rows(recommendations), no_wrap=True, overflow="ellipsis")
+            self.console.print()
+            return
+
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("ID", style="dim", width=8)
         table.add_column("Priority", style="cyan", width=8)
         table.add_column("Category", style="yellow", width=15)
         table.add_column("Description", style="white")
 
+        add_row = table.add_row
         for rec in recommendations:
             priority_str = f"P{rec['priority']}"
             priority_style = self._get_priority_style(rec['priority'])
+            description = rec['description']
 
-            table.add_row(
+            add_row(
                 rec['recommendation_id'],
                 f"[{priority_style}]{priority_str}[/{priority_style}]",
                 rec['category'],
-                rec['description'][:60] + "..." if len(rec['description']) > 60 else rec['description']
+                description if len(description) <= 60 else description[:57] + "…"
             )
 
         self.console.print(table)
         self.console.print()
 
+    def _recommendation_rows(self, recommendations: List[Recommendation]) -> Text:
+        """
+        Render recommendations as fixed-width styled text rows instead of a Table.
+
+        Args:
+            recommendations: List of Recommendation objects
+
+        Returns:
+            Text with a header row and one row per recommendation
+        """
+        out = Text()
+        append = out.append
+        append(f"{'ID':<8} {'Priority':<8} {'Category':<15} Description\n", style="bold magenta")
+        for rec in recommendations:
+            description = rec['description']
+            append(rec['recommendation_id'][:8].ljust(8) + " ", style="dim")
+            append(f"P{rec['priority']}".ljust(8) + " ", style=self._get_priority_style(rec['priority']))
+            append(rec['category'][:15].ljust(15) + " ", style="yellow")
+            append((description if len(description) <= 60 else description[:57] + "…") + "\n")
+        return out
+
     def display_recommendation_details(self, recommendation: Recommendation):
         """
         Display detailed information about a single recommendation.
@@ -59,27 +99,31 @@ class SelectionInterface:
         Args:
             recommendation: Recommendation object
         """
-        details = f"""
-**ID:** {recommendation['recommendation_id']}
-**Priority:** {recommendation['priority']} ({self._get_priority_label(recommendation['priority'])})
-**Category:** {recommendation['category']}
-
-**Description:**
-{recommendation['description']}
-
-**Specific Action:**
-{recommendation['specific_action']}
-
-**Rationale:**
-{recommendation['rationale']}
-"""
+        priority_style = self._get_priority_style(recommendation['priority'])
+        details = detail_text(
+            [
+                ("ID", recommendation['recommendation_id'], ""),
+                ("Priority", f"{recommendation['priority']} ({self._get_priority_label(recommendation['priority'])})", priority_style),
+                ("Category", recommendation['category'], ""),
+            ],
+            [
+                ("Description", recommendation['description']),
+                ("Specific Action", recommendation['specific_action']),
+                ("Rationale", recommendation['rationale']),
+            ]
+        )
+        body = details
         if recommendation.get('latex_modification'):
-            details += f"\n**LaTeX Modification:**\n```latex\n{recommendation['latex_modification']}\n```"
+            body = Group(
+                details,
+                Text("\nLaTeX Modification:", style="bold"),
+                Syntax(recommendation['latex_modification'], "latex", theme="monokai")
+            )
 
         panel = Panel(
-            Markdown(details),
+            body,
             title=f"Recommendation Details",
-            border_style=self._get_priority_style(recommendation['priority'])
+            border_style=priority_style
         )
 
         self.console.print("\n")
@@ -131,19 +175,22 @@ class SelectionInterface:
 
         elif choice == "2":
             # Review individually
-            selected_ids = self._review_individually(recommendations)
+            if len(recommendations) <= REVIEW_INDIVIDUALLY_MAX_ITEMS:
+                selected_ids = self._review_individually(recommendations)
+            else:
+                selected_ids = self._review_bulk(recommendations)
 
         elif choice == "3":
             # Auto-select by priority
-            max_priority = Prompt.ask(
+            max_priority = int(Prompt.ask(
                 "Select recommendations with priority",
                 choices=["1", "2", "3"],
                 default="2"
-            )
+            ))
             selected_ids = [
                 r['recommendation_id']
                 for r in recommendations
-                if r['priority'] <= int(max_priority)
+                if r['priority'] <= max_priority
             ]
             self.console.print(f"\n[green]✓ Selected {len(selected_ids)} recommendations[/green]\n")
 
@@ -179,27 +226,41 @@ class SelectionInterface:
         self.console.print(f"\n[bold green]Selected {len(selected_ids)}/{len(recommendations)} recommendations[/bold green]\n")
         return selected_ids
 
+    def _review_bulk(self, recommendations: List[Recommendation]) -> List[str]:
+        """
+        Review recommendations with a single prompt for the IDs to skip.
+
+        The recommendation table has already been displayed by select_recommendations.
+
+        Args:
+            recommendations: List of Recommendation objects
+
+        Returns:
+            List of selected recommendation IDs
+        """
+        answer = Prompt.ask("IDs to skip (comma-separated, blank=all)", default="")
+
+        known_ids = {r['recommendation_id'] for r in recommendations}
+        skip = set()
+        for token in answer.replace(" ", "").split(","):
+            if not token:
+                continue
+            if token in known_ids:
+                skip.add(token)
+            else:
+                self.console.print(f"[yellow]Ignoring unknown recommendation ID: {token}[/yellow]")
+
+        selected_ids = [r['recommendation_id'] for r in recommendations if r['recommendation_id'] not in skip]
+        self.console.print(f"\n[bold green]Selected {len(selected_ids)}/{len(recommendations)} recommendations[/bold green]\n")
+        return selected_ids
+
     def _get_priority_style(self, priority: int) -> str:
         """Get color style for priority level."""
-        if priority == 1:
-            return "bold red"
-        elif priority == 2:
-            return "bold yellow"
-        elif priority == 3:
-            return "cyan"
-        else:
-            return "dim"
+        return _PRIORITY_STYLE.get(priority, "dim")
 
     def _get_priority_label(self, priority: int) -> str:
         """Get label for priority level."""
-        labels = {
-            1: "Critical",
-            2: "Important",
-            3: "Suggested",
-            4: "Optional",
-            5: "Minor"
-        }
-        return labels.get(priority, "Unknown")
+        return _PRIORITY_LABEL.get(priority, "Unknown")
 
 
 def interactive_selection(recommendations: List[Recommendation],
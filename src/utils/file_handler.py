@@ -4,8 +4,16 @@ File Handler Utilities
 Utilities for reading and writing files.
 """
 
+import mmap
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Set
+
+# Files above this size are decoded straight from a memory map
+MMAP_THRESHOLD_BYTES = 1024 * 1024
+
+# Output directories already created by write_latex_file in this process
+_created_dirs: Set[Path] = set()
 
 
 def read_latex_file(file_path: str) -> str:
@@ -24,13 +32,10 @@ def read_latex_file(file_path: str) -> str:
     """
     path = Path(file_path)
 
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
-
     if path.suffix.lower() != '.tex':
         raise ValueError(f"File must be a .tex file, got: {path.suffix}")
 
-    return path.read_text(encoding='utf-8')
+    return _read_utf8(path)
 
 
 def write_latex_file(content: str, file_path: str, overwrite: bool = False) -> Path:
@@ -50,14 +55,25 @@ def write_latex_file(content: str, file_path: str, overwrite: bool = False) -> P
     """
     path = Path(file_path)
 
-    if path.exists() and not overwrite:
-        raise FileExistsError(f"File already exists: {file_path}. Use overwrite=True to replace.")
-
     # Create parent directories if needed
-    path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Write content
-    path.write_text(content, encoding='utf-8')
+    if path.parent not in _created_dirs:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(path.parent)
+
+    # O_EXCL makes the existence check part of the open
+    flags = os.O_WRONLY | os.O_CREAT | (os.O_TRUNC if overwrite else os.O_EXCL)
+    try:
+        fd = os.open(path, flags, 0o644)
+    except FileExistsError:
+        raise FileExistsError(f"File already exists: {file_path}. Use overwrite=True to replace.") from None
+
+    # Write content, encoded once, straight to the descriptor
+    try:
+        data = memoryview(content.encode('utf-8'))
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
 
     return path
 
@@ -75,12 +91,55 @@ def read_text_file(file_path: str) -> str:
     Raises:
         FileNotFoundError: If file doesn't exist
     """
-    path = Path(file_path)
+    return _read_utf8(Path(file_path))
+
+
+def _read_utf8(path: Path) -> str:
+    """
+    Read a file as UTF-8 with a single bytes read and decode.
+
+    Skips the text-mode wrapper; line endings are normalized to LF
+    afterwards, matching read_text().
+    """
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {path}") from None
+    return _normalize_newlines(data.decode('utf-8'))
+
+
+def read_text_with_fallback(path: Path) -> str:
+    """
+    Read a text file as UTF-8, falling back to cp1252.
+
+    Line endings are normalized to LF. The file is read once; the fallback decodes the bytes already in memory.
+    Large files are decoded from a memory map to avoid holding the raw bytes
+    and the decoded text at the same time.
+
+    Args:
+        path: Path to the text file
+
+    Returns:
+        File content as string
+    """
+    with open(path, "rb") as f:
+        if path.stat().st_size > MMAP_THRESHOLD_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return _decode_with_fallback(data)
+        return _decode_with_fallback(f.read())
+
+
+def _decode_with_fallback(data) -> str:
+    """Decode a bytes-like object as UTF-8, or as cp1252 if that fails."""
+    try:
+        return _normalize_newlines(str(data, "utf-8"))
+    except UnicodeDecodeError:
+        return _normalize_newlines(str(data, "cp1252", errors="replace"))
 
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
 
-    return path.read_text(encoding='utf-8')
+def _normalize_newlines(text: str) -> str:
+    """Translate CRLF and CR line endings to LF, as text-mode reads do."""
+    return text.replace("\r\n", "\n").replace("\r", "\n")
 
 
 def ensure_output_path(input_path: str, suffix: str = "_optimized") -> Path:
@@ -0,0 +1,97 @@
+"""
+LaTeX Line Patches
+
+Applies the line-range patches returned by the LaTeX editor, so Claude only
+emits the lines it changes instead of a full, JSON-escaped copy of the resume.
+
+A patch replaces the 1-based, inclusive line range start_line..end_line with
+new_lines. Setting end_line to start_line - 1 inserts new_lines before
+start_line without replacing anything; an empty new_lines deletes the range.
+"""
+
+from operator import itemgetter
+from typing import Any, Dict, List, Tuple
+
+LinePatch = Dict[str, Any]  # {"start_line": int, "end_line": int, "new_lines": List[str], ...}
+
+
+def number_lines(text: str, content_only: bool = False) -> str:
+    """
+    Prefix each line with its 1-based line number, as referenced by patches.
+
+    Args:
+        text: LaTeX source
+        content_only: Omit blank and comment-only lines; the remaining lines
+            keep their original numbers
+
+    Returns:
+        Text with "<n>| " prepended to every (kept) line
+    """
+    return "\n".join(
+        f"{i}| {line}" for i, line in enumerate(text.split("\n"), 1)
+        if not content_only or not _is_blank_or_comment(line)
+    )
+
+
+def _is_blank_or_comment(line: str) -> bool:
+    """Whether a LaTeX line holds no content."""
+    stripped = line.lstrip()
+    return not stripped or stripped.startswith("%")
+
+
+def validate_patches(patches: List[Any], line_count: int) -> Tuple[List[LinePatch], List[str]]:
+    """
+    Normalize patches and drop malformed, out-of-range or overlapping ones.
+
+    Args:
+        patches: Patches as returned by Claude
+        line_count: Number of lines in the original source
+
+    Returns:
+        Tuple of (valid patches sorted by start_line, problem descriptions)
+    """
+    problems: List[str] = []
+    normalized: List[LinePatch] = []
+    for patch in patches:
+        try:
+            start, end = int(patch["start_line"]), int(patch["end_line"])
+            new_lines = [str(line) for line in patch.get("new_lines", [])]
+        except (KeyError, TypeError, ValueError, AttributeError):
+            problems.append(f"malformed patch {patch!r}")
+            continue
+        if not (1 <= start <= line_count + 1 and start - 1 <= end <= line_count):
+            problems.append(f"lines {start}-{end} are outside the resume (1-{line_count})")
+            continue
+        normalized.append({**patch, "start_line": start, "end_line": end, "new_lines": new_lines})
+
+    # Patches sharing a start line (e.g. an insert and a replace there) have
+    # no well-defined order, so they are rejected like overlapping ranges
+    valid: List[LinePatch] = []
+    last_start, last_end = 0, 0
+    for patch in sorted(normalized, key=itemgetter("start_line", "end_line")):
+        if patch["start_line"] <= last_end or patch["start_line"] == last_start:
+            problems.append(f"lines {patch['start_line']}-{patch['end_line']} overlap an earlier patch")
+            continue
+        valid.append(patch)
+        last_start, last_end = patch["start_line"], max(last_end, patch["end_line"])
+    return valid, problems
+
+
+def apply_patches(resume_tex: str, patches: List[LinePatch]) -> str:
+    """
+    Splice validated patches into the original source.
+
+    Patches are applied bottom-up, ordered by (start_line, end_line), so
+    earlier line numbers stay valid.
+
+    Args:
+        resume_tex: Original LaTeX source
+        patches: Patches from validate_patches
+
+    Returns:
+        Patched LaTeX source
+    """
+    lines = resume_tex.split("\n")
+    for patch in sorted(patches, key=itemgetter("start_line", "end_line"), reverse=True):
+        lines[patch["start_line"] - 1:patch["end_line"]] = patch["new_lines"]
+    return "\n".join(lines)
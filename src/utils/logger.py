@@ -4,9 +4,14 @@ Logging Utilities
 Simple logging configuration for the application.
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable, Dict
 
 
 def setup_logger(name: str, level: str) -> logging.Logger:
@@ -39,6 +44,64 @@ def setup_logger(name: str, level: str) -> logging.Logger:
     return logger
 
 
+def setup_queue_logger(name: str, level: str, fmt: str = "%(message)s") -> logging.Logger:
+    """
+    Set up a logger whose records are written to the console by a background thread.
+
+    Emitting only enqueues the record, so concurrently running nodes never
+    wait on the console stream. The listener is stopped (and the queue
+    flushed) at interpreter exit. Call this once, from the entry point.
+
+    Args:
+        name: Logger name
+        level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        fmt: Format string for console output
+
+    Returns:
+        Configured logger
+    """
+    logger = logging.getLogger(name)
+    logger.setLevel(getattr(logging, level.upper()))
+
+    if not any(isinstance(h, logging.handlers.QueueHandler) for h in logger.handlers):
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(fmt))
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, handler)
+        listener.start()
+        atexit.register(listener.stop)
+
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    return logger
+
+
+@lru_cache(maxsize=1)
+def _workflow_log_functions() -> Dict[str, Callable[..., None]]:
+    """
+    Get the workflow logger's methods keyed by lowercase level name.
+
+    The logger is configured on first use rather than at import, so a queue
+    logger set up by the entry point is reused instead of gaining a second
+    console handler.
+
+    Returns:
+        Mapping of level name to bound logging method
+    """
+    logger = setup_logger(
+        name="resume_optimizer",
+        level=os.getenv("LOG_LEVEL", "INFO")
+    )
+    return {
+        "debug": logger.debug,
+        "info": logger.info,
+        "warning": logger.warning,
+        "error": logger.error,
+        "critical": logger.critical,
+    }
+
+
 def log_workflow_step(agent_name: str, message: str, level: str):
     """
     Log a workflow step.
@@ -48,9 +111,5 @@ def log_workflow_step(agent_name: str, message: str, level: str):
         message: Log message
         level: Log level
     """
-    logger = setup_logger(
-        name="resume_optimizer",
-        level=os.getenv("LOG_LEVEL", "INFO")
-    )
-    log_func = getattr(logger, level.lower())
-    log_func(f"[{agent_name}] {message}")
+    # Formatting is deferred until the logger knows the record is enabled
+    _workflow_log_functions()[level.lower()]("[%s] %s", agent_name, message)
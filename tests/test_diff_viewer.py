@@ -0,0 +1,33 @@
+"""Tests for diff rendering."""
+
+from src.ui.diff_viewer import _patch_hunks, unified_line_diff
+from src.utils.latex_patch import apply_patches
+
+ORIGINAL = "\n".join(f"l{i}" for i in range(1, 13))
+
+
+def _hunks_match_unified_diff(patches, context_lines=3):
+    modified = apply_patches(ORIGINAL, patches)
+    expected = list(unified_line_diff(ORIGINAL.split("\n"), modified.split("\n"), n=context_lines))[2:]
+    assert list(_patch_hunks(ORIGINAL.split("\n"), patches, context_lines)) == expected
+
+
+def test_nearby_patches_share_one_hunk():
+    _hunks_match_unified_diff([
+        {"start_line": 5, "end_line": 5, "new_lines": ["L5"]},
+        {"start_line": 7, "end_line": 7, "new_lines": ["L7", "L7b"]},
+    ])
+
+
+def test_distant_patches_get_separate_hunks():
+    _hunks_match_unified_diff([
+        {"start_line": 1, "end_line": 1, "new_lines": ["L1"]},
+        {"start_line": 12, "end_line": 12, "new_lines": []},
+    ])
+
+
+def test_insert_and_delete_hunks():
+    _hunks_match_unified_diff([
+        {"start_line": 3, "end_line": 2, "new_lines": ["INS"]},
+        {"start_line": 9, "end_line": 10, "new_lines": []},
+    ], context_lines=1)
@@ -0,0 +1,39 @@
+"""Tests for LaTeX line patches."""
+
+from src.utils.latex_patch import apply_patches, validate_patches
+
+RESUME = "a\nb\nc\nd"
+
+
+def test_insert_and_replace_at_same_start_apply_replace_first():
+    patches = [
+        {"start_line": 2, "end_line": 1, "new_lines": ["INS"]},
+        {"start_line": 2, "end_line": 3, "new_lines": ["B2", "C2"]},
+    ]
+    assert apply_patches(RESUME, patches) == "a\nINS\nB2\nC2\nd"
+
+
+def test_validate_rejects_insert_and_replace_at_same_start():
+    valid, problems = validate_patches(
+        [
+            {"start_line": 2, "end_line": 1, "new_lines": ["INS"]},
+            {"start_line": 2, "end_line": 3, "new_lines": ["B2", "C2"]},
+        ],
+        4,
+    )
+    assert len(valid) == 1
+    assert len(problems) == 1
+
+
+def test_validate_rejects_overlapping_ranges():
+    valid, problems = validate_patches(
+        [
+            {"start_line": 1, "end_line": 2, "new_lines": ["X"]},
+            {"start_line": 2, "end_line": 3, "new_lines": ["Y"]},
+            {"start_line": 4, "end_line": 4, "new_lines": ["Z"]},
+        ],
+        4,
+    )
+    assert [p["start_line"] for p in valid] == [1, 4]
+    assert len(problems) == 1
+    assert apply_patches(RESUME, valid) == "X\nc\nZ"
@@ -0,0 +1,19 @@
+"""Tests for local similarity scoring."""
+
+from src.nlp.similarity import similarity_score
+
+
+def test_identical_texts_score_100():
+    text = "Built Spark pipelines in Python on AWS"
+    assert abs(similarity_score(text, text) - 100) < 1e-9
+
+
+def test_disjoint_texts_score_0():
+    assert similarity_score("Python Spark AWS", "carpentry plumbing welding") == 0
+
+
+def test_shared_terms_raise_the_score():
+    job = "Python Spark Kafka AWS data pipelines"
+    matching = similarity_score("Built data pipelines with Python Spark Kafka on AWS", job)
+    partial = similarity_score("Built web pages with React and CSS, some Python", job)
+    assert matching > partial > 0